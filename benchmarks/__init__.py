@@ -0,0 +1,4 @@
+"""Reproducible benchmarks for the scheduling, plugin dispatch and parsing hot paths of pipeline-flow.
+
+Run every scenario with `python -m benchmarks`, or a subset with `python -m benchmarks --scenario <name>`.
+"""
@@ -0,0 +1,87 @@
+# Standard Imports
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Self
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin, IMergeExtractPlugin, ITransformPlugin
+from pipeline_flow.plugins.load.sqlalchemy_query_async import AsyncSQLAlchemyQueryLoader
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# Plugins registered here are only used by the benchmarks. They do as little work as possible,
+# so that the measurements are dominated by the framework overhead.
+
+
+class NoopExtractor(IExtractPlugin, plugin_name="benchmark_noop_extractor"):
+    def __init__(self: Self, plugin_id: str, rows: int = 1) -> None:
+        super().__init__(plugin_id)
+        self.data = [{"id": i} for i in range(rows)]
+
+    async def __call__(self: Self) -> list[dict[str, Any]]:
+        return self.data
+
+
+class NoopTransform(ITransformPlugin, plugin_name="benchmark_noop_transform"):
+    def __call__(self: Self, data: Any) -> Any:  # noqa: ANN401
+        return data
+
+
+class NoopLoader(ILoadPlugin, plugin_name="benchmark_noop_loader"):
+    async def __call__(self: Self, data: Any) -> None:  # noqa: ANN401
+        pass
+
+
+class ConcatMerge(IMergeExtractPlugin, plugin_name="benchmark_concat_merge"):
+    """Concatenates the lists extracted by every step, in the order of the steps."""
+
+    def __call__(self: Self, extracted_data: dict[str, list]) -> list:
+        return [row for rows in extracted_data.values() for row in rows]
+
+
+class DataFrameExtractor(IExtractPlugin, plugin_name="benchmark_dataframe_extractor"):
+    """Returns a DataFrame of `rows` rows, built once when the plugin is created."""
+
+    def __init__(self: Self, plugin_id: str, rows: int) -> None:
+        super().__init__(plugin_id)
+        import pandas as pd  # noqa: PLC0415
+
+        self.data = pd.DataFrame({"id": range(rows), "amount": [float(i % 1000) for i in range(rows)]})
+
+    async def __call__(self: Self) -> DataFrame:
+        return self.data
+
+
+class DataFrameTransform(ITransformPlugin, plugin_name="benchmark_dataframe_transform"):
+    """A CPU-bound transformation: derives two columns and filters the rows."""
+
+    def __call__(self: Self, data: DataFrame) -> DataFrame:
+        data = data.assign(tax=data["amount"] * 0.2, bucket=data["id"] % 16)
+        return data[data["amount"] > 10]  # noqa: PLR2004
+
+
+class SQLiteBulkLoader(AsyncSQLAlchemyQueryLoader, plugin_name="benchmark_sqlite_bulk_loader"):
+    """The `bulk` mode of `sqlalchemy_query_loader`, writing into a local SQLite file through aiosqlite.
+
+    SQLite URLs cannot contain credentials or a host, so the connection string is built from `db_name` only.
+    """
+
+    def __init__(self: Self, plugin_id: str, db_name: str, table: str, batch_size: int = 10000) -> None:
+        super().__init__(
+            plugin_id,
+            db_user="",
+            db_password="",
+            db_host="",
+            db_port="",
+            db_name=db_name,
+            driver="sqlite+aiosqlite",
+            mode="bulk",
+            table=table,
+            batch_size=batch_size,
+            concurrency_limit=1,  # SQLite allows a single writer at a time.
+        )
+
+    def _build_connection_string(self: Self) -> str:
+        return f"{self._driver}:///{self.db_name}"
@@ -0,0 +1,160 @@
+"""Runs the benchmark scenarios and reports their latency and throughput, optionally as a JSON report.
+
+Every scenario runs its warm-up iterations first, then the measured ones, on the local stub servers and plugins.
+"""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import TYPE_CHECKING, Any
+
+# Project Imports
+from benchmarks.scenarios import SCENARIOS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from benchmarks.scenarios import Scenario
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    unit: str
+    size: int
+    repeat: int
+    operations: int
+    wall_times: list[float]
+    cpu_times: list[float]
+
+    @property
+    def median_wall_time(self) -> float:
+        return statistics.median(self.wall_times)
+
+    def summary(self) -> dict[str, Any]:
+        """Returns the raw samples together with the derived latency and throughput figures."""
+        median = self.median_wall_time
+        return {
+            **asdict(self),
+            "wall_time": {
+                "min": min(self.wall_times),
+                "median": median,
+                "mean": statistics.fmean(self.wall_times),
+                "max": max(self.wall_times),
+                "stdev": statistics.stdev(self.wall_times) if len(self.wall_times) > 1 else 0.0,
+            },
+            "cpu_time_median": statistics.median(self.cpu_times),
+            "throughput": self.operations / median if median else None,
+            "latency_per_operation": median / self.operations if self.operations else None,
+        }
+
+
+async def run_scenario(scenario: Scenario, size: int, repeat: int, warmup: int) -> BenchmarkResult:
+    """Runs the warm-up iterations, then measures `repeat` iterations of the scenario."""
+    wall_times, cpu_times = [], []
+    operations = 0
+
+    async with scenario.setup(size) as body:
+        for _ in range(warmup):
+            await body()
+
+        for _ in range(repeat):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            operations = await body()
+            wall_times.append(time.perf_counter() - wall_start)
+            cpu_times.append(time.process_time() - cpu_start)
+
+    return BenchmarkResult(scenario.name, scenario.unit, size, repeat, operations, wall_times, cpu_times)
+
+
+def environment() -> dict[str, Any]:
+    """Describes the machine and versions the results were measured with."""
+    try:
+        version = metadata.version("pipeline-flow")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "pipeline_flow_version": version,
+        "python_version": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run, can be repeated. Defaults to every scenario.",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Measured iterations per scenario.")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Unmeasured iterations per scenario.")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplies the default size of every scenario, e.g. 0.1."
+    )
+    parser.add_argument("-o", "--output", help="Writes the JSON report to this file instead of stdout.")
+    parser.add_argument("-l", "--list", action="store_true", help="Lists the scenarios and exits.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<28}{scenario.description}")  # noqa: T201
+        return 0
+
+    # Plugin dispatch logs at INFO level, which would otherwise be part of the measurements.
+    logging.disable(logging.INFO)
+
+    results = []
+    try:
+        for name in args.scenario or SCENARIOS:
+            scenario = SCENARIOS[name]
+            if missing := scenario.missing_requirements():
+                print(f"{name:<28}skipped, missing {', '.join(missing)}", file=sys.stderr)  # noqa: T201
+                continue
+
+            size = max(1, int(scenario.default_size * args.scale))
+
+            result = asyncio.run(run_scenario(scenario, size, args.repeat, args.warmup))
+            results.append(result.summary())
+
+            print(  # noqa: T201
+                f"{name:<28}{result.median_wall_time * 1000:>12.2f} ms"
+                f"{result.operations / result.median_wall_time:>14.0f} {scenario.unit}/s",
+                file=sys.stderr,
+            )
+    finally:
+        logging.disable(logging.NOTSET)
+
+    report = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:  # noqa: PTH123
+            file.write(report)
+    else:
+        print(report)  # noqa: T201
+
+    return 0
@@ -0,0 +1,300 @@
+# Standard Imports
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Third Party Imports
+# Project Imports
+import benchmarks.plugins  # noqa: F401 - Registers the benchmark plugins.
+import pipeline_flow.plugins.extract  # noqa: F401 - Registers `rest_api_extractor`.
+from benchmarks.stubs import local_http_server
+from pipeline_flow.common.utils import run_shutdown_hooks
+from pipeline_flow.core.models.phases import TransformExecutorType
+from pipeline_flow.core.models.pipeline import SchedulingMode
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers import YamlParser, parse_pipelines
+from pipeline_flow.core.spill import SpillFormat
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from pipeline_flow.core.models.pipeline import Pipeline
+
+# A benchmark body runs one iteration and returns the number of operations it processed,
+# e.g. pipelines, rows or plugins, which is used to derive the throughput.
+type BenchmarkBody = Callable[[], Awaitable[int]]
+
+
+@dataclass(frozen=True)
+class OrchestratorConfig:
+    """Stands in for `YamlConfig`, which is a singleton and cannot vary between scenarios."""
+
+    concurrency: int = 16
+    transform_executor: TransformExecutorType = TransformExecutorType.THREAD
+    transform_workers: int | None = None
+    plugin_workers: int | None = None
+    state_store: dict[str, Any] | None = None
+    journal: dict[str, Any] | None = None
+    memory_budget: int | None = None
+    spill_dir: str | None = None
+    spill_format: SpillFormat = SpillFormat.ARROW
+    admission: dict[str, Any] | None = None
+    scheduling: SchedulingMode = SchedulingMode.FIFO
+    run_history: dict[str, Any] | None = None
+    resource_pools: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    unit: str
+    default_size: int
+    setup: Callable[[int], AsyncIterator[BenchmarkBody]]
+    # Optional packages the scenario needs, it is skipped when any of them is missing.
+    requires: tuple[str, ...] = ()
+
+    def missing_requirements(self) -> list[str]:
+        return [module for module in self.requires if importlib.util.find_spec(module) is None]
+
+
+def _step(plugin: str, plugin_id: str, **args: Any) -> dict[str, Any]:  # noqa: ANN401
+    step = {"id": plugin_id, "plugin": plugin}
+    if args:
+        step["args"] = args
+    return step
+
+
+def _noop_pipeline(name: str, needs: str | None = None) -> dict[str, Any]:
+    pipeline = {
+        "type": "ETL",
+        "phases": {
+            "extract": {"steps": [_step("benchmark_noop_extractor", f"{name}_extract")]},
+            "transform": {"steps": [_step("benchmark_noop_transform", f"{name}_transform")]},
+            "load": {"steps": [_step("benchmark_noop_loader", f"{name}_load")]},
+        },
+    }
+    if needs:
+        pipeline["needs"] = needs
+    return pipeline
+
+
+def _orchestrate(pipelines: list[Pipeline], config: OrchestratorConfig | None = None) -> BenchmarkBody:
+    async def body() -> int:
+        orchestrator = PipelineOrchestrator(config or OrchestratorConfig())
+        return len(await orchestrator.execute_pipelines(pipelines))
+
+    return body
+
+
+@asynccontextmanager
+async def tiny_pipelines(size: int) -> AsyncIterator[BenchmarkBody]:
+    pipelines = parse_pipelines({f"pipeline_{i}": _noop_pipeline(f"pipeline_{i}") for i in range(size)})
+    yield _orchestrate(pipelines)
+
+
+@asynccontextmanager
+async def deep_needs_chain(size: int) -> AsyncIterator[BenchmarkBody]:
+    pipelines = parse_pipelines(
+        {
+            f"pipeline_{i}": _noop_pipeline(f"pipeline_{i}", needs=f"pipeline_{i - 1}" if i else None)
+            for i in range(size)
+        }
+    )
+    yield _orchestrate(pipelines)
+
+
+@asynccontextmanager
+async def wide_extract_fanout(size: int) -> AsyncIterator[BenchmarkBody]:
+    pages = 5
+
+    with local_http_server(pages=pages, rows_per_page=50) as server:
+        extract_steps = [
+            _step(
+                "rest_api_extractor",
+                f"source_{i}",
+                base_url=server.base_url,
+                endpoint=f"source_{i}",
+                headers={"Authorization": "Bearer benchmark"},
+            )
+            for i in range(size)
+        ]
+        pipeline = {
+            "type": "ETL",
+            "phases": {
+                "extract": {"steps": extract_steps, "merge": _step("benchmark_concat_merge", "merge")},
+                "transform": {"steps": [_step("benchmark_noop_transform", "transform")]},
+                "load": {"steps": [_step("benchmark_noop_loader", "load")]},
+            },
+        }
+        pipelines = parse_pipelines({"fanout": pipeline})
+        run_pipelines = _orchestrate(pipelines)
+
+        async def body() -> int:
+            await run_pipelines()
+            return size * pages
+
+        try:
+            yield body
+        finally:
+            await run_shutdown_hooks()
+
+
+@asynccontextmanager
+async def large_dataframe_transform(size: int) -> AsyncIterator[BenchmarkBody]:
+    pipeline = {
+        "type": "ETL",
+        "phases": {
+            "extract": {"steps": [_step("benchmark_dataframe_extractor", "extract", rows=size)]},
+            "transform": {"chunks": 4, "steps": [_step("benchmark_dataframe_transform", "transform")]},
+            "load": {"steps": [_step("benchmark_noop_loader", "load")]},
+        },
+    }
+    run_pipelines = _orchestrate(parse_pipelines({"dataframe": pipeline}))
+
+    async def body() -> int:
+        await run_pipelines()
+        return size
+
+    yield body
+
+
+def generate_yaml(plugins: int, plugins_per_pipeline: int = 100) -> str:
+    """Generates a YAML document with `plugins` transform steps spread over ETL pipelines.
+
+    Each plugin references a variable, so the placeholder substitution is measured as well.
+    """
+    lines = ["variables:", "  multiplier: 2", "---", "pipelines:"]
+
+    for pipeline_index in range(-(-plugins // plugins_per_pipeline)):
+        name = f"pipeline_{pipeline_index}"
+        lines += [
+            f"  {name}:",
+            "    type: ETL",
+            "    phases:",
+            "      extract:",
+            "        steps:",
+            f"          - id: {name}_extract",
+            "            plugin: benchmark_noop_extractor",
+            "            args:",
+            "              rows: ${{ variables.multiplier }}",
+            "      transform:",
+            "        steps:",
+        ]
+        first = pipeline_index * plugins_per_pipeline
+        for plugin_index in range(first, min(plugins, first + plugins_per_pipeline)):
+            lines += [f"          - id: transform_{plugin_index}", "            plugin: benchmark_noop_transform"]
+        lines += [
+            "      load:",
+            "        steps:",
+            f"          - id: {name}_load",
+            "            plugin: benchmark_noop_loader",
+        ]
+
+    return "\n".join(lines) + "\n"
+
+
+@asynccontextmanager
+async def yaml_many_plugins(size: int) -> AsyncIterator[BenchmarkBody]:
+    document = generate_yaml(size)
+
+    async def body() -> int:
+        parse_pipelines(YamlParser(document).pipelines)
+        return size
+
+    yield body
+
+
+@asynccontextmanager
+async def sqlite_bulk_load(size: int) -> AsyncIterator[BenchmarkBody]:
+    import pandas as pd  # noqa: PLC0415
+    from sqlalchemy import text  # noqa: PLC0415
+    from sqlalchemy.ext.asyncio import create_async_engine  # noqa: PLC0415
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        db_path = Path(scratch_dir) / "benchmark.db"
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE TABLE target (id INTEGER, name TEXT, amount REAL)"))
+        await engine.dispose()
+
+        data = pd.DataFrame({"id": range(size), "name": [f"name_{i}" for i in range(size)], "amount": 1.5})
+        pipeline = {
+            "type": "ETL",
+            "phases": {
+                "extract": {"steps": [_step("benchmark_noop_extractor", "extract")]},
+                "transform": {"steps": [_step("benchmark_noop_transform", "transform")]},
+                "load": {
+                    "steps": [_step("benchmark_sqlite_bulk_loader", "load", db_name=str(db_path), table="target")]
+                },
+            },
+        }
+        pipelines = parse_pipelines({"sqlite": pipeline})
+        pipelines[0].extract.steps[0].data = data
+        run_pipelines = _orchestrate(pipelines)
+
+        async def body() -> int:
+            await run_pipelines()
+            return size
+
+        try:
+            yield body
+        finally:
+            await run_shutdown_hooks()
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario(
+            "tiny_pipelines",
+            "Independent ETL pipelines made of no-op plugins, measuring scheduling and dispatch overhead.",
+            "pipelines",
+            1000,
+            tiny_pipelines,
+        ),
+        Scenario(
+            "deep_needs_chain",
+            "A chain of no-op pipelines where each one `needs` the previous one.",
+            "pipelines",
+            500,
+            deep_needs_chain,
+        ),
+        Scenario(
+            "wide_extract_fanout",
+            "A single pipeline with many `rest_api_extractor` steps against an in-process HTTP server.",
+            "requests",
+            100,
+            wide_extract_fanout,
+        ),
+        Scenario(
+            "large_dataframe_transform",
+            "A chunked pandas transformation of a large DataFrame.",
+            "rows",
+            1_000_000,
+            large_dataframe_transform,
+            requires=("pandas",),
+        ),
+        Scenario(
+            "yaml_many_plugins",
+            "Parsing a YAML document with thousands of plugin steps into pipelines.",
+            "plugins",
+            2000,
+            yaml_many_plugins,
+        ),
+        Scenario(
+            "sqlite_bulk_load",
+            "The `bulk` mode of `sqlalchemy_query_loader` writing into SQLite through aiosqlite.",
+            "rows",
+            100_000,
+            sqlite_bulk_load,
+            requires=("pandas", "aiosqlite"),
+        ),
+    ]
+}
@@ -0,0 +1,76 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import threading
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Self
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class _PaginatedHandler(BaseHTTPRequestHandler):
+    """Serves `GET /<resource>?page=N` with the response layout of the `page_based_pagination` handler."""
+
+    # Keeps connections alive, like a production API would.
+    protocol_version = "HTTP/1.1"
+    server: LocalHttpServer
+
+    def do_GET(self: Self) -> None:
+        url = urlsplit(self.path)
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        has_more = page < self.server.pages
+
+        body = json.dumps(
+            {
+                "data": [{"page": page, "row": row} for row in range(self.server.rows_per_page)],
+                "pagination": {
+                    "has_more": has_more,
+                    "next_page": f"{self.server.base_url}{url.path}?page={page + 1}" if has_more else None,
+                },
+            }
+        ).encode()
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self: Self, format: str, *args: object) -> None:  # noqa: A002
+        # Silences the access log, which would otherwise dominate the measurements.
+        pass
+
+
+class LocalHttpServer(ThreadingHTTPServer):
+    """An in-process JSON API, used in place of a remote REST API."""
+
+    daemon_threads = True
+
+    def __init__(self: Self, pages: int = 1, rows_per_page: int = 10) -> None:
+        super().__init__(("127.0.0.1", 0), _PaginatedHandler)
+        self.pages = pages
+        self.rows_per_page = rows_per_page
+
+    @property
+    def base_url(self: Self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+@contextmanager
+def local_http_server(pages: int = 1, rows_per_page: int = 10) -> Generator[LocalHttpServer]:
+    """Runs a `LocalHttpServer` on a random port in a background thread."""
+    server = LocalHttpServer(pages=pages, rows_per_page=rows_per_page)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,32 @@
+"""Runs the pipelines of a YAML configuration file."""
+
+# Standard Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Project Imports
+from pipeline_flow.entrypoint import start_orchestration
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m pipeline_flow", description=__doc__)
+    parser.add_argument("config", type=Path, help="The YAML configuration file.")
+    parser.add_argument("--resume", metavar="RUN_ID", help="Resumes a failed run, requires the `journal` section.")
+    parser.add_argument("--cache-dir", help="Caches the parsed configuration in this directory.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    asyncio.run(start_orchestration(args.config.read_text(encoding="utf-8"), args.cache_dir, args.resume))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # Standard Imports
 from __future__ import annotations
 
+from enum import StrEnum, unique
 from io import TextIOWrapper
 from typing import Annotated, Any, TypedDict
 
@@ -13,6 +14,19 @@ type TransformedData = Any
 type UnifiedExtractData = ExtractedData | ExtractMergedData
 type ETLData = UnifiedExtractData | TransformedData
 
+# A `pyarrow.Table` or `pyarrow.RecordBatch`. PyArrow is an optional dependency, hence the alias to `Any`.
+type ColumnarData = Any
+type RowData = list[dict[str, Any]]
+
+
+@unique
+class DataFormat(StrEnum):
+    """The data format a plugin expects to receive from the previous phase."""
+
+    NATIVE = "native"  # Whatever the previous phase produced, passed through as is.
+    COLUMNAR = "columnar"  # A `pyarrow.Table` or `pyarrow.RecordBatch`.
+    ROWS = "rows"  # A list of dictionaries, one per row.
+
 
 type PluginName = str
 type StreamType = str | bytes | TextIOWrapper
@@ -1,9 +1,12 @@
-from .helpers import SingletonMeta, async_time_it, sync_time_it
+from .helpers import SingletonMeta, is_private_path, load_module_from_file
 from .logger import setup_logger
+from .shutdown import register_shutdown_hook, run_shutdown_hooks
 
 __all__ = [
     "SingletonMeta",
-    "async_time_it",
+    "is_private_path",
+    "load_module_from_file",
+    "register_shutdown_hook",
+    "run_shutdown_hooks",
     "setup_logger",
-    "sync_time_it",
 ]
@@ -0,0 +1,92 @@
+# Standard Imports
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.type_def import DataFormat
+
+if TYPE_CHECKING:
+    from pipeline_flow.common.type_def import ColumnarData, ETLData, RowData
+
+
+def _import_pyarrow() -> Any:  # noqa: ANN401
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError as e:
+        msg = "Columnar data and spilling require `pyarrow`, install it with `pip install pipeline-flow[columnar]`."
+        raise ImportError(msg) from e
+
+    return pa
+
+
+def is_columnar(data: ETLData) -> bool:
+    """Checks whether the data is a `pyarrow.Table` or `pyarrow.RecordBatch`.
+
+    PyArrow is never imported by this check, if nothing has imported it yet the data cannot be columnar.
+    """
+    pa = sys.modules.get("pyarrow")
+    if pa is None:
+        return False
+
+    return isinstance(data, pa.Table | pa.RecordBatch)
+
+
+def is_dataframe(data: ETLData) -> bool:
+    """Checks whether the data is DataFrame-like, without importing pandas."""
+    return hasattr(data, "iloc") and hasattr(data, "columns")
+
+
+def to_columnar(data: ETLData) -> ColumnarData:
+    """Converts a DataFrame, a list of row dictionaries or a dictionary of columns into a `pyarrow.Table`.
+
+    Columnar data is returned as is, without a copy.
+
+    Raises:
+        TypeError: If the data type cannot be converted.
+    """
+    if is_columnar(data):
+        return data
+
+    pa = _import_pyarrow()
+
+    if is_dataframe(data):
+        return pa.Table.from_pandas(data, preserve_index=False)
+    if isinstance(data, list):
+        return pa.Table.from_pylist(data)
+    if isinstance(data, dict):
+        return pa.table(data)
+
+    msg = f"Data of type `{type(data).__name__}` cannot be converted to columnar data."
+    raise TypeError(msg)
+
+
+def to_rows(data: ETLData) -> RowData:
+    """Converts columnar data or a DataFrame into a list of row dictionaries.
+
+    Lists are returned as is.
+
+    Raises:
+        TypeError: If the data type cannot be converted.
+    """
+    if isinstance(data, list):
+        return data
+    if is_columnar(data):
+        return data.to_pylist()
+    if is_dataframe(data):
+        return data.to_dict("records")
+
+    msg = f"Data of type `{type(data).__name__}` cannot be converted to rows."
+    raise TypeError(msg)
+
+
+def convert_data(data: ETLData, data_format: DataFormat) -> ETLData:
+    """Converts the data into the format a plugin declared through its `input_format`."""
+    if data_format == DataFormat.COLUMNAR:
+        return to_columnar(data)
+    if data_format == DataFormat.ROWS:
+        return to_rows(data)
+
+    return data
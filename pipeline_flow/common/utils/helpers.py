@@ -1,11 +1,12 @@
 # Standard Imports
 from __future__ import annotations
 
-import asyncio
+import importlib.util
 import logging
+import os
+import stat
+import sys
 import threading
-import time
-from functools import wraps
 from typing import TYPE_CHECKING, Any, ClassVar
 
 # Project Imports
@@ -15,45 +16,8 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 # Type Imports
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
-
-
-def async_time_it[**P, R](func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
-    @wraps(func)
-    async def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-        """Wrapper for asynchronous functions."""
-        start = asyncio.get_running_loop().time()
-        try:
-            result = await func(*args, **kwargs)
-        except Exception:
-            logging.error("Error occurred while executing %s: %s")
-            raise
-        finally:
-            total_time = asyncio.get_running_loop().time() - start
-            msg = f"Time taken to execute {func.__name__} is {total_time:.4f} seconds"
-            logging.info(msg)
-        return result
-
-    return inner
-
-
-def sync_time_it[**P, R](func: Callable[P, R]) -> Callable[P, R]:
-    @wraps(func)
-    def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-        """Wrapper for synchronous functions."""
-        start = time.time()
-        try:
-            result = func(*args, **kwargs)
-        except Exception:
-            logging.error("Error occurred while executing %s: %s")
-            raise
-        finally:
-            total_time = time.time() - start
-            msg = f"Time taken to execute {func.__name__} is {total_time:.4f} seconds"
-            logging.info(msg)
-        return result
-
-    return inner
+    from pathlib import Path
+    from types import ModuleType
 
 
 class SingletonMeta[T](type):
@@ -67,3 +31,58 @@ class SingletonMeta[T](type):
                 instance = super().__call__(*args, **kwargs)
                 cls._instances[cls] = instance
         return cls._instances[cls]
+
+
+def is_private_path(path: Path) -> bool:
+    """Checks that a file and its directory are owned by the current user and not writable by anyone else.
+
+    Files that are loaded back as code or configuration, e.g. with `pickle`, must pass this check, as anyone able
+    to write them could otherwise run arbitrary code. Platforms without POSIX ownership always pass.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+
+    try:
+        stats = (path.stat(), path.parent.stat())
+    except OSError:
+        return False
+
+    return all(info.st_uid == os.getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) for info in stats)
+
+
+def load_module_from_file(module_file: str) -> ModuleType:
+    """Executes a Python file as a module named after its path, e.g. `plugins/custom.py` as `plugins.custom`.
+
+    Raises:
+        ImportError: If no module spec can be created for the file.
+    """
+    # Get the module name from the file and remove .py extension
+    if module_file.startswith("/"):
+        fq_module_name = module_file.replace(os.sep, ".")[1:-3]
+    else:
+        fq_module_name = module_file.replace(os.sep, ".")[:-3]
+
+    # Check if the module is already loaded to avoid re-importing
+    if fq_module_name in sys.modules:
+        logging.debug("Module %s has been re-loaded.", fq_module_name)
+        return sys.modules[fq_module_name]
+
+    try:
+        logging.debug("Loading module %s", fq_module_name)
+        spec = importlib.util.spec_from_file_location(fq_module_name, module_file)
+
+        if not spec:
+            raise ImportError(  # noqa: TRY301
+                "The Spec based on following file location is empty: %s and %s plugin.", fq_module_name, module_file
+            )
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)  # type: ignore[reportOptionalMemberAccess]
+        logging.info("Loaded plugin from %s as %s", module_file, fq_module_name)
+
+    except ImportError:
+        msg = f"Error importing plugin from `{fq_module_name}` module,"
+        logging.error(msg)
+        raise
+
+    return module
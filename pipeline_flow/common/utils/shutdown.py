@@ -0,0 +1,41 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+# Third-party imports
+
+# Project Imports
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+type ShutdownHook = Callable[[], Awaitable[None] | None]
+
+_shutdown_hooks: list[ShutdownHook] = []
+
+
+def register_shutdown_hook(hook: ShutdownHook) -> None:
+    """Registers a callback that releases process-wide resources when orchestration ends.
+
+    Registering the same hook more than once has no effect.
+    """
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
+async def run_shutdown_hooks() -> None:
+    """Runs the registered hooks in reverse order of registration.
+
+    A failing hook is logged and does not prevent the remaining hooks from running.
+    """
+    while _shutdown_hooks:
+        hook = _shutdown_hooks.pop()
+        try:
+            result = hook()
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:
+            logging.exception("Shutdown hook `%s` failed.", getattr(hook, "__qualname__", hook))
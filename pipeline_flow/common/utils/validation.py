@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import TYPE_CHECKING
 
 # Project Imports
@@ -10,6 +11,13 @@ from pipeline_flow.core.registry import PluginRegistry
 if TYPE_CHECKING:
     from pipeline_flow.plugins import IPlugin
 
+BYTE_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]i?b|b)?\s*$", re.IGNORECASE)
+BYTE_SIZE_UNITS = {"b": 1, "kb": 10**3, "mb": 10**6, "gb": 10**9, "tb": 10**12}
+BYTE_SIZE_UNITS.update({"kib": 2**10, "mib": 2**20, "gib": 2**30, "tib": 2**40})
+
+RATE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:/\s*([a-z]+))?\s*$", re.IGNORECASE)
+RATE_PERIODS = {"s": 1, "sec": 1, "second": 1, "m": 60, "min": 60, "minute": 60, "h": 3600, "hour": 3600}
+
 
 def serialize_plugin(value: dict) -> IPlugin:
     return PluginRegistry.instantiate_plugin(value)
@@ -33,3 +41,39 @@ def unique_id_validator(steps: list[IPlugin]) -> list[IPlugin]:
         ids[step.id] = 1
 
     return steps
+
+
+def parse_byte_size(value: int | str | None) -> int | None:
+    """Parses a size in bytes, either a number or a string with a unit, e.g. `512MB` or `2GiB`.
+
+    Raises:
+        ValueError: If the string is not a valid size.
+    """
+    if value is None or isinstance(value, int):
+        return value
+
+    match = BYTE_SIZE_PATTERN.match(value)
+    if match is None:
+        msg = f"Invalid size `{value}`. Expected a number of bytes or a size with a unit, e.g. `512MB`."
+        raise ValueError(msg)
+
+    number, unit = match.groups()
+    return int(float(number) * BYTE_SIZE_UNITS[(unit or "b").lower()])
+
+
+def parse_rate(value: float | str | None) -> float | None:
+    """Parses a rate into a number per second, either a number or a string with a period, e.g. `50/s` or `600/min`.
+
+    Raises:
+        ValueError: If the string is not a valid rate.
+    """
+    if value is None or isinstance(value, int | float):
+        return value
+
+    match = RATE_PATTERN.match(value)
+    if match is None or (match.group(2) or "s").lower() not in RATE_PERIODS:
+        msg = f"Invalid rate `{value}`. Expected a number per second or a rate with a period, e.g. `50/s`."
+        raise ValueError(msg)
+
+    number, period = match.groups()
+    return float(number) / RATE_PERIODS[(period or "s").lower()]
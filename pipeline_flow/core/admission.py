@@ -0,0 +1,149 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils.validation import parse_byte_size
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pipeline_flow.core.models.pipeline import Pipeline
+    from pipeline_flow.core.run_history import PipelineProfile
+
+# The footprint of a pipeline that neither declares its resources nor ran before.
+DEFAULT_PIPELINE_MEMORY = 256 * 2**20
+DEFAULT_PIPELINE_CPU = 1.0
+
+# Without a configured memory budget, pipelines may use this share of the physical memory.
+DEFAULT_MEMORY_SHARE = 0.8
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """The resources a pipeline is expected to use while it runs.
+
+    Attributes:
+        memory (int): The memory in bytes.
+        cpu (float): The number of CPU cores.
+    """
+
+    memory: int
+    cpu: float
+
+
+def physical_memory() -> int | None:
+    """Returns the physical memory of the machine in bytes, or None if the platform does not report it."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class AdmissionController:
+    """Admits pipelines to run while their footprints fit in a shared memory and CPU budget.
+
+    Pipelines are admitted by their rank, and then in the order they asked, so a large pipeline is never starved
+    by smaller ones. A pipeline larger than the whole budget is admitted once nothing else runs.
+
+    Args:
+        memory (int | None): The memory budget in bytes, or None for no memory limit.
+        cpu (float | None): The CPU budget in cores, or None for no CPU limit.
+        default_footprint (Footprint | None, optional): The footprint of a pipeline that neither declares its
+            resources nor ran before. Defaults to 256 MiB and one CPU.
+    """
+
+    def __init__(self, memory: int | None, cpu: float | None, default_footprint: Footprint | None = None) -> None:
+        self.memory = memory
+        self.cpu = cpu
+        self.default_footprint = default_footprint or Footprint(DEFAULT_PIPELINE_MEMORY, DEFAULT_PIPELINE_CPU)
+
+        self.used = Footprint(0, 0.0)
+        self.running = 0
+        # The waiting pipelines, the head is the next one to admit.
+        self._queue: list[tuple[Any, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> AdmissionController:
+        """Builds the controller from the `admission` section of the YAML configuration."""
+        memory = parse_byte_size(config.get("memory"))
+        if memory is None and (total := physical_memory()) is not None:
+            memory = int(total * DEFAULT_MEMORY_SHARE)
+
+        default_footprint = Footprint(
+            memory=parse_byte_size(config.get("default_memory", DEFAULT_PIPELINE_MEMORY)),
+            cpu=float(config.get("default_cpu", DEFAULT_PIPELINE_CPU)),
+        )
+        return cls(memory, config.get("cpu") or os.cpu_count(), default_footprint)
+
+    def footprint(self, pipeline: Pipeline, learned: PipelineProfile | None = None) -> Footprint:
+        """Estimates the footprint of a pipeline from its declared resources, or else from its previous runs."""
+        resources = pipeline.resources
+        memory = resources.memory if resources and resources.memory else None
+        cpu = resources.cpu if resources and resources.cpu else None
+
+        if learned is not None:
+            memory = memory or learned.memory or None
+            cpu = cpu or learned.cpu or None
+
+        return Footprint(memory or self.default_footprint.memory, cpu or self.default_footprint.cpu)
+
+    def _fits(self, footprint: Footprint) -> bool:
+        if self.running == 0:
+            return True
+
+        fits_memory = self.memory is None or self.used.memory + footprint.memory <= self.memory
+        fits_cpu = self.cpu is None or self.used.cpu + footprint.cpu <= self.cpu
+        return fits_memory and fits_cpu
+
+    @asynccontextmanager
+    async def admit(self, name: str, footprint: Footprint, rank: tuple = ()) -> AsyncGenerator[None]:
+        """Waits until the footprint fits in the budget, and holds it for the enclosed block.
+
+        Args:
+            name (str): The name of the pipeline.
+            footprint (Footprint): The resources the pipeline is expected to use.
+            rank (tuple, optional): The scheduling rank of the pipeline, lower ranks are admitted first.
+                Defaults to the order the pipelines asked in.
+        """
+        entry = (rank, next(self._sequence), name)
+        async with self._condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                if not (self._queue[0] == entry and self._fits(footprint)):
+                    logging.info(
+                        "Pipeline `%s` waits for %s bytes and %s CPUs, %s bytes and %s CPUs are in use.",
+                        name,
+                        footprint.memory,
+                        footprint.cpu,
+                        self.used.memory,
+                        self.used.cpu,
+                    )
+                await self._condition.wait_for(lambda: self._queue[0] == entry and self._fits(footprint))
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                # The next pipeline in the queue may fit as well.
+                self._condition.notify_all()
+
+            self.used = Footprint(self.used.memory + footprint.memory, self.used.cpu + footprint.cpu)
+            self.running += 1
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.used = Footprint(self.used.memory - footprint.memory, self.used.cpu - footprint.cpu)
+                self.running -= 1
+                self._condition.notify_all()
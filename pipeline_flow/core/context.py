@@ -0,0 +1,114 @@
+# Standard Imports
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pipeline_flow.core.run_journal import PipelineJournal
+    from pipeline_flow.core.spill import SpillManager
+    from pipeline_flow.plugins import IStateStore
+
+# The context of the running pipeline. Asyncio tasks and executor threads inherit it from the pipeline task.
+_current_context: ContextVar[PipelineContext | None] = ContextVar("current_context", default=None)
+
+
+class PluginState:
+    """The persisted state of a single plugin, e.g. the watermark of an incremental extract.
+
+    Values are read from the state store, and written values are only persisted once the whole pipeline succeeds,
+    so that a failed load never skips the data of the failed run.
+    """
+
+    def __init__(self, context: PipelineContext, plugin_id: str) -> None:
+        self.context = context
+        self.plugin_id = plugin_id
+
+    def _key(self, key: str) -> str:
+        return f"{self.plugin_id}.{key}"
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        """Returns the value written in this run, or else the value persisted by the last successful run."""
+        return self.context.get(self._key(key), default)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Stages a JSON serializable value, to be persisted when the pipeline succeeds."""
+        self.context.set(self._key(key), value)
+
+
+class PipelineContext:
+    """The run of a pipeline, shared with its plugins through `current_context`.
+
+    Plugins read and write their persisted state with `current_context().state(self.id)`. Without a state store,
+    every value reads as its default and nothing is persisted.
+
+    Args:
+        pipeline (str | None): The name of the pipeline, which namespaces its state.
+        state_store (IStateStore | None): The store persisting the state between runs.
+        journal (PipelineJournal | None): Records the completed phases, so that a failed run can be resumed.
+        spill (SpillManager | None): Spills the phase outputs over the memory budget of the pipeline to disk.
+    """
+
+    def __init__(
+        self,
+        pipeline: str | None,
+        state_store: IStateStore | None = None,
+        journal: PipelineJournal | None = None,
+        spill: SpillManager | None = None,
+    ) -> None:
+        self.pipeline = pipeline
+        self.state_store = state_store
+        self.journal = journal
+        self.spill = spill
+        self._pending: dict[str, Any] = {}
+        # Synchronous plugins stage their state from executor threads.
+        self._lock = threading.Lock()
+
+    def state(self, plugin_id: str) -> PluginState:
+        return PluginState(self, plugin_id)
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+
+        if self.state_store is None or self.pipeline is None:
+            return default
+
+        value = self.state_store.get(self.pipeline, key)
+        return default if value is None else value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        with self._lock:
+            self._pending[key] = value
+
+    def commit(self) -> None:
+        """Persists the values staged by the plugins in a single write."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending or self.state_store is None or self.pipeline is None:
+            return
+
+        self.state_store.set_many(self.pipeline, pending)
+        logging.info("Persisted %s state values of pipeline `%s`.", len(pending), self.pipeline)
+
+    @contextmanager
+    def activate(self) -> Generator[PipelineContext]:
+        """Makes this context the current context for the enclosed block."""
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
+
+
+def current_context() -> PipelineContext:
+    """Returns the context of the running pipeline, or a context without a state store outside of a pipeline."""
+    context = _current_context.get()
+    return context if context is not None else PipelineContext(None)
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import inspect
 import logging
+import time
 from abc import ABCMeta, abstractmethod
-from functools import reduce
+from collections.abc import AsyncIterator
+from functools import partial, reduce
 from typing import TYPE_CHECKING, Any
 
 from pipeline_flow.common.exceptions import (
@@ -16,12 +20,22 @@ from pipeline_flow.common.exceptions import (
 
 # Third Party Imports
 # Local Imports
-from pipeline_flow.common.utils import async_time_it, sync_time_it
+from pipeline_flow.common.utils.columnar import convert_data
+from pipeline_flow.core.context import current_context
+from pipeline_flow.core.loop_guard import LoopBlockingMonitor, SyncPluginPool, is_on_event_loop
+from pipeline_flow.core.metrics import track_phase, track_plugin
+from pipeline_flow.core.models.phases import PipelinePhase, PostProcessMode, TransformExecutorType
 from pipeline_flow.core.models.pipeline import Pipeline, PipelineType
+from pipeline_flow.core.resource_pools import ResourcePools
+from pipeline_flow.core.spill import SpilledData
+from pipeline_flow.core.tracing import Tracer, run_after_queue_wait, run_timed
+from pipeline_flow.core.transform_pool import TransformProcessPool, concat_data, is_picklable, split_data
 
 # Type Imports
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from pipeline_flow.common.type_def import ETLData, ExtractedData, TransformedData
     from pipeline_flow.core.models.phases import (
         ExtractPhase,
@@ -31,38 +45,121 @@ if TYPE_CHECKING:
     )
     from pipeline_flow.plugins import IPlugin
 
+# Marks the end of a chunked stream flowing through the inter-phase queues.
+END_OF_STREAM = object()
+
 
-@sync_time_it
+@track_plugin
 def plugin_sync_executor(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
     logging.info("Executing plugin `%s`", plugin.id)
-    result = plugin(*pipeline_args, **pipeline_kwargs)
+    start = time.perf_counter()
+    try:
+        result = plugin(*pipeline_args, **pipeline_kwargs)
+    finally:
+        # A sync plugin called on the event loop blocks it for the whole call, e.g. an `inline` transformation.
+        if LoopBlockingMonitor.is_enabled() and is_on_event_loop():
+            LoopBlockingMonitor.record(plugin.id, time.perf_counter() - start)
     logging.info("Finished executing plugin `%s`", plugin.id)
     return result
 
 
-@async_time_it
+@track_plugin
 async def plugin_async_executor(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
     logging.info("Executing plugin `%s`", plugin.id)
-    result = await plugin(*pipeline_args, **pipeline_kwargs)
+    async with ResourcePools.acquire(resource_pool_of(plugin)):
+        result = await LoopBlockingMonitor.watch(plugin.id, plugin(*pipeline_args, **pipeline_kwargs))
     logging.info("Finished executing plugin `%s`", plugin.id)
     return result
 
 
+def resource_pool_of(plugin: IPlugin) -> str | None:
+    """Returns the resource pool the executor acquires for a call of the plugin.
+
+    Plugins acquiring their pool for every request they make are not held for the whole call.
+    """
+    if getattr(plugin, "acquires_resource_pool", False) is True:
+        return None
+    pool = getattr(plugin, "resource_pool", None)
+    return pool if isinstance(pool, str) else None
+
+
+def is_async_plugin(plugin: IPlugin) -> bool:
+    return inspect.iscoroutinefunction(plugin) or inspect.iscoroutinefunction(plugin.__call__)
+
+
+async def run_plugin(plugin: IPlugin, *pipeline_args: Any, **pipeline_kwargs: Any) -> ETLData:  # noqa: ANN401
+    """Awaits an async plugin, or runs a sync one on the plugin thread pool to keep the event loop free.
+
+    Threads run in a copy of the current context, so plugin metrics and spans keep their pipeline,
+    phase and parent span. The time spent waiting for a thread is traced as well. The resource pool
+    of the plugin is held for the whole call.
+    """
+    if is_async_plugin(plugin):
+        return await plugin_async_executor(plugin, *pipeline_args, **pipeline_kwargs)
+
+    loop = asyncio.get_running_loop()
+    call = partial(plugin_sync_executor, plugin, *pipeline_args, **pipeline_kwargs)
+    async with ResourcePools.acquire(resource_pool_of(plugin)):
+        result = await loop.run_in_executor(
+            SyncPluginPool.get(), partial(contextvars.copy_context().run, run_after_queue_wait, time.time_ns(), call)
+        )
+        if inspect.isawaitable(result):
+            # An async plugin hidden behind a sync wrapper, e.g. a decorator, only returned its coroutine.
+            result = await LoopBlockingMonitor.watch(plugin.id, result)
+        return result
+
+
+def as_plugin_input(plugin: IPlugin, data: ETLData) -> ETLData:
+    """Converts the data into the `input_format` declared by the plugin, `native` passes it through as is.
+
+    Spilled data is read back from disk, `native` plugins receive it in the type it had before it was spilled.
+    """
+    if isinstance(data, SpilledData):
+        return data.as_format(plugin.input_format)
+    return convert_data(data, plugin.input_format)
+
+
 async def task_group_executor(
     plugins: list[IPlugin],
     *pipeline_args: Any,  # noqa: ANN401
     **pipeline_kwargs: Any,  # noqa: ANN401
 ) -> dict[str, ETLData]:
+    # Each input format is only converted once, however many plugins share it.
+    converted_data = {}
+
+    def plugin_kwargs(plugin: IPlugin) -> dict[str, Any]:
+        if "data" not in pipeline_kwargs:
+            return pipeline_kwargs
+        if plugin.input_format not in converted_data:
+            converted_data[plugin.input_format] = as_plugin_input(plugin, pipeline_kwargs["data"])
+        return {**pipeline_kwargs, "data": converted_data[plugin.input_format]}
+
     async with asyncio.TaskGroup() as group:
         tasks = {
-            plugin.id: group.create_task(plugin_async_executor(plugin, *pipeline_args, **pipeline_kwargs))
+            plugin.id: group.create_task(run_plugin(plugin, *pipeline_args, **plugin_kwargs(plugin)))
             for plugin in plugins
         }
 
     return {plugin_id: task.result() for plugin_id, task in tasks.items()}
 
 
-@async_time_it
+async def run_post_processing(plugins: list[IPlugin], data: ETLData, mode: PostProcessMode) -> ETLData:
+    """Runs the post-processing steps and returns the data for the next phase.
+
+    Chained steps run one after another, each receiving the output of the previous step, and the output of the
+    last step is returned. Fanned out steps are independent sinks that run concurrently on the same data,
+    which is returned unchanged.
+    """
+    if mode == PostProcessMode.FAN_OUT:
+        await task_group_executor(plugins, data=data)
+        return data
+
+    for plugin in plugins:
+        data = await run_plugin(plugin, data=as_plugin_input(plugin, data))
+    return data
+
+
+@track_phase(PipelinePhase.EXTRACT_PHASE)
 async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
     results = {}
 
@@ -77,15 +174,11 @@ async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
         df_result = (
             results.get(extracts.steps[0].id)
             if len(extracts.steps) == 1
-            else plugin_sync_executor(extracts.merge, extracted_data=results)
+            else await run_plugin(extracts.merge, extracted_data=results)
         )
 
         if extracts.post:
-            if len(extracts.post) == 1:
-                # If there's only one post-processing step, we can run it directly.
-                df_result = await plugin_async_executor(extracts.post[0], data=df_result)
-            else:
-                raise NotImplementedError("Multiple post-processing steps are not supported yet. ")  # noqa: TRY301 - Temporarily disabled for simplicity
+            df_result = await run_post_processing(extracts.post, df_result, extracts.post_mode)
 
     except Exception as e:
         error_message = "Extraction Phase Error"
@@ -95,14 +188,17 @@ async def run_extractor(extracts: ExtractPhase) -> ExtractedData:
         return df_result
 
 
-@sync_time_it
 def run_transformer(data: ExtractedData, transformations: TransformPhase) -> TransformedData:
     if not transformations.steps:
         logging.info("No transformations to run")
         return data
 
     try:
-        transformed_data = reduce(lambda data, plugin: plugin_sync_executor(plugin, data), transformations.steps, data)
+        transformed_data = reduce(
+            lambda data, plugin: plugin_sync_executor(plugin, as_plugin_input(plugin, data)),
+            transformations.steps,
+            data,
+        )
     except Exception as e:
         msg = "Transformation Phase Error"
         raise TransformError(msg, e) from e
@@ -110,7 +206,72 @@ def run_transformer(data: ExtractedData, transformations: TransformPhase) -> Tra
     return transformed_data
 
 
-@async_time_it
+def resolve_transform_executor(
+    transformations: TransformPhase, default_executor: TransformExecutorType = TransformExecutorType.THREAD
+) -> TransformExecutorType:
+    """Returns the executor of the transformations, falling back to threads if they cannot reach a process."""
+    executor_type = transformations.executor or default_executor
+
+    if executor_type == TransformExecutorType.PROCESS and not is_picklable(transformations):
+        logging.warning("The transform plugins cannot be pickled. Falling back to the thread executor.")
+        return TransformExecutorType.THREAD
+
+    return executor_type
+
+
+@track_phase(PipelinePhase.TRANSFORM_PHASE, takes_data=True)
+async def run_transformer_in_executor(
+    data: ExtractedData,
+    transformations: TransformPhase,
+    default_executor: TransformExecutorType = TransformExecutorType.THREAD,
+    *,
+    executor_type: TransformExecutorType | None = None,
+) -> TransformedData:
+    """Runs the transformation chain on the executor configured for the pipeline.
+
+    - `thread`: the default thread pool, which keeps the event loop free for I/O.
+    - `process`: the shared process pool, for CPU-bound pure-Python transformations.
+    - `inline`: directly on the event loop, for cheap transformations.
+
+    When `chunks` is greater than one, the data is split and each chunk is transformed in parallel.
+    Callers transforming many chunks pass the `executor_type` resolved once by `resolve_transform_executor`.
+    """
+    if (transformations.executor or default_executor) == TransformExecutorType.INLINE or not transformations.steps:
+        return run_transformer(data, transformations)
+
+    executor_type = executor_type or resolve_transform_executor(transformations, default_executor)
+
+    is_process = executor_type == TransformExecutorType.PROCESS
+    pool = TransformProcessPool.get() if is_process else SyncPluginPool.get()
+    loop = asyncio.get_running_loop()
+
+    async def transform(part: ExtractedData) -> TransformedData:
+        submitted_at = time.time_ns()
+        if is_process:
+            # Worker processes cannot share the context, so the time spent waiting for one is traced here.
+            started_at, transformed = await loop.run_in_executor(
+                pool, run_timed, run_transformer, part, transformations
+            )
+            Tracer.record_span("executor.queue_wait", submitted_at, end_time=started_at)
+            return transformed
+
+        # Threads run in a copy of the current context, so plugin metrics and spans keep their pipeline,
+        # phase and parent span. The time spent waiting for a thread is traced as well.
+        call = partial(contextvars.copy_context().run, run_after_queue_wait, submitted_at, run_transformer)
+        return await loop.run_in_executor(pool, call, part, transformations)
+
+    parts = split_data(data, transformations.chunks) if transformations.chunks > 1 else None
+    if parts is None:
+        if transformations.chunks > 1:
+            logging.warning("Data of type `%s` cannot be split into chunks.", type(data).__name__)
+        return await transform(data)
+
+    logging.debug("Transforming %s chunks in parallel on the %s executor.", len(parts), executor_type)
+    transformed_parts = await asyncio.gather(*(transform(part) for part in parts))
+    return concat_data(transformed_parts)
+
+
+@track_phase(PipelinePhase.LOAD_PHASE, takes_data=True)
 async def run_loader(data: ExtractedData | TransformedData, destinations: LoadPhase) -> None:
     if destinations.pre:
         await task_group_executor(destinations.pre)
@@ -125,18 +286,157 @@ async def run_loader(data: ExtractedData | TransformedData, destinations: LoadPh
         raise LoadError(error_message, e) from e
 
 
-@sync_time_it
-def run_transformer_after_load(transformations: TransformLoadPhase) -> None:
+@track_phase(PipelinePhase.TRANSFORM_AT_LOAD_PHASE)
+async def run_transformer_after_load(transformations: TransformLoadPhase) -> None:
+    """Runs the transform-at-load steps, in the declared order unless they declare `needs`.
+
+    With dependencies, every step starts as soon as the steps it needs have finished, so independent
+    steps run concurrently.
+    """
     try:
-        for plugin in transformations.steps:
-            plugin_sync_executor(plugin)
+        if not transformations.dependencies:
+            for plugin in transformations.steps:
+                await run_plugin(plugin)
+            return
+
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_after_dependencies(plugin: IPlugin) -> None:
+            await asyncio.gather(*(tasks[step_id] for step_id in transformations.dependencies.get(plugin.id, ())))
+            await run_plugin(plugin)
+
+        try:
+            # Every task is created before any of them starts, so each one can wait on the tasks it needs.
+            async with asyncio.TaskGroup() as group:
+                for plugin in transformations.steps:
+                    tasks[plugin.id] = group.create_task(run_after_dependencies(plugin))
+        except ExceptionGroup as eg:
+            # Surface the step that failed first, the dependent steps were only cancelled.
+            raise eg.exceptions[0] from eg
 
     except Exception as e:
         error_message = "Transform Load Phase Error"
         raise TransformLoadError(error_message, e) from e
 
 
+@track_phase(PipelinePhase.EXTRACT_PHASE)
+async def stream_extractor(extracts: ExtractPhase, output_queue: asyncio.Queue) -> None:
+    """Puts every chunk yielded by the extract plugin on the output queue.
+
+    The queue is bounded, so the extractor is paused whenever the downstream phases fall behind.
+    """
+    try:
+        if extracts.pre:
+            await task_group_executor(extracts.pre)
+
+        plugin = extracts.steps[0]
+        logging.info("Streaming chunks from plugin `%s`", plugin.id)
+        chunks = plugin()
+
+        if not isinstance(chunks, AsyncIterator):
+            if asyncio.iscoroutine(chunks):
+                chunks.close()
+            msg = f"Plugin `{plugin.id}` must be an async generator to be used in streaming mode."
+            raise TypeError(msg)  # noqa: TRY301
+
+        # The pool is held for the whole stream, as the plugin may request the next chunk at any time.
+        async with ResourcePools.acquire(resource_pool_of(plugin)):
+            async for chunk in chunks:
+                await output_queue.put(chunk)
+
+    except Exception as e:
+        error_message = "Extraction Phase Error"
+        raise ExtractError(error_message, e) from e
+
+    await output_queue.put(END_OF_STREAM)
+
+
+async def stream_transformer(
+    transformations: TransformPhase,
+    input_queue: asyncio.Queue,
+    output_queue: asyncio.Queue,
+    default_executor: TransformExecutorType = TransformExecutorType.THREAD,
+) -> None:
+    """Transforms each chunk on the configured executor and passes the result on to the next queue."""
+    # Resolved once, as checking that the transformations can be pickled costs as much as pickling them.
+    executor_type = resolve_transform_executor(transformations, default_executor)
+    while (chunk := await input_queue.get()) is not END_OF_STREAM:
+        transformed_chunk = await run_transformer_in_executor(
+            chunk, transformations, default_executor, executor_type=executor_type
+        )
+        await output_queue.put(transformed_chunk)
+
+    await output_queue.put(END_OF_STREAM)
+
+
+@track_phase(PipelinePhase.LOAD_PHASE)
+async def stream_loader(destinations: LoadPhase, input_queue: asyncio.Queue) -> None:
+    """Loads each chunk as soon as it arrives. Pre-processing runs once, before the first chunk."""
+    if destinations.pre:
+        await task_group_executor(destinations.pre)
+
+    try:
+        while (chunk := await input_queue.get()) is not END_OF_STREAM:
+            await task_group_executor(destinations.steps, data=chunk)
+    except Exception as e:
+        error_message = "Load Phase Error"
+        raise LoadError(error_message, e) from e
+
+
+async def run_streaming_phases(
+    pipeline: Pipeline, default_executor: TransformExecutorType = TransformExecutorType.THREAD
+) -> None:
+    """Runs the extract, transform and load phases concurrently over bounded chunk queues.
+
+    Peak memory is bounded by `stream_queue_size` chunks per queue instead of the full dataset.
+    """
+    extract_queue = asyncio.Queue(maxsize=pipeline.stream_queue_size)
+    load_queue = extract_queue
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(stream_extractor(pipeline.extract, extract_queue))
+
+            if PipelinePhase.TRANSFORM_PHASE in pipeline.phases:
+                load_queue = asyncio.Queue(maxsize=pipeline.stream_queue_size)
+                group.create_task(stream_transformer(pipeline.transform, extract_queue, load_queue, default_executor))
+
+            group.create_task(stream_loader(pipeline.load, load_queue))
+    except ExceptionGroup as eg:
+        # Surface the phase error that failed the stream, the sibling phases were only cancelled.
+        raise eg.exceptions[0] from eg
+
+
+async def run_phase(phase: PipelinePhase, run: Callable[[], Awaitable[ETLData]], *, has_output: bool = True) -> ETLData:
+    """Runs a phase and records it in the run journal, or skips it if a previous attempt of the run completed it.
+
+    A skipped phase returns its output restored from the spill directory, when the next phase needs it.
+    An output over the memory budget of the pipeline is spilled to disk, and handed off as a `SpilledData` reader.
+
+    Args:
+        phase (PipelinePhase): The phase to run.
+        run (Callable[[], Awaitable[ETLData]]): Runs the phase and returns its output.
+        has_output (bool, optional): Whether the next phase needs the output of this phase. Defaults to True.
+    """
+    context = current_context()
+    journal = context.journal
+    if journal is not None and journal.is_resumed(phase):
+        logging.info("Skipping phase `%s`, it completed in a previous attempt of the run.", phase)
+        return await asyncio.to_thread(journal.restore, phase)
+
+    data = await run()
+    if has_output and context.spill is not None:
+        data = await asyncio.to_thread(context.spill.hand_off, phase, data)
+
+    if journal is not None:
+        await asyncio.to_thread(partial(journal.record_phase, phase, data, has_output=has_output))
+    return data
+
+
 class PipelineStrategy(metaclass=ABCMeta):
+    def __init__(self, transform_executor: TransformExecutorType = TransformExecutorType.THREAD) -> None:
+        self.transform_executor = transform_executor
+
     @abstractmethod
     async def execute(self, pipeline: Pipeline) -> bool:
         raise NotImplementedError("This has to be implemented by the subclasses.")
@@ -144,41 +444,66 @@ class PipelineStrategy(metaclass=ABCMeta):
 
 class ETLStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
+        if pipeline.streaming:
+            await run_streaming_phases(pipeline, self.transform_executor)
+            return True
+
+        extracted_data = await run_phase(PipelinePhase.EXTRACT_PHASE, partial(run_extractor, pipeline.extract))
 
         # Transform (CPU-bound work, so offload to executor)
-        transformed_data = await asyncio.get_running_loop().run_in_executor(
-            None, run_transformer, extracted_data, pipeline.transform
+        transformed_data = await run_phase(
+            PipelinePhase.TRANSFORM_PHASE,
+            partial(run_transformer_in_executor, extracted_data, pipeline.transform, self.transform_executor),
         )
 
-        await run_loader(transformed_data, pipeline.load)
+        await run_phase(
+            PipelinePhase.LOAD_PHASE, partial(run_loader, transformed_data, pipeline.load), has_output=False
+        )
 
         return True
 
 
 class ELTStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
-
-        await run_loader(extracted_data, pipeline.load)
-
-        run_transformer_after_load(pipeline.load_transform)
+        if pipeline.streaming:
+            await run_streaming_phases(pipeline, self.transform_executor)
+        else:
+            extracted_data = await run_phase(PipelinePhase.EXTRACT_PHASE, partial(run_extractor, pipeline.extract))
+            await run_phase(
+                PipelinePhase.LOAD_PHASE, partial(run_loader, extracted_data, pipeline.load), has_output=False
+            )
+
+        await run_phase(
+            PipelinePhase.TRANSFORM_AT_LOAD_PHASE,
+            partial(run_transformer_after_load, pipeline.load_transform),
+            has_output=False,
+        )
 
         return True
 
 
 class ETLTStrategy(PipelineStrategy):
     async def execute(self, pipeline: Pipeline) -> bool:
-        extracted_data = await run_extractor(pipeline.extract)
-
-        transformed_data = await asyncio.get_running_loop().run_in_executor(
-            None, run_transformer, extracted_data, pipeline.transform
+        if pipeline.streaming:
+            await run_streaming_phases(pipeline, self.transform_executor)
+        else:
+            extracted_data = await run_phase(PipelinePhase.EXTRACT_PHASE, partial(run_extractor, pipeline.extract))
+
+            transformed_data = await run_phase(
+                PipelinePhase.TRANSFORM_PHASE,
+                partial(run_transformer_in_executor, extracted_data, pipeline.transform, self.transform_executor),
+            )
+
+            await run_phase(
+                PipelinePhase.LOAD_PHASE, partial(run_loader, transformed_data, pipeline.load), has_output=False
+            )
+
+        await run_phase(
+            PipelinePhase.TRANSFORM_AT_LOAD_PHASE,
+            partial(run_transformer_after_load, pipeline.load_transform),
+            has_output=False,
         )
 
-        await run_loader(transformed_data, pipeline.load)
-
-        run_transformer_after_load(pipeline.load_transform)
-
         return True
 
 
@@ -0,0 +1,199 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Generator
+
+# Calls blocking the event loop for longer than this are reported by default, in seconds.
+DEFAULT_BLOCKING_THRESHOLD = 0.1
+
+
+class SyncPluginPool(metaclass=SingletonMeta):
+    """A process-wide `ThreadPoolExecutor` running every synchronous plugin off the event loop.
+
+    The pool is created lazily on first use and reused until `shutdown` is called.
+    """
+
+    _pool: ClassVar[ThreadPoolExecutor | None] = None
+    _max_workers: ClassVar[int | None] = None
+
+    @classmethod
+    def configure(cls, max_workers: int | None) -> None:
+        """Sets the number of worker threads. Only applies to a pool that has not been created yet."""
+        if cls._pool is not None and max_workers != cls._max_workers:
+            logging.warning("The plugin thread pool is already running. Ignoring `max_workers=%s`.", max_workers)
+            return
+
+        cls._max_workers = max_workers
+
+    @classmethod
+    def get(cls) -> ThreadPoolExecutor:
+        if cls._pool is None:
+            logging.debug("Starting the plugin thread pool with max_workers=%s.", cls._max_workers)
+            cls._pool = ThreadPoolExecutor(max_workers=cls._max_workers, thread_name_prefix="pipeline_flow_plugin")
+
+        return cls._pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._pool is None:
+            return
+
+        logging.debug("Shutting down the plugin thread pool.")
+        cls._pool.shutdown(wait=True, cancel_futures=True)
+        cls._pool = None
+
+
+@dataclass
+class BlockingSummary:
+    """How long the calls of a plugin held the event loop, in seconds."""
+
+    plugin_id: str
+    calls: int = 0
+    blocking_total: float = 0.0
+    blocking_max: float = 0.0
+
+    def add(self, longest: float, total: float) -> None:
+        self.calls += 1
+        self.blocking_total += total
+        self.blocking_max = max(self.blocking_max, longest)
+
+
+def is_on_event_loop() -> bool:
+    """Checks whether the current thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class LoopBlockingMonitor(metaclass=SingletonMeta):
+    """A debug mode that measures how long each plugin holds the event loop.
+
+    Synchronous plugins called on the event loop block it for their whole call. Asynchronous plugins block
+    it between two `await` points, so every step of their coroutine is measured and the longest step is
+    what delays the other pipelines. Plugins blocking the loop for longer than the threshold are reported.
+    The monitor is disabled until `configure` is called with a threshold.
+    """
+
+    _threshold: ClassVar[float | None] = None
+    _summaries: ClassVar[dict[str, BlockingSummary]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def configure(cls, threshold: float | None) -> None:
+        """Enables the monitor with the threshold in seconds, or disables it if `threshold` is None."""
+        cls._threshold = threshold
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._threshold is not None
+
+    @classmethod
+    def record(cls, plugin_id: str, longest: float, total: float | None = None) -> None:
+        """Records a plugin call that held the event loop for `longest` seconds without yielding it.
+
+        Args:
+            plugin_id (str): The plugin that was called.
+            longest (float): The longest time the call held the event loop at once.
+            total (float | None): The time the call held the event loop overall. Defaults to `longest`.
+        """
+        with cls._lock:
+            if plugin_id not in cls._summaries:
+                cls._summaries[plugin_id] = BlockingSummary(plugin_id)
+            cls._summaries[plugin_id].add(longest, longest if total is None else total)
+
+        if longest > cls._threshold:
+            logging.warning("Plugin `%s` blocked the event loop for %.4f seconds.", plugin_id, longest)
+
+    @classmethod
+    def watch[R](cls, plugin_id: str, coroutine: Coroutine[Any, Any, R]) -> Coroutine[Any, Any, R]:
+        """Measures every step of the coroutine of a plugin, returned as is while the monitor is disabled."""
+        if not cls.is_enabled():
+            return coroutine
+        return _timed(_TimedCoroutine(plugin_id, coroutine))
+
+    @classmethod
+    def offenders(cls) -> list[BlockingSummary]:
+        """Returns the plugins that blocked the event loop for longer than the threshold, worst first."""
+        with cls._lock:
+            summaries = [summary for summary in cls._summaries.values() if summary.blocking_max > cls._threshold]
+        return sorted(summaries, key=lambda summary: summary.blocking_max, reverse=True)
+
+    @classmethod
+    def report(cls) -> None:
+        """Logs every plugin that blocked the event loop for longer than the threshold."""
+        if not cls.is_enabled():
+            return
+
+        for summary in cls.offenders():
+            logging.warning(
+                "Plugin `%s` blocked the event loop for up to %.4f seconds (%.4f seconds over %s calls).",
+                summary.plugin_id,
+                summary.blocking_max,
+                summary.blocking_total,
+                summary.calls,
+            )
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._summaries = {}
+
+
+class _TimedCoroutine:
+    """Drives a coroutine step by step, timing each step as the event loop is blocked while it runs."""
+
+    def __init__(self, plugin_id: str, coroutine: Coroutine) -> None:
+        self.plugin_id = plugin_id
+        self.coroutine = coroutine
+        self.longest = 0.0
+        self.total = 0.0
+
+    def _step(self, value: Any = None, error: BaseException | None = None) -> Any:  # noqa: ANN401
+        start = time.perf_counter()
+        try:
+            return self.coroutine.throw(error) if error is not None else self.coroutine.send(value)
+        finally:
+            duration = time.perf_counter() - start
+            self.longest = max(self.longest, duration)
+            self.total += duration
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        try:
+            return (yield from self._drive())
+        finally:
+            LoopBlockingMonitor.record(self.plugin_id, self.longest, self.total)
+
+    def _drive(self) -> Generator[Any, Any, Any]:
+        value, error = None, None
+        while True:
+            try:
+                yielded = self._step(value, error)
+            except StopIteration as e:
+                return e.value
+
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                self.coroutine.close()
+                raise
+            except BaseException as e:  # noqa: BLE001 - Cancellations are forwarded to the coroutine.
+                value, error = None, e
+
+
+async def _timed[R](awaitable: _TimedCoroutine) -> R:
+    return await awaitable
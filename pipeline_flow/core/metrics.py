@@ -0,0 +1,441 @@
+# Standard Imports
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum, unique
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.common.utils.columnar import is_columnar, is_dataframe
+from pipeline_flow.core.tracing import Tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from pipeline_flow.common.type_def import ETLData
+    from pipeline_flow.core.models.phases import PipelinePhase
+    from pipeline_flow.plugins import IPlugin
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Not available on Windows.
+    resource = None
+
+# `ru_maxrss` is reported in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+# The pipeline and phase a measurement belongs to. Asyncio tasks inherit them from the task that created them.
+_current_pipeline: ContextVar[str | None] = ContextVar("current_pipeline", default=None)
+_current_phase: ContextVar[str | None] = ContextVar("current_phase", default=None)
+
+
+@unique
+class MetricScope(StrEnum):
+    PIPELINE = "pipeline"
+    PHASE = "phase"
+    PLUGIN = "plugin"
+
+
+@dataclass
+class MetricRecord:
+    """A single measured pipeline run, phase run or plugin call.
+
+    The CPU time of synchronous calls is the time of the thread running them. Asynchronous calls share
+    the event loop thread with every other running task, so their CPU time is the process CPU time
+    spent while they were running.
+    """
+
+    scope: MetricScope
+    name: str
+    pipeline: str | None
+    phase: str | None
+    started_at: float
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    bytes_in: int | None = None
+    bytes_out: int | None = None
+    peak_rss_delta: int | None = None
+    success: bool = True
+
+
+def count_rows(data: ETLData) -> int | None:
+    """Returns the number of rows of a list, DataFrame or columnar batch, or None for any other type."""
+    if isinstance(data, list | tuple) or is_dataframe(data) or is_columnar(data):
+        return len(data)
+    return None
+
+
+def count_bytes(data: ETLData) -> int | None:
+    """Returns the size of raw bytes, a DataFrame or a columnar batch, or None when it cannot be cheaply known."""
+    if isinstance(data, bytes | bytearray):
+        return len(data)
+    if is_columnar(data):
+        return data.nbytes
+    if is_dataframe(data):
+        return int(data.memory_usage(index=True).sum())
+    return None
+
+
+def _peak_rss() -> int | None:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def _current_rss() -> int | None:
+    """Returns the resident set size of the process, or None where `/proc` is not available."""
+    try:
+        return int(Path("/proc/self/statm").read_bytes().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RssSampler(metaclass=SingletonMeta):
+    """Samples the resident set size of the process while at least one window is open, keeping the peak of each.
+
+    The peak RSS of the process only ever grows, so a pipeline running after a heavier one would measure no growth.
+    Pipelines measure their growth against the RSS sampled at their start instead.
+    """
+
+    INTERVAL = 0.05
+
+    _windows: ClassVar[dict[int, int]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _thread: ClassVar[threading.Thread | None] = None
+    _next_window: ClassVar[int] = 0
+
+    @classmethod
+    def open(cls) -> tuple[int, int] | None:
+        """Opens a window, returning its id and the RSS at its start, or None where the RSS cannot be sampled."""
+        rss = _current_rss()
+        if rss is None:
+            return None
+
+        with cls._lock:
+            cls._next_window += 1
+            window = cls._next_window
+            cls._windows[window] = rss
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._sample, name="pipeline-flow-rss-sampler", daemon=True)
+                cls._thread.start()
+        return window, rss
+
+    @classmethod
+    def close(cls, window: int) -> int:
+        """Closes the window and returns the peak RSS sampled in it."""
+        rss = _current_rss() or 0
+        with cls._lock:
+            return max(cls._windows.pop(window), rss)
+
+    @classmethod
+    def _sample(cls) -> None:
+        while True:
+            time.sleep(cls.INTERVAL)
+            rss = _current_rss() or 0
+            with cls._lock:
+                if not cls._windows:
+                    cls._thread = None
+                    return
+                for window, peak in cls._windows.items():
+                    cls._windows[window] = max(peak, rss)
+
+
+class Measurement:
+    """Measures the enclosed block and adds a `MetricRecord` to the `MetricsRegistry` on exit.
+
+    Set `data_out` inside the block to record the rows and bytes produced. When tracing is enabled,
+    the block is also wrapped in a span named after the scope and the name.
+
+    Pipelines measure their memory with the `RssSampler`, as the growth of the RSS over the RSS at their start.
+    Phases and plugins, measured far more often, use the growth of the peak RSS of the process.
+    """
+
+    def __init__(
+        self: Self,
+        scope: MetricScope,
+        name: str,
+        data_in: ETLData = None,
+        *,
+        thread_cpu: bool = False,
+    ) -> None:
+        self.scope = scope
+        self.name = name
+        self.data_in = data_in
+        self.data_out = None
+        self._cpu_clock = time.thread_time if thread_cpu else time.process_time
+
+    def __enter__(self: Self) -> Self:
+        if self.scope == MetricScope.PIPELINE:
+            self._token = _current_pipeline.set(self.name)
+        elif self.scope == MetricScope.PHASE:
+            self._token = _current_phase.set(self.name)
+
+        self.record = MetricRecord(
+            scope=self.scope,
+            name=self.name,
+            pipeline=_current_pipeline.get(),
+            phase=_current_phase.get(),
+            started_at=time.time(),
+            rows_in=count_rows(self.data_in),
+            bytes_in=count_bytes(self.data_in),
+        )
+        self._span_context = Tracer.span(f"{self.scope} {self.name}", attributes={"pipeline_flow.scope": self.scope})
+        self._span = self._span_context.__enter__()
+
+        self._rss_window = RssSampler.open() if self.scope == MetricScope.PIPELINE else None
+        self._rss_start = self._rss_window[1] if self._rss_window else _peak_rss()
+        self._cpu_start = self._cpu_clock()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        record = self.record
+        record.wall_time = time.perf_counter() - self._wall_start
+        record.cpu_time = self._cpu_clock() - self._cpu_start
+        record.success = exc_type is None
+        record.rows_out = count_rows(self.data_out)
+        record.bytes_out = count_bytes(self.data_out)
+        if self._rss_window is not None:
+            record.peak_rss_delta = RssSampler.close(self._rss_window[0]) - self._rss_start
+        elif self._rss_start is not None:
+            record.peak_rss_delta = _peak_rss() - self._rss_start
+
+        if self._span is not None:
+            self._span.attributes.update(
+                {
+                    "pipeline_flow.pipeline": record.pipeline,
+                    "pipeline_flow.phase": record.phase,
+                    "pipeline_flow.rows_in": record.rows_in,
+                    "pipeline_flow.rows_out": record.rows_out,
+                }
+            )
+        self._span_context.__exit__(exc_type, exc_value, traceback)
+
+        if self.scope == MetricScope.PIPELINE:
+            _current_pipeline.reset(self._token)
+        elif self.scope == MetricScope.PHASE:
+            _current_phase.reset(self._token)
+
+        logging.info("Time taken to execute %s `%s` is %.4f seconds", self.scope, self.name, record.wall_time)
+        MetricsRegistry.add(record)
+
+
+def _plugin_input(pipeline_args: tuple, pipeline_kwargs: dict) -> ETLData:
+    return pipeline_kwargs.get("data", pipeline_args[0] if pipeline_args else None)
+
+
+def track_plugin[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Records a `plugin` metric for every call of a plugin executor, sync or async.
+
+    The decorated function must take the plugin as its first argument, followed by the plugin arguments.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_inner(plugin: IPlugin, *args: P.args, **kwargs: P.kwargs) -> R:
+            with Measurement(MetricScope.PLUGIN, plugin.id, _plugin_input(args, kwargs)) as measurement:
+                measurement.data_out = await func(plugin, *args, **kwargs)
+            return measurement.data_out
+
+        return async_inner
+
+    @wraps(func)
+    def inner(plugin: IPlugin, *args: P.args, **kwargs: P.kwargs) -> R:
+        with Measurement(MetricScope.PLUGIN, plugin.id, _plugin_input(args, kwargs), thread_cpu=True) as measurement:
+            measurement.data_out = func(plugin, *args, **kwargs)
+        return measurement.data_out
+
+    return inner
+
+
+def track_phase[**P, R](
+    phase: PipelinePhase, *, takes_data: bool = False
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Records a `phase` metric for every run of a phase, sync or async.
+
+    Args:
+        phase (PipelinePhase): The phase the decorated function runs.
+        takes_data (bool, optional): Whether the first argument is the input data of the phase. Defaults to False.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        def data_in(args: tuple) -> ETLData:
+            return args[0] if takes_data and args else None
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_inner(*args: P.args, **kwargs: P.kwargs) -> R:
+                with Measurement(MetricScope.PHASE, phase, data_in(args)) as measurement:
+                    measurement.data_out = await func(*args, **kwargs)
+                return measurement.data_out
+
+            return async_inner
+
+        @wraps(func)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            with Measurement(MetricScope.PHASE, phase, data_in(args), thread_cpu=True) as measurement:
+                measurement.data_out = func(*args, **kwargs)
+            return measurement.data_out
+
+        return inner
+
+    return decorator
+
+
+@dataclass
+class MetricSummary:
+    """The aggregate of every record sharing the same scope, name, pipeline and phase."""
+
+    scope: MetricScope
+    name: str
+    pipeline: str | None
+    phase: str | None
+    calls: int = 0
+    failures: int = 0
+    wall_time_total: float = 0.0
+    wall_time_max: float = 0.0
+    cpu_time_total: float = 0.0
+    rows_in_total: int = 0
+    rows_out_total: int = 0
+    bytes_in_total: int = 0
+    bytes_out_total: int = 0
+    peak_rss_delta_max: int = 0
+    records: list[MetricRecord] = field(default_factory=list, repr=False)
+
+    def add(self: Self, record: MetricRecord) -> None:
+        self.calls += 1
+        self.failures += not record.success
+        self.wall_time_total += record.wall_time
+        self.wall_time_max = max(self.wall_time_max, record.wall_time)
+        self.cpu_time_total += record.cpu_time
+        self.rows_in_total += record.rows_in or 0
+        self.rows_out_total += record.rows_out or 0
+        self.bytes_in_total += record.bytes_in or 0
+        self.bytes_out_total += record.bytes_out or 0
+        self.peak_rss_delta_max = max(self.peak_rss_delta_max, record.peak_rss_delta or 0)
+
+
+# Prometheus metric name, help text and the summary attribute it is exported from.
+_PROMETHEUS_METRICS = (
+    ("pipeline_flow_calls_total", "counter", "Number of calls.", "calls"),
+    ("pipeline_flow_failures_total", "counter", "Number of failed calls.", "failures"),
+    ("pipeline_flow_wall_seconds_total", "counter", "Wall-clock time spent.", "wall_time_total"),
+    ("pipeline_flow_wall_seconds_max", "gauge", "Slowest single call.", "wall_time_max"),
+    ("pipeline_flow_cpu_seconds_total", "counter", "CPU time spent.", "cpu_time_total"),
+    ("pipeline_flow_rows_in_total", "counter", "Rows received.", "rows_in_total"),
+    ("pipeline_flow_rows_out_total", "counter", "Rows produced.", "rows_out_total"),
+    ("pipeline_flow_bytes_in_total", "counter", "Bytes received.", "bytes_in_total"),
+    ("pipeline_flow_bytes_out_total", "counter", "Bytes produced.", "bytes_out_total"),
+    (
+        "pipeline_flow_peak_rss_delta_bytes",
+        "gauge",
+        "Largest increase of the peak RSS in a call.",
+        "peak_rss_delta_max",
+    ),
+)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry(metaclass=SingletonMeta):
+    """An in-memory, process-wide store of the metrics recorded during a run."""
+
+    _records: ClassVar[list[MetricRecord]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def add(cls, record: MetricRecord) -> None:
+        # Synchronous plugins record their metrics from executor threads.
+        with cls._lock:
+            cls._records.append(record)
+
+    @classmethod
+    def records(cls, scope: MetricScope | None = None) -> list[MetricRecord]:
+        with cls._lock:
+            return [record for record in cls._records if scope is None or record.scope == scope]
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._records = []
+
+    @classmethod
+    def summarize(cls, scope: MetricScope | None = None) -> list[MetricSummary]:
+        """Aggregates the records per scope, name, pipeline and phase, slowest first."""
+        summaries: dict[tuple, MetricSummary] = {}
+        for record in cls.records(scope):
+            key = (record.scope, record.name, record.pipeline, record.phase)
+            if key not in summaries:
+                summaries[key] = MetricSummary(*key)
+            summaries[key].add(record)
+
+        return sorted(summaries.values(), key=lambda summary: summary.wall_time_total, reverse=True)
+
+    @classmethod
+    def to_report(cls) -> dict[str, Any]:
+        """Builds the JSON run report: every record and the aggregates per scope, slowest first."""
+        return {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "summary": {
+                scope.value: [
+                    {key: value for key, value in asdict(summary).items() if key != "records"}
+                    for summary in cls.summarize(scope)
+                ]
+                for scope in MetricScope
+            },
+            "records": [asdict(record) for record in cls.records()],
+        }
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """Renders the aggregates in the Prometheus text exposition format."""
+        summaries = cls.summarize()
+        lines = []
+        for metric, metric_type, description, attribute in _PROMETHEUS_METRICS:
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {metric_type}"]
+            for summary in summaries:
+                labels = {
+                    "scope": summary.scope,
+                    "name": summary.name,
+                    "pipeline": summary.pipeline or "",
+                    "phase": summary.phase or "",
+                }
+                label_text = ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items())
+                lines.append(f"{metric}{{{label_text}}} {getattr(summary, attribute)}")
+
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def export(cls, report_path: str | None = None, prometheus_path: str | None = None) -> None:
+        """Writes the JSON run report and/or the Prometheus text file."""
+        if report_path:
+            Path(report_path).write_text(json.dumps(cls.to_report(), indent=2), encoding="utf-8")
+            logging.info("Metrics report written to `%s`.", report_path)
+
+        if prometheus_path:
+            Path(prometheus_path).write_text(cls.to_prometheus(), encoding="utf-8")
+            logging.info("Prometheus metrics written to `%s`.", prometheus_path)
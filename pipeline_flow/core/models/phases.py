@@ -1,8 +1,9 @@
 # Standard Imports
 from __future__ import annotations
 
+import uuid
 from enum import StrEnum, unique
-from typing import Annotated, Self
+from typing import Annotated, Any, Self
 
 # Project Imports
 from pydantic import (
@@ -39,6 +40,25 @@ class PipelinePhase(StrEnum):
     TRANSFORM_AT_LOAD_PHASE = "transform_at_load"
 
 
+@unique
+class TransformExecutorType(StrEnum):
+    """Where the transformation chain of a pipeline is executed."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+    INLINE = "inline"
+
+
+@unique
+class PostProcessMode(StrEnum):
+    """How the post-processing steps of the extract phase are executed."""
+
+    # Sequentially, each step receives the output of the previous one.
+    CHAIN = "chain"
+    # Concurrently, every step receives the extracted data, which is passed on unchanged.
+    FAN_OUT = "fan_out"
+
+
 class ExtractPhase(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     steps: Annotated[
@@ -56,6 +76,7 @@ class ExtractPhase(BaseModel):
         list[IPostProcessPlugin] | None,
         BeforeValidator(serialize_plugins),
     ] = None
+    post_mode: PostProcessMode = PostProcessMode.CHAIN
 
     merge: Annotated[
         IMergeExtractPlugin | None,
@@ -80,6 +101,13 @@ class TransformPhase(BaseModel):
         BeforeValidator(serialize_plugins),
     ]
 
+    # Overrides the global `transform_executor` for this pipeline.
+    executor: TransformExecutorType | None = None
+
+    # Splits the data into chunks that are transformed in parallel.
+    # Only safe for transformations that treat rows independently.
+    chunks: Annotated[int, Field(ge=1)] = 1
+
 
 class LoadPhase(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -106,3 +134,53 @@ class TransformLoadPhase(BaseModel):
         Field(min_length=1),
         BeforeValidator(serialize_plugins),
     ]
+
+    # The ids of the steps that each step waits for, collected from the `needs` of the steps.
+    # Without any, the steps run one after another in the declared order.
+    dependencies: dict[str, list[str]] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_step_needs(cls, data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict) or not isinstance(data.get("steps"), list):
+            return data
+
+        steps, dependencies = [], dict(data.get("dependencies") or {})
+        for step in data["steps"]:
+            if isinstance(step, dict) and "needs" in step:
+                step = dict(step)  # noqa: PLW2901 - The payload of the caller is left untouched.
+                needs = step.pop("needs")
+                # A step needs an id to be tracked in the dependency graph, even if no other step refers to it.
+                step.setdefault("id", f"{step.get('plugin')}_{uuid.uuid4().hex[:16]}")
+                dependencies[step["id"]] = [needs] if isinstance(needs, str) else list(needs)
+            steps.append(step)
+
+        return {**data, "steps": steps, "dependencies": dependencies}
+
+    @model_validator(mode="after")
+    def check_dependencies(self: Self) -> Self:
+        if not self.dependencies:
+            return self
+
+        step_ids = [step.id for step in self.steps]
+        if len(set(step_ids)) != len(step_ids):
+            raise ValueError("Validation Error! Steps must have unique ids when `needs` is used in transform_at_load.")
+
+        unknown_steps = {need for needs in self.dependencies.values() for need in needs} - set(step_ids)
+        if unknown_steps:
+            msg = f"Validation Error! Transform at load steps depend on unknown steps: {sorted(unknown_steps)}."
+            raise ValueError(msg)
+
+        # Repeatedly removes the steps without pending dependencies, whatever remains is part of a cycle.
+        remaining = {step_id: set(self.dependencies.get(step_id, ())) for step_id in step_ids}
+        while ready := [step_id for step_id, needs in remaining.items() if not needs]:
+            for step_id in ready:
+                del remaining[step_id]
+            for needs in remaining.values():
+                needs.difference_update(ready)
+
+        if remaining:
+            msg = f"Validation Error! Circular dependency between transform at load steps: {sorted(remaining)}."
+            raise ValueError(msg)
+
+        return self
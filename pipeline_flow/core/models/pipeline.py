@@ -1,9 +1,10 @@
 import logging
 from enum import StrEnum, unique
-from typing import Annotated, cast
+from typing import Annotated, Self, cast
 
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
+from pipeline_flow.common.utils.validation import parse_byte_size
 from pipeline_flow.core.models.phases import (
     ExtractPhase,
     LoadPhase,
@@ -12,6 +13,7 @@ from pipeline_flow.core.models.phases import (
     TransformLoadPhase,
     TransformPhase,
 )
+from pipeline_flow.plugins import IPlugin
 
 
 @unique
@@ -23,6 +25,16 @@ class PipelineType(StrEnum):
     ETLT = "ETLT"
 
 
+@unique
+class SchedulingMode(StrEnum):
+    """The order in which the orchestrator starts the ready pipelines of the same priority."""
+
+    # In the order they became ready, which is the declaration order for pipelines without `needs`.
+    FIFO = "fifo"
+    # Longest remaining critical path first, based on the durations of the previous runs.
+    CRITICAL_PATH = "critical_path"
+
+
 MANDATORY_PHASES_BY_PIPELINE_TYPE = {
     PipelineType.ETL: {
         PipelinePhase.EXTRACT_PHASE: True,
@@ -43,6 +55,17 @@ MANDATORY_PHASES_BY_PIPELINE_TYPE = {
 }
 
 
+# Number of chunks buffered between two phases when a pipeline runs in streaming mode.
+DEFAULT_STREAM_QUEUE_SIZE = 8
+
+
+class PipelineResources(BaseModel):
+    """The resources a pipeline declares it uses, for the admission control of the orchestrator."""
+
+    memory: Annotated[int | None, "Memory in bytes, e.g. `2GB`", BeforeValidator(parse_byte_size), Field(gt=0)] = None
+    cpu: Annotated[float | None, "Number of CPU cores", Field(gt=0)] = None
+
+
 class Pipeline(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -53,6 +76,16 @@ class Pipeline(BaseModel):
     # Optional
     description: str | None = None
     needs: str | list[str] | None = None
+    priority: Annotated[int, "Ready pipelines with a higher priority start first"] = 0
+    streaming: Annotated[bool, "Stream chunks from the extract plugin through the transform and load phases"] = False
+    stream_queue_size: Annotated[int, Field(gt=0)] = DEFAULT_STREAM_QUEUE_SIZE
+    memory_budget: Annotated[
+        int | None,
+        "Phase outputs larger than this many bytes are spilled to disk, e.g. `512MB`",
+        BeforeValidator(parse_byte_size),
+        Field(gt=0),
+    ] = None
+    resources: PipelineResources | None = None
 
     # Private
     _is_executed: bool = False
@@ -81,6 +114,18 @@ class Pipeline(BaseModel):
     def load_transform(self) -> TransformLoadPhase:
         return cast(TransformLoadPhase, self.phases[PipelinePhase.TRANSFORM_AT_LOAD_PHASE])
 
+    @property
+    def plugins(self) -> list[IPlugin]:
+        """Every plugin of the pipeline, across the steps, pre, merge and post-processing of all its phases."""
+        plugins: list[IPlugin] = []
+        for phase in self.phases.values():
+            plugins.extend(getattr(phase, "pre", None) or [])
+            plugins.extend(phase.steps)
+            if merge := getattr(phase, "merge", None):
+                plugins.append(merge)
+            plugins.extend(getattr(phase, "post", None) or [])
+        return plugins
+
     @field_validator("phases")
     @classmethod
     def validate_phase_existence(
@@ -116,3 +161,20 @@ class Pipeline(BaseModel):
         msg = f"Phase validation successful for pipeline type '{pipeline_type}'"
         logging.info(msg)
         return phases
+
+    @model_validator(mode="after")
+    def validate_streaming(self) -> Self:
+        if not self.streaming:
+            return self
+
+        if len(self.extract.steps) != 1:
+            raise ValueError("Validation Error! Streaming mode requires exactly one extract step.")
+
+        if self.extract.post:
+            raise ValueError("Validation Error! Extract post-processing is not supported in streaming mode.")
+
+        # Load post-processing sees the whole dataset, which a streaming pipeline never holds.
+        if self.load.post:
+            raise ValueError("Validation Error! Load post-processing is not supported in streaming mode.")
+
+        return self
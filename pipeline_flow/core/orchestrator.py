@@ -1,75 +1,302 @@
 # Standard Imports
 import asyncio
+import copy
+import itertools
 import logging
+from collections import defaultdict
+from contextlib import AbstractAsyncContextManager, nullcontext
+from pathlib import Path
+from statistics import fmean
 
 # Third Party Imports
 # Project Imports
+from pipeline_flow.core.admission import AdmissionController
+from pipeline_flow.core.context import PipelineContext
 from pipeline_flow.core.executor import PIPELINE_STRATEGY_MAP
-from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.loop_guard import SyncPluginPool
+from pipeline_flow.core.metrics import Measurement, MetricScope
+from pipeline_flow.core.models.pipeline import Pipeline, SchedulingMode
 from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.resource_pools import ResourcePools
+from pipeline_flow.core.run_history import RunHistory
+from pipeline_flow.core.run_journal import PipelineStatus, RunJournal, new_run_id
+from pipeline_flow.core.spill import DEFAULT_SPILL_DIR, SpillManager
+from pipeline_flow.core.transform_pool import TransformProcessPool
 
 
 class PipelineOrchestrator:
     """Emphasizes the role of the class in executing the pipelines."""
 
-    def __init__(self, config: YamlConfig) -> None:
+    def __init__(self, config: YamlConfig, resume_run_id: str | None = None) -> None:
         self.concurrency = config.concurrency
-        self.pipeline_queue = asyncio.Queue()
+        # Ready pipelines, ordered by their rank and then by the order they became ready.
+        self.pipeline_queue = asyncio.PriorityQueue()
+        self.scheduling = config.scheduling
         self.semaphore = asyncio.Semaphore(config.concurrency)
+        self.transform_executor = config.transform_executor
+
+        TransformProcessPool.configure(config.transform_workers)
+        SyncPluginPool.configure(config.plugin_workers)
+        # Limits shared by the plugins referencing them, e.g. the concurrency and request rate of an API.
+        ResourcePools.configure(config.resource_pools)
+
+        # Persists the state of the plugins between runs, e.g. the watermarks of incremental extracts.
+        self.state_store = (
+            PluginRegistry.instantiate_plugin(copy.deepcopy(config.state_store)) if config.state_store else None
+        )
+
+        # Records the progress of the run, so that a failed run can be resumed with its run id.
+        if resume_run_id and config.journal is None:
+            raise ValueError("Resuming a run requires the `journal` section in the configuration.")
+
+        self.run_id = resume_run_id or new_run_id()
+        self.journal = RunJournal.from_config(config.journal, self.run_id) if config.journal is not None else None
+
+        # Phase outputs over the memory budget of a pipeline are spilled to disk.
+        self.memory_budget = config.memory_budget
+        self.spill_dir = config.spill_dir or DEFAULT_SPILL_DIR
+        self.spill_format = config.spill_format
+
+        # Admits pipelines by their memory and CPU footprints, learned from their previous runs.
+        self.admission = AdmissionController.from_config(config.admission) if config.admission is not None else None
+
+        # Learns the duration and footprint of every pipeline, for the admission control and the critical path.
+        has_history = (
+            config.run_history is not None
+            or self.admission is not None
+            or self.scheduling == SchedulingMode.CRITICAL_PATH
+        )
+        self.history = RunHistory.from_config(config.run_history or {}) if has_history else None
+
+        # Dependency graph state, populated by `execute_pipelines`.
+        self._in_degree: dict[str, int] = {}
+        self._dependents: dict[str, list[Pipeline]] = defaultdict(list)
+        self._executed_pipelines: set[str] = set()
+        self._topological_order: list[str] = []
+        self._ranks: dict[str, tuple[int, float]] = {}
+        self._sequence = itertools.count()
+        # The running pipelines, and whether each has run alone so far.
+        self._running: dict[str, bool] = {}
 
     @staticmethod
-    def _can_execute(pipeline: Pipeline, executed_pipelines: set[str]) -> bool:
-        """A function that checks if a given pipeline is executable or has an external dependency."""
+    def _get_dependencies(pipeline: Pipeline) -> set[str]:
+        """Normalises the `needs` attribute of a pipeline into a set of pipeline names."""
         if pipeline.needs is None:
-            return True
+            return set()
         if isinstance(pipeline.needs, str):
-            return pipeline.needs in executed_pipelines
-        if isinstance(pipeline.needs, list):
-            return all(need in executed_pipelines for need in pipeline.needs)
-        return False
+            return {pipeline.needs}
+        return set(pipeline.needs)
+
+    def _build_dependency_graph(self, pipelines: list[Pipeline]) -> list[Pipeline]:
+        """Builds the in-degree counts and the reverse edges of the pipeline dependency graph.
+
+        Args:
+            pipelines (list[Pipeline]): The pipelines to schedule.
+
+        Raises:
+            ValueError: If a pipeline depends on an unknown pipeline or the graph contains a cycle.
+
+        Returns:
+            list[Pipeline]: The pipelines without any dependencies, in declaration order.
+        """
+        pipeline_names = {pipeline.name for pipeline in pipelines}
+
+        self._in_degree = {}
+        self._dependents = defaultdict(list)
+        self._executed_pipelines = set()
+        self._topological_order = []
+
+        for pipeline in pipelines:
+            dependencies = self._get_dependencies(pipeline)
+
+            unknown_dependencies = dependencies - pipeline_names
+            if unknown_dependencies:
+                msg = f"Pipeline `{pipeline.name}` depends on unknown pipelines: {sorted(unknown_dependencies)}."
+                raise ValueError(msg)
+
+            self._in_degree[pipeline.name] = len(dependencies)
+            for dependency in dependencies:
+                self._dependents[dependency].append(pipeline)
+
+        # Kahn's algorithm to detect cycles before any pipeline is started.
+        in_degree = self._in_degree.copy()
+        ready = [pipeline.name for pipeline in pipelines if in_degree[pipeline.name] == 0]
+        while ready:
+            name = ready.pop()
+            self._topological_order.append(name)
+            for dependent in self._dependents[name]:
+                in_degree[dependent.name] -= 1
+                if in_degree[dependent.name] == 0:
+                    ready.append(dependent.name)
+
+        if len(self._topological_order) != len(pipelines):
+            raise ValueError("Circular dependency detected!")
+
+        return [pipeline for pipeline in pipelines if self._in_degree[pipeline.name] == 0]
+
+    @staticmethod
+    def _check_resource_pools(pipelines: list[Pipeline]) -> None:
+        """Checks that every plugin references a declared resource pool, before any pipeline is started.
+
+        Raises:
+            ValueError: If a plugin references a resource pool not declared in `resource_pools`.
+        """
+        for pipeline in pipelines:
+            for plugin in pipeline.plugins:
+                if plugin.resource_pool is not None and not ResourcePools.is_declared(plugin.resource_pool):
+                    msg = (
+                        f"Plugin `{plugin.id}` of pipeline `{pipeline.name}` references the resource pool "
+                        f"`{plugin.resource_pool}`, which is not declared in `resource_pools`."
+                    )
+                    raise ValueError(msg)
+
+    def _rank_pipelines(self, pipelines: list[Pipeline]) -> None:
+        """Ranks the pipelines by priority and, in the `critical_path` mode, by their remaining critical path.
+
+        A pipeline inherits the highest priority of the pipelines that need it, so that a high priority pipeline
+        is never held back by a low priority dependency. The remaining critical path of a pipeline is its duration
+        plus the longest remaining critical path of the pipelines that need it. Durations are learned from the
+        previous runs, a pipeline that never ran is assumed to take the average duration of the others.
+        """
+        is_critical_path = self.scheduling == SchedulingMode.CRITICAL_PATH and self.history is not None
+        profiles = self.history.get_many([pipeline.name for pipeline in pipelines]) if is_critical_path else {}
+        default_duration = fmean(profile.duration for profile in profiles.values()) if profiles else 1.0
+
+        pipelines_by_name = {pipeline.name: pipeline for pipeline in pipelines}
+        priorities: dict[str, int] = {}
+        critical_paths: dict[str, float] = {}
+        # Every pipeline is ranked after the pipelines that need it.
+        for name in reversed(self._topological_order):
+            dependents = self._dependents.get(name, [])
+            priorities[name] = max([pipelines_by_name[name].priority, *(priorities[d.name] for d in dependents)])
+
+            duration = profiles[name].duration if name in profiles else default_duration
+            critical_paths[name] = duration + max((critical_paths[d.name] for d in dependents), default=0.0)
+
+        self._ranks = {
+            name: (-priorities[name], -critical_paths[name] if is_critical_path else 0.0) for name in priorities
+        }
+        if is_critical_path:
+            logging.debug("Remaining critical paths in seconds: %s", critical_paths)
 
     async def pipeline_queue_producer(self, pipelines: list[Pipeline]) -> None:
         for pipeline in pipelines:
             logging.debug("Adding %s to central pipeline queue", pipeline.name)
-            await self.pipeline_queue.put(pipeline)
+            rank = self._ranks.get(pipeline.name, (-pipeline.priority, 0.0))
+            await self.pipeline_queue.put((rank, next(self._sequence), pipeline))
             logging.debug("Added %s to central pipeline queue", pipeline.name)
 
-    async def _execute_pipeline(self) -> None:
-        if self.pipeline_queue.empty():
+    async def _release_dependents(self, pipeline: Pipeline) -> None:
+        """Marks a pipeline as executed and queues every dependent whose `needs` are now met."""
+        self._executed_pipelines.add(pipeline.name)
+
+        ready_pipelines = []
+        for dependent in self._dependents.get(pipeline.name, []):
+            self._in_degree[dependent.name] -= 1
+            if self._in_degree[dependent.name] == 0:
+                ready_pipelines.append(dependent)
+
+        await self.pipeline_queue_producer(ready_pipelines)
+
+    def _spill_manager(self, pipeline: Pipeline) -> SpillManager | None:
+        """Returns the spill manager of the pipeline, or None if it has no memory budget."""
+        memory_budget = pipeline.memory_budget or self.memory_budget
+        if memory_budget is None:
+            return None
+
+        directory = Path(self.spill_dir) / self.run_id / pipeline.name
+        return SpillManager(str(directory), memory_budget, self.spill_format)
+
+    async def _admit(self, pipeline: Pipeline) -> AbstractAsyncContextManager:
+        """Returns a context manager holding the footprint of the pipeline in the admission budget."""
+        if self.admission is None:
+            return nullcontext()
+
+        learned = await asyncio.to_thread(self.history.get, pipeline.name) if self.history else None
+        rank = self._ranks.get(pipeline.name, (-pipeline.priority, 0.0))
+        return self.admission.admit(pipeline.name, self.admission.footprint(pipeline, learned), rank)
+
+    def _start_running(self, name: str) -> None:
+        # A pipeline starting next to others makes all of them concurrent, which their footprints cannot tell apart.
+        ran_alone = not self._running
+        for other in self._running:
+            self._running[other] = False
+        self._running[name] = ran_alone
+
+    async def _execute_pipeline(self, pipeline: Pipeline) -> None:
+        journal = await asyncio.to_thread(self.journal.pipeline, pipeline.name) if self.journal else None
+        if journal and journal.is_completed:
+            logging.info("Skipping: %s, it completed in a previous attempt of run `%s`.", pipeline.name, self.run_id)
+            pipeline.is_executed = True
             return
 
-        async with self.semaphore:
-            while not self.pipeline_queue.empty():
-                pipeline = await self.pipeline_queue.get()
+        # Admitted before taking a concurrency slot, so a pipeline waiting for its footprint never holds one.
+        async with await self._admit(pipeline), self.semaphore:
+            logging.info("Executing: %s ", pipeline.name)
+            strategy = PIPELINE_STRATEGY_MAP[pipeline.type]
+            spill = self._spill_manager(pipeline)
+            context = PipelineContext(pipeline.name, self.state_store, journal, spill)
+            self._start_running(pipeline.name)
+            try:
+                with Measurement(MetricScope.PIPELINE, pipeline.name) as measurement, context.activate():
+                    pipeline.is_executed = await strategy(self.transform_executor).execute(pipeline)
+            except Exception:
+                self._running.pop(pipeline.name)
+                if journal:
+                    await asyncio.to_thread(journal.record_status, PipelineStatus.FAILED)
+                elif spill:
+                    # A journaled run keeps the spilled data, which the resumed run restores.
+                    await asyncio.to_thread(spill.cleanup)
+                raise
+
+            ran_alone = self._running.pop(pipeline.name)
+            if spill:
+                await asyncio.to_thread(spill.cleanup)
 
-                logging.info("Executing: %s ", pipeline.name)
-                strategy = PIPELINE_STRATEGY_MAP[pipeline.type]
-                pipeline.is_executed = await strategy().execute(pipeline)
-                logging.info("Completed: %s", pipeline.name)
+            # The state is only persisted once the whole pipeline succeeded, so a failed run is extracted again.
+            await asyncio.to_thread(context.commit)
+            if self.history:
+                await asyncio.to_thread(self.history.record, pipeline.name, measurement.record, ran_alone=ran_alone)
+            if journal:
+                await asyncio.to_thread(journal.record_status, PipelineStatus.COMPLETED)
+            logging.info("Completed: %s", pipeline.name)
 
+    async def _pipeline_worker(self) -> None:
+        """Consumes ready pipelines from the queue until it is cancelled."""
+        while True:
+            *_, pipeline = await self.pipeline_queue.get()
+            try:
+                await self._execute_pipeline(pipeline)
+                await self._release_dependents(pipeline)
+            finally:
                 self.pipeline_queue.task_done()
 
     async def execute_pipelines(self, pipelines: list[Pipeline]) -> set[str]:
-        """Asynchronously executes parsed jobs."""
+        """Asynchronously executes parsed jobs.
+
+        Pipelines are started as soon as the last pipeline listed in their `needs` finishes,
+        while the number of concurrently running pipelines is bounded by `concurrency`.
+        """
         if not pipelines:
             raise ValueError("The Pipeline list is empty. There is nothing to execute.")
 
-        executed_pipelines = set()
-        while pipelines:
-            executable_pipelines = [
-                pipeline for pipeline in pipelines if self._can_execute(pipeline, executed_pipelines)
-            ]
+        self._check_resource_pools(pipelines)
+        root_pipelines = self._build_dependency_graph(pipelines)
+        await asyncio.to_thread(self._rank_pipelines, pipelines)
+
+        if self.journal:
+            logging.info("Starting run `%s`, a failed run can be resumed with its run id.", self.run_id)
 
-            if not executable_pipelines:
-                raise ValueError("Circular dependency detected!")
+        # Produces a central queue of executable pipelines
+        await self.pipeline_queue_producer(root_pipelines)
 
-            # Produces a central queue of executable pipelines
-            await self.pipeline_queue_producer(executable_pipelines)
+        async with asyncio.TaskGroup() as tg:
+            workers = [tg.create_task(self._pipeline_worker()) for _ in range(self.concurrency)]
 
-            async with asyncio.TaskGroup() as tg:
-                tasks = [tg.create_task(self._execute_pipeline()) for _ in range(self.concurrency)]  # noqa: F841
+            await self.pipeline_queue.join()
 
-            executed_pipelines.update(pipeline.name for pipeline in executable_pipelines)
-            pipelines = [pipeline for pipeline in pipelines if not pipeline.is_executed]
+            for worker in workers:
+                worker.cancel()
 
-        return executed_pipelines
+        return self._executed_pipelines
@@ -1,6 +1,14 @@
 from .pipeline_parser import parse_pipelines
 from .plugin_parser import PluginParser
-from .secret_parser import SecretReference, secret_parser, secret_resolver
+from .secret_parser import SecretReference, resolve_secrets_concurrently, secret_parser, secret_resolver
 from .yaml_parser import YamlParser
 
-__all__ = ["PluginParser", "SecretReference", "YamlParser", "parse_pipelines", "secret_parser", "secret_resolver"]
+__all__ = [
+    "PluginParser",
+    "SecretReference",
+    "YamlParser",
+    "parse_pipelines",
+    "resolve_secrets_concurrently",
+    "secret_parser",
+    "secret_resolver",
+]
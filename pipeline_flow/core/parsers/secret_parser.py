@@ -2,18 +2,28 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from pydantic.dataclasses import dataclass
 
 # Local Imports
 from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.secret_cache import SecretCache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pipeline_flow.common.type_def import PluginPayload
     from pipeline_flow.plugins import ISecretManager
 
 
+# The maximum number of secrets fetched concurrently.
+SECRET_FETCH_WORKERS = 16
+
+type SecretKey = tuple[str, str | None]
+
+
 @dataclass
 class SecretReference:
     """Represents a parsed secret reference with optional nested path."""
@@ -29,15 +39,21 @@ class SecretReference:
         key_path = parts[1] if len(parts) > 1 else None
         return cls(secret_id=secret_id, key_path=key_path)
 
+    @property
+    def key(self) -> SecretKey:
+        return (self.secret_id, self.key_path)
+
 
 def secret_resolver(secret_provider: ISecretManager, secret_ref: SecretReference) -> str:
-    """Fetches the secret value by secret_name."""
+    """Fetches the secret value by secret_name.
+
+    Values are served from the `SecretCache`, so every secret is fetched from its provider once within its TTL.
+    """
 
     if secret_ref.key_path is not None and secret_ref.key_path.lower() == "resource_id":
-        # Fetch the
-        return secret_provider.resource_id
+        return SecretCache.get_or_fetch(f"{secret_provider.cache_key}#resource_id", lambda: secret_provider.resource_id)
     try:
-        reference = secret_provider()
+        reference = SecretCache.get_or_fetch(secret_provider.cache_key, secret_provider)
     except Exception as e:
         error_msg = f"Failed to retrieve secret '{secret_ref.secret_id}': {e}"
         logging.error(error_msg)
@@ -68,6 +84,31 @@ def secret_resolver(secret_provider: ISecretManager, secret_ref: SecretReference
         raise ValueError(error_msg) from e
 
 
+def resolve_secrets_concurrently(
+    secret_providers: dict[str, ISecretManager], secret_refs: Iterable[SecretReference]
+) -> dict[SecretKey, Any]:
+    """Resolves the secret references on a thread pool, each distinct reference once.
+
+    A configuration with many secrets costs a single round-trip of latency rather than one per secret.
+
+    Args:
+        secret_providers (dict[str, ISecretManager]): The secret providers by their secret id.
+        secret_refs (Iterable[SecretReference]): The references to resolve, their secrets must be defined.
+
+    Returns:
+        dict[SecretKey, Any]: The resolved values by the `key` of their reference.
+    """
+    pending = {secret_ref.key: secret_ref for secret_ref in secret_refs}
+    if not pending:
+        return {}
+
+    def resolve(secret_ref: SecretReference) -> Any:  # noqa: ANN401
+        return secret_resolver(secret_providers[secret_ref.secret_id], secret_ref)
+
+    with ThreadPoolExecutor(max_workers=min(SECRET_FETCH_WORKERS, len(pending))) as executor:
+        return dict(zip(pending, executor.map(resolve, pending.values()), strict=True))
+
+
 def secret_parser(document: PluginPayload) -> dict[str, ISecretManager]:
     secrets = {}
 
@@ -0,0 +1,169 @@
+# Standard Imports
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Local Imports
+from pipeline_flow.common.utils import is_private_path
+from pipeline_flow.core.parsers.secret_parser import SecretReference, resolve_secrets_concurrently
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pipeline_flow.common.type_def import PluginPayload
+    from pipeline_flow.plugins import ISecretManager
+
+# Enables the compiled configuration cache in this directory.
+YAML_CACHE_DIR_ENV = "PIPELINE_FLOW_YAML_CACHE_DIR"
+
+# Bumped whenever the parsed structure changes, so that stale entries are never loaded.
+CACHE_FORMAT_VERSION = 2
+
+# Tags the `SecretReference` placeholders in the cached JSON.
+SECRET_REFERENCE_TAG = "$secret_reference"  # noqa: S105 - A JSON tag, not a secret.
+
+
+@dataclass
+class CompiledConfig:
+    """A parsed and variable-substituted configuration, with its secrets left as `SecretReference` placeholders.
+
+    Attributes:
+        secrets (PluginPayload): The definitions of the secret providers, not their values.
+        document (dict): The root document of the configuration.
+    """
+
+    secrets: PluginPayload
+    document: dict
+
+
+def config_fingerprint(content: str | bytes, env_vars: Iterable[str]) -> str:
+    """Hashes the configuration together with the environment variables it references.
+
+    Variables are defined within the configuration, so they are covered by its hash.
+
+    Args:
+        content (str | bytes): The YAML configuration.
+        env_vars (Iterable[str]): The names of the environment variables referenced by the configuration.
+
+    Returns:
+        str: A hex digest that changes whenever the parsed configuration could change.
+    """
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}\0".encode())
+    digest.update(content.encode() if isinstance(content, str) else content)
+    for name in sorted(set(env_vars)):
+        digest.update(f"\0{name}={os.environ.get(name)}".encode())
+    return digest.hexdigest()
+
+
+def _encode_secret_reference(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, SecretReference):
+        return {SECRET_REFERENCE_TAG: [value.secret_id, value.key_path]}
+    msg = f"Object of type {type(value).__name__} cannot be cached."
+    raise TypeError(msg)
+
+
+def _decode_secret_reference(value: dict) -> Any:  # noqa: ANN401
+    if value.keys() == {SECRET_REFERENCE_TAG}:
+        secret_id, key_path = value[SECRET_REFERENCE_TAG]
+        return SecretReference(secret_id=secret_id, key_path=key_path)
+    return value
+
+
+class CompiledConfigCache:
+    """Stores compiled configurations as JSON files in a private directory, one file per fingerprint.
+
+    Entries hold the substituted environment variables, so they are only readable by the current user. They are
+    only loaded from a directory owned by the current user and not writable by anyone else, as a tampered entry
+    could point the pipelines at any plugin.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> CompiledConfig | None:
+        """Returns the compiled configuration stored under `key`, or None on a cache miss."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        if not is_private_path(path):
+            logging.warning("Ignoring the compiled configuration `%s`, it is writable by other users.", path)
+            return None
+
+        try:
+            with path.open(encoding="utf-8") as file:
+                compiled = CompiledConfig(**json.load(file, object_hook=_decode_secret_reference))
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning("Ignoring the compiled configuration `%s`, it cannot be read: %s", path, e)
+            return None
+
+        logging.info("Loaded the compiled configuration from `%s`.", path)
+        return compiled
+
+    def store(self, key: str, compiled: CompiledConfig) -> None:
+        """Stores the compiled configuration under `key`, failures only log a warning.
+
+        Configurations that do not survive a JSON round trip, e.g. with non-string keys, are not cached.
+        """
+        path = self._path(key)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            content = json.dumps(
+                {"secrets": compiled.secrets, "document": compiled.document}, default=_encode_secret_reference
+            )
+            if CompiledConfig(**json.loads(content, object_hook=_decode_secret_reference)) != compiled:
+                logging.debug("The compiled configuration cannot be cached as JSON, it is not stored.")
+                return
+
+            # The document holds the values of the environment variables, so only the current user can read it.
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.cache_dir.chmod(0o700)
+            fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            temporary_path.replace(path)
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning("Failed to store the compiled configuration in `%s`: %s", path, e)
+            temporary_path.unlink(missing_ok=True)
+
+
+def _find_secret_references(data: Any) -> Iterable[SecretReference]:  # noqa: ANN401
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, SecretReference):
+            yield value
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def resolve_secret_references(document: dict, secret_providers: dict[str, ISecretManager]) -> dict:
+    """Returns a copy of the document with every `SecretReference` replaced by its value.
+
+    The secrets are resolved concurrently, each distinct reference once.
+    """
+    resolved = resolve_secrets_concurrently(secret_providers, _find_secret_references(document))
+    if not resolved:
+        return document
+
+    def substitute(value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, SecretReference):
+            return resolved[value.key]
+        if isinstance(value, dict):
+            return {key: substitute(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [substitute(item) for item in value]
+        return value
+
+    return substitute(document)
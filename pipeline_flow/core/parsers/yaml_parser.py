@@ -1,6 +1,7 @@
 # Standard Imports
 from __future__ import annotations
 
+import copy
 import os
 import re
 from dataclasses import dataclass
@@ -9,10 +10,28 @@ from typing import TYPE_CHECKING
 
 # Third Party Imports
 import yamlcore
+from yaml.nodes import CollectionNode, MappingNode, ScalarNode
 
 # Local Imports
 from pipeline_flow.common.utils import SingletonMeta
-from pipeline_flow.core.parsers import SecretReference, secret_parser, secret_resolver
+from pipeline_flow.common.utils.validation import parse_byte_size
+from pipeline_flow.core.loop_guard import DEFAULT_BLOCKING_THRESHOLD
+from pipeline_flow.core.models.phases import TransformExecutorType
+from pipeline_flow.core.models.pipeline import SchedulingMode
+from pipeline_flow.core.parsers import (
+    SecretReference,
+    resolve_secrets_concurrently,
+    secret_parser,
+    secret_resolver,
+)
+from pipeline_flow.core.parsers.yaml_cache import (
+    YAML_CACHE_DIR_ENV,
+    CompiledConfig,
+    CompiledConfigCache,
+    config_fingerprint,
+    resolve_secret_references,
+)
+from pipeline_flow.core.spill import SpillFormat
 
 # Type Imports
 if TYPE_CHECKING:
@@ -20,7 +39,7 @@ if TYPE_CHECKING:
 
     from yaml.nodes import Node
 
-    from pipeline_flow.common.type_def import PluginRegistryJSON, StreamType
+    from pipeline_flow.common.type_def import PluginPayload, PluginRegistryJSON, StreamType
 
 
 type JSON_DATA = dict
@@ -43,20 +62,52 @@ class YamlAttribute(StrEnum):
     PIPELINES = "pipelines"
     PLUGINS = "plugins"
     CONCURRENCY = "concurrency"
+    TRANSFORM_EXECUTOR = "transform_executor"
+    TRANSFORM_WORKERS = "transform_workers"
+    PLUGIN_WORKERS = "plugin_workers"
+    METRICS = "metrics"
+    TRACING = "tracing"
+    LOOP_MONITOR = "loop_monitor"
+    STATE_STORE = "state_store"
+    JOURNAL = "journal"
+    SPILL = "spill"
+    ADMISSION = "admission"
+    SCHEDULING = "scheduling"
+    RUN_HISTORY = "run_history"
+    RESOURCE_POOLS = "resource_pools"
 
 
 @dataclass(frozen=True)
 class YamlConfig(metaclass=SingletonMeta):
     concurrency: int = DEFAULT_CONCURRENCY
+    transform_executor: TransformExecutorType = TransformExecutorType.THREAD
+    transform_workers: int | None = None
+    plugin_workers: int | None = None
+    metrics_report: str | None = None
+    metrics_prometheus: str | None = None
+    tracing_file: str | None = None
+    loop_blocking_threshold: float | None = None
+    state_store: PluginPayload | None = None
+    journal: dict | None = None
+    memory_budget: int | None = None
+    spill_dir: str | None = None
+    spill_format: SpillFormat = SpillFormat.ARROW
+    admission: dict | None = None
+    scheduling: SchedulingMode = SchedulingMode.FIFO
+    run_history: dict | None = None
+    resource_pools: dict | None = None
 
 
 class ExtendedCoreLoader(yamlcore.CCoreLoader):
     """An extension of YAML 1.2 Compliant Loader to handle boolean values like `on` or `off`."""
 
-    def __init__(self: Self, stream: StreamType) -> None:
+    def __init__(self: Self, stream: StreamType, *, defer_secrets: bool = False) -> None:
         super().__init__(stream)
         self.secrets = {}
         self.variables = {}
+        self.resolved_secrets = {}
+        # Deferred secrets are constructed as `SecretReference` placeholders, to be resolved after construction.
+        self.defer_secrets = defer_secrets
 
     def update_variables(self: Self, new_variables: dict[str, str]) -> None:
         """Update the variables dynamically after initialization."""
@@ -65,6 +116,54 @@ class ExtendedCoreLoader(yamlcore.CCoreLoader):
     def update_secrets(self: Self, new_secrets: dict[str, str]) -> None:
         """Update the secrets dynamically after initialization."""
         self.secrets.update(new_secrets)
+        # Values resolved through a redefined secret are stale.
+        self.resolved_secrets = {
+            key: value for key, value in self.resolved_secrets.items() if key[0] not in new_secrets
+        }
+
+    def get_data(self: Self) -> JSON_DATA:
+        """Constructs the next document, after the secrets it references are resolved concurrently."""
+        node = self.get_node()
+        self.resolve_secrets(node)
+        return self.construct_document(node)
+
+    def resolve_secrets(self: Self, node: Node) -> None:
+        """Resolves every known secret referenced in the node tree, concurrently.
+
+        References to unknown secrets are left to the constructor, which raises the error.
+        Nothing is resolved while secrets are deferred.
+
+        Args:
+            node (Node): The root node of a composed YAML document.
+        """
+        if self.defer_secrets:
+            return
+
+        pending = []
+        for secret_node in self._find_secret_nodes(node):
+            secret_ref = SecretReference.parse(SECRET_PATTERN.match(secret_node.value).group(1))
+            if secret_ref.secret_id in self.secrets and secret_ref.key not in self.resolved_secrets:
+                pending.append(secret_ref)
+
+        self.resolved_secrets.update(resolve_secrets_concurrently(self.secrets, pending))
+
+    @staticmethod
+    def _find_secret_nodes(root: Node) -> Generator[ScalarNode, None, None]:
+        # Iterative, as documents with thousands of plugins can be nested deeper than the recursion limit.
+        stack, seen = [root], set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:  # Aliases share their node with the anchor.
+                continue
+            seen.add(id(node))
+
+            if isinstance(node, ScalarNode):
+                if node.tag == SECRET_YAML_TAG:
+                    yield node
+            elif isinstance(node, MappingNode):
+                stack.extend(item for pair in node.value for item in pair)
+            elif isinstance(node, CollectionNode):
+                stack.extend(node.value)
 
     def substitute_env_var_placeholder(self: Self, node: Node) -> str:
         """Parses a YAML node for an env var reference and replaces it with the value.
@@ -147,6 +246,11 @@ class ExtendedCoreLoader(yamlcore.CCoreLoader):
             )
             raise ValueError(error_msg)
 
+        if self.defer_secrets:
+            return secret_ref
+        if secret_ref.key in self.resolved_secrets:
+            return self.resolved_secrets[secret_ref.key]
+
         secret_plugin = self.secrets[secret_ref.secret_id]
         return secret_resolver(secret_plugin, secret_ref)
 
@@ -172,12 +276,21 @@ class YamlParser:
         - a `str` object
         - a file-like object with its `read` method returning `str`
         - a file-like object with its `read` method returning `unicode`
+
+    With a `cache_dir`, or the `PIPELINE_FLOW_YAML_CACHE_DIR` environment variable, the parsed configuration
+    is cached, so repeated runs of the same configuration skip the YAML parsing. Secrets are never cached.
     """
 
-    def __init__(self: Self, stream: StreamType) -> None:
+    def __init__(self: Self, stream: StreamType, cache_dir: str | None = None) -> None:
         self._stream = stream
+        self._secret_definitions = {}
+        self._secrets = {}
 
-        self._parsed_yaml = self.parse_yaml_with_context(stream)
+        cache_dir = cache_dir or os.environ.get(YAML_CACHE_DIR_ENV)
+        if cache_dir:
+            self._parsed_yaml = self.parse_yaml_with_cache(stream, cache_dir)
+        else:
+            self._parsed_yaml = self.parse_yaml_with_context(stream)
 
     @property
     def yaml_body(self) -> JSON_DATA:
@@ -214,23 +327,27 @@ class YamlParser:
                 # Close the file if it was opened
                 self._stream.close()
 
-    def parse_yaml_with_context(self, stream: StreamType) -> JSON_DATA:
+    def parse_yaml_with_context(self, stream: StreamType, *, defer_secrets: bool = False) -> JSON_DATA:
         """Loads the YAML content from the stream and returns the parsed data.
 
         It is a wrapper over yaml.load_all() to handle the secrets and env variables.
 
         Args:
             stream (StreamType): The stream to read the YAML content from.
+            defer_secrets (bool): Leaves the secrets as `SecretReference` placeholders instead of their values.
 
         Returns:
             JSON_DATA: A dictionary containing the parsed YAML content.
         """
-        loader = ExtendedCoreLoader(stream)
+        loader = ExtendedCoreLoader(stream, defer_secrets=defer_secrets)
 
         for yaml_doc in self.stream_yaml_documents(loader):
             if YamlAttribute.SECRETS in yaml_doc:
+                # Copied first, as instantiating the plugins consumes their definitions.
+                self._secret_definitions.update(copy.deepcopy(yaml_doc[YamlAttribute.SECRETS]))
                 secrets = secret_parser(yaml_doc[YamlAttribute.SECRETS])
                 loader.update_secrets(secrets)
+                self._secrets.update(secrets)
 
             if YamlAttribute.VARIABLES in yaml_doc:
                 variables = yaml_doc[YamlAttribute.VARIABLES]
@@ -247,11 +364,88 @@ class YamlParser:
         # Return empty dictionary if no document is found
         return {}
 
+    def parse_yaml_with_cache(self, stream: StreamType, cache_dir: str) -> JSON_DATA:
+        """Loads the parsed data from the compiled configuration cache, or parses and caches it on a miss.
+
+        Entries are keyed on the hash of the YAML content and the values of the environment variables it
+        references. Secrets are cached as placeholders and resolved again on every load.
+
+        Args:
+            stream (StreamType): The stream to read the YAML content from.
+            cache_dir (str): The directory of the compiled configuration cache.
+
+        Returns:
+            JSON_DATA: A dictionary containing the parsed YAML content.
+        """
+        if hasattr(stream, "read"):
+            content = stream.read()
+            stream.close()
+        else:
+            content = stream
+
+        text = content if isinstance(content, str) else content.decode(errors="ignore")
+        key = config_fingerprint(content, (match.group(1) for match in ENV_VAR_PATTERN.finditer(text)))
+
+        cache = CompiledConfigCache(cache_dir)
+        compiled = cache.load(key)
+        if compiled is None:
+            document = self.parse_yaml_with_context(content, defer_secrets=True)
+            compiled = CompiledConfig(secrets=self._secret_definitions, document=document)
+            cache.store(key, compiled)
+        else:
+            self._secret_definitions = compiled.secrets
+            self._secrets = secret_parser(copy.deepcopy(compiled.secrets))
+
+        return resolve_secret_references(compiled.document, self._secrets)
+
     def initialize_yaml_config(self: Self) -> YamlConfig:
         """Initialize the YAML Configuration object with the default values or passed in."""
+        metrics = self._parsed_yaml.get(YamlAttribute.METRICS) or {}
+        tracing = self._parsed_yaml.get(YamlAttribute.TRACING) or {}
+        # The loop monitor is a debug mode, enabled by the presence of its section.
+        loop_monitor = self._parsed_yaml.get(YamlAttribute.LOOP_MONITOR)
+        spill = self._parsed_yaml.get(YamlAttribute.SPILL) or {}
+
         # Create the map of attributes with their values
         attrs_map = {
             YamlAttribute.CONCURRENCY: self._parsed_yaml.get(YamlAttribute.CONCURRENCY, DEFAULT_CONCURRENCY),
+            YamlAttribute.TRANSFORM_EXECUTOR: TransformExecutorType(
+                self._parsed_yaml.get(YamlAttribute.TRANSFORM_EXECUTOR, TransformExecutorType.THREAD)
+            ),
+            YamlAttribute.TRANSFORM_WORKERS: self._parsed_yaml.get(YamlAttribute.TRANSFORM_WORKERS),
+            YamlAttribute.PLUGIN_WORKERS: self._parsed_yaml.get(YamlAttribute.PLUGIN_WORKERS),
+            "metrics_report": metrics.get("report"),
+            "metrics_prometheus": metrics.get("prometheus"),
+            "tracing_file": tracing.get("file"),
+            YamlAttribute.STATE_STORE: self._parsed_yaml.get(YamlAttribute.STATE_STORE),
+            # The run journal is enabled by the presence of its section.
+            YamlAttribute.JOURNAL: (
+                None
+                if YamlAttribute.JOURNAL not in self._parsed_yaml
+                else self._parsed_yaml[YamlAttribute.JOURNAL] or {}
+            ),
+            # The admission control is enabled by the presence of its section.
+            YamlAttribute.ADMISSION: (
+                None
+                if YamlAttribute.ADMISSION not in self._parsed_yaml
+                else self._parsed_yaml[YamlAttribute.ADMISSION] or {}
+            ),
+            YamlAttribute.SCHEDULING: SchedulingMode(
+                self._parsed_yaml.get(YamlAttribute.SCHEDULING, SchedulingMode.FIFO)
+            ),
+            # The run history is kept whenever its section is present.
+            YamlAttribute.RUN_HISTORY: (
+                None
+                if YamlAttribute.RUN_HISTORY not in self._parsed_yaml
+                else self._parsed_yaml[YamlAttribute.RUN_HISTORY] or {}
+            ),
+            YamlAttribute.RESOURCE_POOLS: self._parsed_yaml.get(YamlAttribute.RESOURCE_POOLS),
+            "memory_budget": parse_byte_size(spill.get("memory_budget")),
+            "spill_dir": spill.get("dir"),
+            "spill_format": SpillFormat(spill.get("format", SpillFormat.ARROW)),
+            "loop_blocking_threshold": (
+                None if loop_monitor is None else (loop_monitor or {}).get("threshold", DEFAULT_BLOCKING_THRESHOLD)
+            ),
         }
 
         # Filter out the None values
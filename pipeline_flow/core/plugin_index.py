@@ -0,0 +1,121 @@
+# Standard Imports
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Third Party Imports
+# Project Imports
+
+# Persists the plugin index in this file, so that unchanged plugin files are not parsed again.
+PLUGIN_INDEX_ENV = "PIPELINE_FLOW_PLUGIN_INDEX"
+
+# Bumped whenever the index format changes, so that stale indexes are rebuilt.
+INDEX_FORMAT_VERSION = 1
+
+
+@dataclass
+class IndexedFile:
+    """The plugins defined in a Python file, keyed by the size and modification time of the file.
+
+    Attributes:
+        mtime_ns (int): The modification time of the file when it was indexed.
+        size (int): The size of the file when it was indexed.
+        plugins (dict[str, str]): The module-level plugin classes by their plugin name.
+        dynamic (bool): True if a plugin name is not a string literal, or the class is not at module level.
+            Such files have to be executed to register their plugins.
+    """
+
+    mtime_ns: int
+    size: int
+    plugins: dict[str, str] = field(default_factory=dict)
+    dynamic: bool = False
+
+
+def scan_plugin_file(plugin_file: str, stat: os.stat_result) -> IndexedFile:
+    """Finds the `plugin_name` of every plugin class in the file by parsing it, without executing it."""
+    tree = ast.parse(Path(plugin_file).read_bytes(), filename=plugin_file)
+    indexed_file = IndexedFile(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    module_classes = {id(node) for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        for keyword in node.keywords:
+            if keyword.arg != "plugin_name":
+                continue
+
+            is_literal = isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str)
+            if is_literal and id(node) in module_classes:
+                indexed_file.plugins[keyword.value.value] = node.name
+            else:
+                indexed_file.dynamic = True
+
+    return indexed_file
+
+
+class PluginIndex:
+    """An index of the plugins defined in plugin files, optionally cached in a JSON file.
+
+    A file is parsed again only when its size or modification time changes.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = Path(path) if path else None
+        self.files: dict[str, IndexedFile] = self._read() if self.path else {}
+        self._changed = False
+
+    def _read(self) -> dict[str, IndexedFile]:
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring the plugin index `%s`, it cannot be read: %s", self.path, e)
+            return {}
+
+        if content.get("version") != INDEX_FORMAT_VERSION:
+            return {}
+        return {plugin_file: IndexedFile(**entry) for plugin_file, entry in content["files"].items()}
+
+    def lookup(self, plugin_file: str) -> IndexedFile:
+        """Returns the plugins defined in the file, parsing it if it is not indexed or has changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        stat = os.stat(plugin_file)  # noqa: PTH116
+        indexed_file = self.files.get(plugin_file)
+        if indexed_file is not None and (indexed_file.mtime_ns, indexed_file.size) == (stat.st_mtime_ns, stat.st_size):
+            return indexed_file
+
+        logging.debug("Indexing the plugins of %s", plugin_file)
+        indexed_file = self.files[plugin_file] = scan_plugin_file(plugin_file, stat)
+        self._changed = True
+        return indexed_file
+
+    def save(self) -> None:
+        """Writes the index to its file if it has changed, failures only log a warning."""
+        if not self.path or not self._changed:
+            return
+
+        content = {
+            "version": INDEX_FORMAT_VERSION,
+            "files": {plugin_file: asdict(indexed_file) for plugin_file, indexed_file in self.files.items()},
+        }
+        temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(content), encoding="utf-8")
+            temporary_path.replace(self.path)
+        except OSError as e:
+            logging.warning("Failed to store the plugin index in `%s`: %s", self.path, e)
+            temporary_path.unlink(missing_ok=True)
+            return
+
+        self._changed = False
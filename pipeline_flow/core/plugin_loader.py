@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import importlib
 import importlib.util
 import logging
 import os
-import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pipeline_flow.common.type_def import PluginRegistryJSON
 
+from pipeline_flow.common.utils import load_module_from_file
 from pipeline_flow.core.parsers import PluginParser
+from pipeline_flow.core.plugin_index import PLUGIN_INDEX_ENV, PluginIndex
+from pipeline_flow.core.registry import PluginRegistry
 
 
 def load_plugins(plugins_payload: PluginRegistryJSON | None) -> None:
-    """Invoke all methods to load plugins."""
+    """Invoke all methods to load plugins.
+
+    The plugin files are indexed without executing them, and their plugins are registered lazily, so that
+    only the modules of the plugins referenced by the pipelines are imported.
+    """
     logging.info("Starting to load plugins...")
 
     if not plugins_payload:
@@ -21,47 +28,22 @@ def load_plugins(plugins_payload: PluginRegistryJSON | None) -> None:
         return
 
     plugin_parser = PluginParser(plugins_payload)
+    plugin_index = PluginIndex(os.environ.get(PLUGIN_INDEX_ENV))
 
-    # Load custom plugins
+    # Register custom plugins
     custom_files = plugin_parser.fetch_custom_plugin_files()
-    load_custom_plugins(custom_files)
+    register_custom_plugins(custom_files, plugin_index)
 
-    # Load community plugins
+    # Register community plugins
     community_modules = plugin_parser.fetch_community_plugin_modules()
-    load_community_plugins(community_modules)
+    register_community_plugins(community_modules, plugin_index)
 
+    plugin_index.save()
     logging.info("All plugins loaded successfully.")
 
 
 def _load_plugin_from_file(plugin_file: str) -> None:
-    # Get the module name from the file and remove .py extension
-    if plugin_file.startswith("/"):
-        fq_module_name = plugin_file.replace(os.sep, ".")[1:-3]
-    else:
-        fq_module_name = plugin_file.replace(os.sep, ".")[:-3]
-
-    # Check if the module is already loaded to avoid re-importing
-    if fq_module_name in sys.modules:
-        logging.debug("Module %s has been re-loaded.", fq_module_name)
-        return
-
-    try:
-        logging.debug("Loading module %s", fq_module_name)
-        spec = importlib.util.spec_from_file_location(fq_module_name, plugin_file)
-
-        if not spec:
-            raise ImportError(  # noqa: TRY301
-                "The Spec based on following file location is empty: %s and %s plugin.", fq_module_name, plugin_file
-            )
-
-        plugin_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(plugin_module)  # type: ignore[reportOptionalMemberAccess]
-        logging.info("Loaded plugin from %s as %s", plugin_file, fq_module_name)
-
-    except ImportError:
-        msg = f"Error importing plugin from `{fq_module_name}` module,"
-        logging.error(msg)
-        raise
+    load_module_from_file(plugin_file)
 
 
 def load_custom_plugins(custom_files: set[str]) -> None:
@@ -81,3 +63,37 @@ def load_community_plugins(community_modules: set[str]) -> None:
     for module in community_modules:
         _load_plugin_from_file(module)
     logging.info("Loaded all community plugins/")
+
+
+def register_custom_plugins(custom_files: set[str], plugin_index: PluginIndex) -> None:
+    """Registers the plugins of the custom files lazily, files with dynamic plugin names are loaded right away."""
+    for custom_file in custom_files:
+        indexed_file = plugin_index.lookup(custom_file)
+        if indexed_file.dynamic:
+            _load_plugin_from_file(custom_file)
+            continue
+
+        for plugin_name, class_name in indexed_file.plugins.items():
+            PluginRegistry.register_lazy(plugin_name, f"{custom_file}:{class_name}")
+
+
+def register_community_plugins(community_modules: set[str], plugin_index: PluginIndex) -> None:
+    """Registers the plugins of the community modules lazily, modules with dynamic plugin names are imported."""
+    for module in community_modules:
+        try:
+            spec = importlib.util.find_spec(module)
+        except ModuleNotFoundError:
+            spec = None
+
+        if spec is None or not spec.has_location:
+            msg = f"Error importing plugin from `{module}` module, it is not installed."
+            logging.error(msg)
+            raise ImportError(msg)
+
+        indexed_file = plugin_index.lookup(spec.origin)
+        if indexed_file.dynamic:
+            importlib.import_module(module)
+            continue
+
+        for plugin_name, class_name in indexed_file.plugins.items():
+            PluginRegistry.register_lazy(plugin_name, f"{module}:{class_name}")
@@ -1,23 +1,51 @@
 # Standard Imports
 from __future__ import annotations
 
+import importlib
 import logging
 import uuid
+from importlib import metadata
 from typing import TYPE_CHECKING, ClassVar
 
 # Third Party Imports
 # Project Imports
-from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.common.utils import SingletonMeta, load_module_from_file
 
 if TYPE_CHECKING:
     from pipeline_flow.common.type_def import PluginName, PluginPayload
     from pipeline_flow.plugins import IPlugin
 
 
+# Packages expose their plugins under this entry point group, e.g. `my_plugin = "my_package.plugins:MyPlugin"`.
+PLUGIN_ENTRY_POINT_GROUP = "pipeline_flow.plugins"
+
+# The built-in plugins by name. They are imported on first use, so that a pipeline only pays for the
+# dependencies (httpx, SQLAlchemy, boto3, ...) of the plugins it references.
+BUILTIN_PLUGINS: dict[PluginName, str] = {
+    "rest_api_extractor": "pipeline_flow.plugins.extract.rest_api_async:RestApiAsyncExtractor",
+    "sqlalchemy_query_extractor": "pipeline_flow.plugins.extract.sqlalchemy_query_async:AsyncSQLAlchemyQueryExtractor",
+    "sqlalchemy_query_loader": "pipeline_flow.plugins.load.sqlalchemy_query_async:AsyncSQLAlchemyQueryLoader",
+    "aws_secret_manager": "pipeline_flow.plugins.secret_managers.aws_secret_manager:AWSSecretManager",
+    "sqlite_state_store": "pipeline_flow.plugins.state_stores.sqlite_state_store:SQLiteStateStore",
+    "json_file_state_store": "pipeline_flow.plugins.state_stores.json_state_store:JsonFileStateStore",
+    "page_based_pagination": "pipeline_flow.plugins.utility.pagination:PageBasedPagination",
+    "hateoas_pagination": "pipeline_flow.plugins.utility.pagination:HATEOASPagination",
+    "offset_limit_pagination": "pipeline_flow.plugins.utility.pagination:OffsetLimitPagination",
+    "page_number_pagination": "pipeline_flow.plugins.utility.pagination:PageNumberPagination",
+}
+
+
 class PluginRegistry(metaclass=SingletonMeta):
-    """Plugin registry class for storing and retrieving plugins."""
+    """Plugin registry class for storing and retrieving plugins.
+
+    Besides the registered plugin classes, it keeps the `module:attribute` paths of plugins that are imported
+    only when they are first retrieved: the built-in plugins, plugins registered with `register_lazy` and
+    plugins exposed through the `pipeline_flow.plugins` entry point group.
+    """
 
     _registry: ClassVar[dict[PluginName, IPlugin]] = {}
+    _lazy_registry: ClassVar[dict[PluginName, str]] = dict(BUILTIN_PLUGINS)
+    _entry_points_discovered: ClassVar[bool] = False
 
     @classmethod
     def register(cls: PluginRegistry, plugin_name: PluginName, plugin_callable: IPlugin) -> None:
@@ -33,11 +61,57 @@ class PluginRegistry(metaclass=SingletonMeta):
         cls._registry[plugin_name] = plugin_callable
         logging.debug("Plugin `%s` have been successfully registered. ", plugin_name)
 
+    @classmethod
+    def register_lazy(cls: PluginRegistry, plugin_name: PluginName, target: str) -> None:
+        """Registers a plugin by the `module:attribute` path of its class, which is imported on first use.
+
+        The module can also be the path of a Python file, e.g. `plugins/custom.py:CustomPlugin`.
+        """
+        logging.debug("Registering plugin `%s` lazily from `%s`.", plugin_name, target)
+        cls._lazy_registry[plugin_name] = target
+
+    @classmethod
+    def discover_entry_points(cls: PluginRegistry) -> None:
+        """Registers lazily every plugin exposed through the `pipeline_flow.plugins` entry point group."""
+        for entry_point in metadata.entry_points(group=PLUGIN_ENTRY_POINT_GROUP):
+            cls._lazy_registry.setdefault(entry_point.name, entry_point.value)
+        cls._entry_points_discovered = True
+
+    @classmethod
+    def _import_plugin(cls: PluginRegistry, plugin_name: PluginName) -> IPlugin | None:
+        if plugin_name not in cls._lazy_registry and not cls._entry_points_discovered:
+            cls.discover_entry_points()
+
+        target = cls._lazy_registry.get(plugin_name)
+        if target is None:
+            return None
+
+        # Split on the last colon, as file paths may contain one, e.g. `C:/plugins/custom.py:CustomPlugin`.
+        module_name, separator, attribute = target.rpartition(":")
+        if not separator:
+            module_name, attribute = attribute, ""
+
+        logging.debug("Importing plugin `%s` from `%s`.", plugin_name, module_name)
+        try:
+            if module_name.endswith(".py"):
+                module = load_module_from_file(module_name)
+            else:
+                module = importlib.import_module(module_name)
+        except ImportError:
+            logging.error("Error importing plugin `%s` from `%s` module.", plugin_name, module_name)
+            raise
+
+        # A module without an attribute registers its plugins when it is imported.
+        plugin_factory = getattr(module, attribute) if attribute else cls._registry.get(plugin_name)
+        if plugin_factory is not None:
+            cls._registry[plugin_name] = plugin_factory
+        return plugin_factory
+
     @classmethod
     def get(cls: PluginRegistry, plugin_name: PluginName) -> IPlugin:
-        """Retrieve a plugin from the registry."""
+        """Retrieve a plugin from the registry, importing it first if it is registered lazily."""
         logging.debug("Retrieving plugin class for `%s`.", plugin_name)
-        plugin_factory = cls._registry.get(plugin_name, None)
+        plugin_factory = cls._registry.get(plugin_name, None) or cls._import_plugin(plugin_name)
 
         if not plugin_factory:
             msg = f"Plugin class was not found for following plugin `{plugin_name}`."
@@ -57,10 +131,9 @@ class PluginRegistry(metaclass=SingletonMeta):
 
         plugin_id = plugin_data.pop("id", None) or f"{plugin_name}_{uuid.uuid4().hex[:16]}"
         plugin_params = plugin_data.get("args", {})
+        resource_pool = plugin_data.pop("resource_pool", None)
 
-        return plugin_factory(plugin_id=plugin_id, **plugin_params)
-
-
-# Registering plugins after PluginRegistry class definition. This is done to avoid circular imports as
-# the plugins are registed when they are imported from IPlugin interface.
-from pipeline_flow.plugins import *  # noqa: E402, F403
+        plugin = plugin_factory(plugin_id=plugin_id, **plugin_params)
+        if resource_pool is not None:
+            plugin.resource_pool = resource_pool
+        return plugin
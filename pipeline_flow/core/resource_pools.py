@@ -0,0 +1,116 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.common.utils.validation import parse_rate
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from contextlib import AbstractAsyncContextManager
+
+
+class TokenBucket:
+    """Hands out tokens at a steady `rate` per second, letting up to `capacity` tokens accumulate for bursts.
+
+    Waiters are served in the order they asked, each one waiting for the token it needs to refill.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def take(self, tokens: float = 1.0) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+
+class ResourcePool:
+    """A limit shared by every plugin referencing the pool, e.g. the requests to an API or the writes to a database.
+
+    Args:
+        name (str): The name of the pool.
+        max_concurrency (int | None): The number of acquisitions held at once, or None for no limit.
+        rate (float | None): The number of acquisitions per second, or None for no limit.
+        burst (float, optional): The number of acquisitions allowed at once after an idle period. Defaults to 1.
+    """
+
+    def __init__(
+        self, name: str, max_concurrency: int | None = None, rate: float | None = None, burst: float = 1.0
+    ) -> None:
+        self.name = name
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._bucket = TokenBucket(rate, max(burst, 1.0)) if rate else None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[None]:
+        """Waits for a free slot and a token of the pool, and holds the slot for the enclosed block."""
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            if self._bucket is not None:
+                await self._bucket.take()
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+class ResourcePools(metaclass=SingletonMeta):
+    """The process-wide resource pools declared in the `resource_pools` section of the configuration.
+
+    Plugins reference a pool with `resource_pool` in their definition. The executor acquires the pool once per
+    call of the plugin, while plugins making several requests per call acquire it for every request.
+    """
+
+    _pools: ClassVar[dict[str, ResourcePool]] = {}
+
+    @classmethod
+    def configure(cls, pools: dict[str, dict[str, Any]] | None) -> None:
+        """Replaces the pools with the ones declared in the configuration."""
+        cls._pools = {
+            name: ResourcePool(
+                name,
+                max_concurrency=settings.get("max_concurrency"),
+                rate=parse_rate(settings.get("rate")),
+                burst=settings.get("burst", 1.0),
+            )
+            for name, settings in (pools or {}).items()
+        }
+        if cls._pools:
+            logging.debug("Configured the resource pools: %s", ", ".join(cls._pools))
+
+    @classmethod
+    def is_declared(cls, name: str) -> bool:
+        return name in cls._pools
+
+    @classmethod
+    def get(cls, name: str) -> ResourcePool:
+        if name not in cls._pools:
+            msg = f"Resource pool `{name}` is not declared in `resource_pools`."
+            raise ValueError(msg)
+        return cls._pools[name]
+
+    @classmethod
+    def acquire(cls, name: str | None) -> AbstractAsyncContextManager:
+        """Acquires the pool of the given name, or nothing if `name` is None."""
+        return nullcontext() if name is None else cls.get(name).acquire()
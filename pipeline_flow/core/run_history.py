@@ -0,0 +1,105 @@
+# Standard Imports
+from __future__ import annotations
+
+import copy
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+# Project Imports
+from pipeline_flow.core.registry import PluginRegistry
+
+if TYPE_CHECKING:
+    from pipeline_flow.common.type_def import PluginPayload
+    from pipeline_flow.core.metrics import MetricRecord
+    from pipeline_flow.plugins import IStateStore
+
+DEFAULT_HISTORY_STORE = {"plugin": "sqlite_state_store", "args": {"path": ".pipeline_flow/history.db"}}
+
+# Weight of the latest run in a profile, older runs fade out exponentially.
+HISTORY_SMOOTHING = 0.5
+
+
+@dataclass(frozen=True)
+class PipelineProfile:
+    """What the previous successful runs of a pipeline measured, smoothed across runs.
+
+    The memory and CPU of the process cannot be told apart between concurrent pipelines, so they are only
+    learned from the runs where the pipeline ran alone.
+
+    Attributes:
+        memory (int | None): The growth of the RSS of the process during a run, in bytes.
+        cpu (float | None): The CPU time spent per second of a run, in cores.
+        duration (float): The wall-clock time of a run, in seconds.
+    """
+
+    memory: int | None
+    cpu: float | None
+    duration: float
+
+
+def _smooth(previous: float | None, observed: float | None) -> float | None:
+    if previous is None or observed is None:
+        return observed if previous is None else previous
+    return previous + (observed - previous) * HISTORY_SMOOTHING
+
+
+class RunHistory:
+    """The profiles of the pipelines, learned from the metrics of their previous runs and kept in a state store.
+
+    Args:
+        store (IStateStore | None): The store of the profiles, or None to only keep them for the process.
+    """
+
+    NAMESPACE = "pipeline_flow:history"
+
+    def __init__(self, store: IStateStore | None = None) -> None:
+        self.store = store
+        self._profiles: dict[str, PipelineProfile] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> RunHistory:
+        """Builds the history from the `run_history` section of the YAML configuration."""
+        store_payload: PluginPayload = copy.deepcopy(config.get("store") or DEFAULT_HISTORY_STORE)
+        return cls(PluginRegistry.instantiate_plugin(store_payload))
+
+    def get(self, pipeline: str) -> PipelineProfile | None:
+        if pipeline not in self._profiles and self.store is not None:
+            value = self.store.get(self.NAMESPACE, pipeline)
+            if value is not None:
+                self._profiles[pipeline] = PipelineProfile(**value)
+
+        return self._profiles.get(pipeline)
+
+    def get_many(self, pipelines: list[str]) -> dict[str, PipelineProfile]:
+        """Returns the profiles of the pipelines that ran before."""
+        return {pipeline: profile for pipeline in pipelines if (profile := self.get(pipeline)) is not None}
+
+    def record(self, pipeline: str, record: MetricRecord, *, ran_alone: bool = True) -> None:
+        """Learns the profile of a pipeline from the metric record of a successful run.
+
+        Args:
+            pipeline (str): The name of the pipeline.
+            record (MetricRecord): The metric record of the run.
+            ran_alone (bool, optional): Whether no other pipeline ran at the same time. Only the duration is
+                learned from a concurrent run. Defaults to True.
+        """
+        if record.wall_time <= 0:
+            return
+
+        observed = PipelineProfile(
+            memory=max(record.peak_rss_delta or 0, 0) if ran_alone else None,
+            cpu=record.cpu_time / record.wall_time if ran_alone else None,
+            duration=record.wall_time,
+        )
+        previous = self.get(pipeline)
+        if previous is not None:
+            memory = _smooth(previous.memory, observed.memory)
+            observed = PipelineProfile(
+                memory=round(memory) if memory is not None else None,
+                cpu=_smooth(previous.cpu, observed.cpu),
+                duration=previous.duration + (observed.duration - previous.duration) * HISTORY_SMOOTHING,
+            )
+
+        self._profiles[pipeline] = observed
+        if self.store is not None:
+            self.store.set_many(self.NAMESPACE, {pipeline: asdict(observed)})
@@ -0,0 +1,166 @@
+# Standard Imports
+from __future__ import annotations
+
+import contextlib
+import copy
+import logging
+import os
+import pickle
+import shutil
+import uuid
+from datetime import UTC, datetime
+from enum import StrEnum, unique
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Project Imports
+from pipeline_flow.common.utils import is_private_path
+from pipeline_flow.core.registry import PluginRegistry
+
+if TYPE_CHECKING:
+    from pipeline_flow.common.type_def import ETLData, PluginPayload
+    from pipeline_flow.core.models.phases import PipelinePhase
+    from pipeline_flow.plugins import IStateStore
+
+DEFAULT_JOURNAL_STORE = {"plugin": "sqlite_state_store", "args": {"path": ".pipeline_flow/journal.db"}}
+
+
+@unique
+class PipelineStatus(StrEnum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+def new_run_id() -> str:
+    """Returns a unique, chronologically sortable run id, e.g. `20250101T120000-3f2a9c1e`."""
+    return f"{datetime.now(UTC).strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+class RunJournal:
+    """Records the progress of a run, so that a failed run can be resumed.
+
+    The journal keeps the status of every pipeline and the phases it completed in a state store, under the
+    namespace of the run. With a spill directory, the output of each phase is also written to disk, so that a
+    resumed pipeline restarts from its last completed phase instead of extracting everything again.
+
+    Args:
+        store (IStateStore): The store of the journal entries.
+        run_id (str): The id of the run, pass the id of a failed run to resume it.
+        spill_dir (str | None): Spills the output of each phase into this directory. Defaults to None.
+    """
+
+    def __init__(self, store: IStateStore, run_id: str, spill_dir: str | None = None) -> None:
+        self.store = store
+        self.run_id = run_id
+        self.spill_dir = Path(spill_dir) / run_id if spill_dir else None
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any], run_id: str) -> RunJournal:
+        """Builds the journal from the `journal` section of the YAML configuration."""
+        store_payload: PluginPayload = copy.deepcopy(config.get("store") or DEFAULT_JOURNAL_STORE)
+        return cls(PluginRegistry.instantiate_plugin(store_payload), run_id, config.get("spill_dir"))
+
+    @property
+    def namespace(self) -> str:
+        return f"run:{self.run_id}"
+
+    def pipeline(self, name: str) -> PipelineJournal:
+        """Returns the journal of a pipeline, with the progress recorded by a previous attempt of the run."""
+        return PipelineJournal(self, name, self.store.get(self.namespace, name))
+
+
+class PipelineJournal:
+    """The progress of a single pipeline within a run."""
+
+    def __init__(self, journal: RunJournal, pipeline: str, entry: dict[str, Any] | None) -> None:
+        self.journal = journal
+        self.pipeline = pipeline
+        self.entry = entry or {"status": PipelineStatus.RUNNING, "phases": {}}
+        self.resumed_phases = self._resumable_phases()
+
+    @property
+    def is_completed(self) -> bool:
+        return self.entry["status"] == PipelineStatus.COMPLETED
+
+    def _resumable_phases(self) -> list[str]:
+        """Returns the completed phases up to the last one whose output can be restored, in completion order.
+
+        Spilled outputs are only restored from files owned by the current user and not writable by anyone else,
+        as they are loaded with `pickle`.
+        """
+        phases = list(self.entry["phases"].items())
+        last_restorable = -1
+        for index, (_, record) in enumerate(phases):
+            if not record["has_output"] or (record["spill"] and is_private_path(Path(record["spill"]))):
+                last_restorable = index
+        return [phase for phase, _ in phases[: last_restorable + 1]]
+
+    def _save(self) -> None:
+        self.journal.store.set_many(self.journal.namespace, {self.pipeline: self.entry})
+
+    def is_resumed(self, phase: PipelinePhase) -> bool:
+        """Checks whether the phase completed in a previous attempt and can be skipped."""
+        return phase in self.resumed_phases
+
+    def restore(self, phase: PipelinePhase) -> ETLData:
+        """Returns the spilled output of a skipped phase, if the next phase needs it, or else None."""
+        if phase != self.resumed_phases[-1]:
+            return None
+
+        spill = self.entry["phases"][phase]["spill"]
+        if not spill:
+            return None
+
+        path = Path(spill)
+        if not is_private_path(path):
+            msg = f"The output of phase `{phase}` cannot be restored, `{path}` is writable by other users."
+            raise PermissionError(msg)
+
+        logging.info("Restoring the output of phase `%s` of pipeline `%s` from `%s`.", phase, self.pipeline, spill)
+        with path.open("rb") as file:
+            return pickle.load(file)  # noqa: S301 - Only loaded from files owned by the user, see `is_private_path`.
+
+    @property
+    def _spill_dir(self) -> Path | None:
+        return self.journal.spill_dir / self.pipeline if self.journal.spill_dir else None
+
+    def _spill(self, phase: PipelinePhase, data: ETLData) -> str | None:
+        if self._spill_dir is None:
+            return None
+
+        path = self._spill_dir / f"{phase}.pickle"
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            # Created private whatever the umask, as only private files are restored.
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logging.warning("The output of phase `%s` of pipeline `%s` cannot be spilled: %s", phase, self.pipeline, e)
+            path.unlink(missing_ok=True)
+            return None
+        return str(path)
+
+    def record_phase(self, phase: PipelinePhase, data: ETLData, *, has_output: bool) -> None:
+        """Records a completed phase, and spills its output when the next phase needs it."""
+        spill = self._spill(phase, data) if has_output else None
+        self.entry["phases"][phase] = {"has_output": has_output, "spill": spill}
+        self._save()
+
+    def record_status(self, status: PipelineStatus) -> None:
+        """Records the status of the pipeline.
+
+        A completed pipeline is never resumed, so its spilled outputs are removed.
+        """
+        if status == PipelineStatus.COMPLETED:
+            for record in self.entry["phases"].values():
+                record["spill"] = None
+        self.entry["status"] = status
+        self._save()
+
+        if status == PipelineStatus.COMPLETED and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            # The directory of the run is removed with the spilled outputs of its last pipeline.
+            with contextlib.suppress(OSError):
+                self._spill_dir.parent.rmdir()
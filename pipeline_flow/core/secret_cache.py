@@ -0,0 +1,179 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+from cryptography.fernet import Fernet, InvalidToken
+
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SECRET_CACHE_TTL = 300.0
+
+# The cache is configured through environment variables, as secrets are resolved while the YAML is parsed.
+SECRET_CACHE_TTL_ENV = "PIPELINE_FLOW_SECRET_CACHE_TTL"  # noqa: S105 - Not a secret.
+SECRET_CACHE_FILE_ENV = "PIPELINE_FLOW_SECRET_CACHE_FILE"  # noqa: S105 - Not a secret.
+SECRET_CACHE_KEY_ENV = "PIPELINE_FLOW_SECRET_CACHE_KEY"  # noqa: S105 - Not a secret.
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+
+class SecretCache(metaclass=SingletonMeta):
+    """A process-wide cache of secret values with a time-to-live.
+
+    Concurrent lookups of the same key are deduplicated: the first caller fetches the value while every
+    other caller waits for its result, so each secret costs a single round-trip to its provider.
+    Failed fetches are not cached.
+
+    Optionally, the cache is persisted into a file encrypted with a Fernet key, so that restarts within
+    the time-to-live do not fetch the secrets again.
+    """
+
+    _ttl: ClassVar[float | None] = None
+    _path: ClassVar[Path | None] = None
+    _fernet: ClassVar[Fernet | None] = None
+    _entries: ClassVar[dict[str, CacheEntry]] = {}
+    _inflight: ClassVar[dict[str, Future]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def configure(cls, ttl: float | None = None, path: str | None = None, key: str | bytes | None = None) -> None:
+        """Configures the cache, any argument that is not set is read from its environment variable.
+
+        Args:
+            ttl (float | None): The time-to-live of the entries in seconds, 0 disables the cache.
+            path (str | None): The file of the encrypted on-disk cache, which is disabled if not set.
+            key (str | bytes | None): The Fernet key that encrypts the on-disk cache.
+
+        Raises:
+            ValueError: If an on-disk cache is configured without an encryption key.
+        """
+        ttl = ttl if ttl is not None else float(os.environ.get(SECRET_CACHE_TTL_ENV, DEFAULT_SECRET_CACHE_TTL))
+        path = path or os.environ.get(SECRET_CACHE_FILE_ENV)
+        key = key or os.environ.get(SECRET_CACHE_KEY_ENV)
+
+        if path and not key:
+            error_msg = f"The on-disk secret cache requires a Fernet key, set `{SECRET_CACHE_KEY_ENV}`."
+            logging.error(error_msg)
+            raise ValueError(error_msg)
+
+        with cls._lock:
+            cls._ttl = ttl
+            cls._path = Path(path) if path else None
+            cls._fernet = Fernet(key) if path else None
+            cls._entries = cls._read_file() if cls._path else {}
+
+    @classmethod
+    def get_or_fetch[T](cls, key: str, fetch: Callable[[], T]) -> T:
+        """Returns the cached value of `key`, or calls `fetch` once to retrieve and cache it."""
+        if cls._ttl is None:
+            cls.configure()
+        if cls._ttl <= 0:
+            return fetch()
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry.is_fresh():
+                return entry.value
+
+            future = cls._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = cls._inflight[key] = Future()
+
+        if not is_owner:
+            logging.debug("Waiting for the secret `%s` fetched by another caller.", key)
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            with cls._lock:
+                cls._entries[key] = CacheEntry(value, time.time() + cls._ttl)
+                if cls._path:
+                    cls._write_file()
+            return value
+        finally:
+            with cls._lock:
+                cls._inflight.pop(key, None)
+
+    @classmethod
+    def invalidate(cls, key: str | None = None) -> None:
+        """Removes `key`, or every entry, from the in-memory and the on-disk cache."""
+        with cls._lock:
+            if key is None:
+                cls._entries = {}
+            else:
+                cls._entries.pop(key, None)
+            if cls._path:
+                cls._write_file()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clears the in-memory cache and its configuration, the on-disk cache is left untouched."""
+        with cls._lock:
+            cls._ttl = None
+            cls._path = None
+            cls._fernet = None
+            cls._entries = {}
+
+    @classmethod
+    def _read_file(cls) -> dict[str, CacheEntry]:
+        if not cls._path.exists():
+            return {}
+
+        try:
+            content = json.loads(cls._fernet.decrypt(cls._path.read_bytes()))
+        except (InvalidToken, ValueError):
+            logging.warning("Ignoring the secret cache `%s`, it cannot be decrypted with the given key.", cls._path)
+            return {}
+
+        try:
+            entries = {key: CacheEntry(**entry) for key, entry in content.items()}
+            return {key: entry for key, entry in entries.items() if entry.is_fresh()}
+        except (AttributeError, TypeError):
+            logging.warning("Ignoring the secret cache `%s`, its entries are malformed.", cls._path)
+            return {}
+
+    @classmethod
+    def _write_file(cls) -> None:
+        entries = {
+            key: {"value": entry.value, "expires_at": entry.expires_at}
+            for key, entry in cls._entries.items()
+            if entry.is_fresh()
+        }
+        try:
+            token = cls._fernet.encrypt(json.dumps(entries).encode())
+        except TypeError:
+            logging.warning("Skipping the on-disk secret cache, a secret value cannot be serialized to JSON.")
+            return
+
+        # Written to a private temporary file first, so a crash never leaves a truncated cache behind.
+        temporary_path = cls._path.with_name(f"{cls._path.name}.tmp")
+        fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(token)
+        temporary_path.replace(cls._path)
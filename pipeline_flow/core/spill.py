@@ -0,0 +1,217 @@
+# Standard Imports
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass, replace
+from enum import StrEnum, unique
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.type_def import DataFormat
+from pipeline_flow.common.utils.columnar import is_columnar, is_dataframe, to_columnar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pipeline_flow.common.type_def import ColumnarData, ETLData
+    from pipeline_flow.core.models.phases import PipelinePhase
+
+# Spilled data is written under this directory unless `spill.dir` is configured.
+DEFAULT_SPILL_DIR = str(Path(tempfile.gettempdir()) / "pipeline_flow" / "spill")
+
+# Number of rows sampled to estimate the size of a list of rows.
+SIZE_SAMPLE_ROWS = 100
+
+
+@unique
+class SpillFormat(StrEnum):
+    """The file format of spilled data."""
+
+    ARROW = "arrow"  # Arrow IPC files, memory-mapped when read back.
+    PARQUET = "parquet"  # Compressed Parquet files, smaller on disk but read back into memory.
+
+
+@unique
+class SpilledOrigin(StrEnum):
+    """The type of the data before it was spilled, restored for plugins expecting `native` data."""
+
+    COLUMNAR = "columnar"
+    DATAFRAME = "dataframe"
+    ROWS = "rows"
+
+
+def estimate_size(data: ETLData) -> int | None:
+    """Estimates the memory used by the data in bytes.
+
+    The size of a list of rows is extrapolated from a sample of its rows.
+
+    Returns:
+        int | None: The estimated size, or None if the data type cannot be spilled.
+    """
+    if is_columnar(data):
+        return data.nbytes
+
+    if is_dataframe(data):
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    if isinstance(data, list) and all(isinstance(row, dict) for row in data[:1]):
+        if not data:
+            return sys.getsizeof(data)
+
+        sample = data[:: max(1, len(data) // SIZE_SAMPLE_ROWS)]
+        sample_size = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values()) for row in sample)
+        return sys.getsizeof(data) + sample_size * len(data) // len(sample)
+
+    return None
+
+
+@dataclass(frozen=True)
+class SpilledData:
+    """A lazy reader over data spilled to disk, handed to the next phase in place of the data.
+
+    Plugins never receive the reader itself, the data is read back in the `input_format` of each plugin.
+    Arrow files are memory-mapped, so `columnar` plugins get a table whose pages are only loaded when accessed.
+    The reader only holds the path of the file, so it is cheap to hand off to the transform worker processes.
+
+    Attributes:
+        path (str): The file holding the data.
+        format (SpillFormat): The file format.
+        origin (SpilledOrigin): The type of the data before it was spilled.
+        num_rows (int): The number of rows of the file.
+        offset (int): The first row read by this reader. Defaults to 0.
+        length (int | None): The number of rows read by this reader, or None up to the last row. Defaults to None.
+    """
+
+    path: str
+    format: SpillFormat
+    origin: SpilledOrigin
+    num_rows: int
+    offset: int = 0
+    length: int | None = None
+
+    def __len__(self) -> int:
+        return self.num_rows - self.offset if self.length is None else self.length
+
+    def read(self) -> ColumnarData:
+        """Returns the rows of this reader as a `pyarrow.Table`."""
+        # PyArrow is an optional dependency, it is installed whenever data was spilled.
+        import pyarrow as pa  # noqa: PLC0415
+
+        if self.format == SpillFormat.ARROW:
+            with pa.memory_map(self.path) as source:
+                table = pa.ipc.open_file(source).read_all()
+        else:
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            table = pq.read_table(self.path, memory_map=True)
+
+        if self.offset == 0 and self.length is None:
+            return table
+        return table.slice(self.offset, self.length)
+
+    def iter_batches(self) -> Iterator[ColumnarData]:
+        """Yields the rows of this reader as `pyarrow.RecordBatch` objects."""
+        yield from self.read().to_batches()
+
+    def to_native(self) -> ETLData:
+        """Returns the rows of this reader in the type the data had before it was spilled."""
+        table = self.read()
+        if self.origin == SpilledOrigin.DATAFRAME:
+            return table.to_pandas()
+        if self.origin == SpilledOrigin.ROWS:
+            return table.to_pylist()
+        return table
+
+    def as_format(self, data_format: DataFormat) -> ETLData:
+        """Reads the rows back in the format a plugin declared through its `input_format`."""
+        if data_format == DataFormat.COLUMNAR:
+            return self.read()
+        if data_format == DataFormat.ROWS:
+            return self.read().to_pylist()
+        return self.to_native()
+
+    def split(self, chunks: int) -> list[SpilledData]:
+        """Splits the reader into at most `chunks` readers over contiguous rows of the same file."""
+        chunk_size = max(1, -(-len(self) // chunks))  # Ceiling division
+        end = self.offset + len(self)
+        return [
+            replace(self, offset=offset, length=min(chunk_size, end - offset))
+            for offset in range(self.offset, end, chunk_size)
+        ]
+
+
+class SpillManager:
+    """Spills the output of a phase to disk when it exceeds the memory budget of the pipeline.
+
+    Only DataFrames, lists of rows and columnar data are spilled, as they are converted to Arrow to be written.
+    Smaller outputs, and outputs of any other type, are handed to the next phase as they are.
+
+    Args:
+        directory (str): The scratch directory of the pipeline, removed by `cleanup`.
+        memory_budget (int): The largest output kept in memory, in bytes.
+        spill_format (SpillFormat, optional): The file format of spilled data. Defaults to `arrow`.
+    """
+
+    def __init__(self, directory: str, memory_budget: int, spill_format: SpillFormat = SpillFormat.ARROW) -> None:
+        self.directory = Path(directory)
+        self.memory_budget = memory_budget
+        self.spill_format = spill_format
+
+    def hand_off(self, phase: PipelinePhase, data: ETLData) -> ETLData:
+        """Returns the data, or a `SpilledData` reader if the data was spilled to disk."""
+        if isinstance(data, SpilledData):
+            return data
+
+        size = estimate_size(data)
+        if size is None or size <= self.memory_budget:
+            return data
+
+        if is_columnar(data):
+            origin = SpilledOrigin.COLUMNAR
+        elif is_dataframe(data):
+            origin = SpilledOrigin.DATAFRAME
+        else:
+            origin = SpilledOrigin.ROWS
+
+        table = to_columnar(data)
+        path = self._write(phase, table)
+        logging.info(
+            "Spilled the output of phase `%s` (about %s bytes, over the memory budget of %s bytes) to `%s`.",
+            phase,
+            size,
+            self.memory_budget,
+            path,
+        )
+        return SpilledData(path=str(path), format=self.spill_format, origin=origin, num_rows=table.num_rows)
+
+    def _write(self, phase: PipelinePhase, table: ColumnarData) -> Path:
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self.directory / f"{phase}.{self.spill_format}"
+        # Written aside and renamed, as a reader of a previous attempt may still map the file.
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            if self.spill_format == SpillFormat.ARROW:
+                import pyarrow as pa  # noqa: PLC0415
+
+                with pa.OSFile(str(temporary_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            else:
+                import pyarrow.parquet as pq  # noqa: PLC0415
+
+                pq.write_table(table, temporary_path)
+            temporary_path.replace(path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+        return path
+
+    def cleanup(self) -> None:
+        """Removes the spilled data of the pipeline."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,235 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum, unique
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from contextlib import AbstractContextManager
+
+SERVICE_NAME = "pipeline-flow"
+INSTRUMENTATION_SCOPE = "pipeline_flow"
+
+# The span that new spans are attached to. Asyncio tasks inherit it from the task that created them.
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+# Returned instead of a span while tracing is disabled, so that disabled tracing costs a single flag check.
+_NOOP_SPAN = nullcontext()
+
+
+@unique
+class SpanKind(IntEnum):
+    """The OTLP span kinds used by pipeline-flow."""
+
+    INTERNAL = 1
+    CLIENT = 3
+
+
+@unique
+class StatusCode(IntEnum):
+    OK = 1
+    ERROR = 2
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: SpanKind = SpanKind.INTERNAL
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: StatusCode = StatusCode.OK
+    status_message: str | None = None
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Encodes the span as in the OTLP/JSON protocol."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items() if value is not None],
+            "status": {"code": int(self.status)},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:  # noqa: ANN401
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}  # OTLP/JSON encodes 64 bit integers as strings.
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+class Tracer(metaclass=SingletonMeta):
+    """A process-wide tracer that collects spans in memory and exports them to an OTLP/JSON file.
+
+    Each export appends one line to the file with every finished span, in the OTLP file exporter format,
+    so the file can be replayed into any OpenTelemetry collector. Tracing is disabled until `configure`
+    is called with a file path.
+    """
+
+    _enabled: ClassVar[bool] = False
+    _path: ClassVar[str | None] = None
+    _spans: ClassVar[list[Span]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def configure(cls, path: str | None) -> None:
+        """Enables tracing into the file at `path`, or disables it if `path` is None."""
+        cls._path = path
+        cls._enabled = path is not None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def _new_span(cls, name: str, kind: SpanKind, attributes: dict[str, Any] | None) -> Span:
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+
+    @classmethod
+    def _finish(cls, span: Span, end_time: int | None = None) -> None:
+        span.end_time = time.time_ns() if end_time is None else end_time
+        with cls._lock:
+            cls._spans.append(span)
+
+    @classmethod
+    def span(
+        cls,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+    ) -> AbstractContextManager[Span | None]:
+        """Opens a span that is the child of the current span for the enclosed block.
+
+        Yields the span, so attributes can be added to it, or None while tracing is disabled.
+        """
+        if not cls._enabled:
+            return _NOOP_SPAN
+        return cls._span(name, kind, attributes)
+
+    @classmethod
+    @contextmanager
+    def _span(cls, name: str, kind: SpanKind, attributes: dict[str, Any] | None) -> Generator[Span]:
+        span = cls._new_span(name, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = StatusCode.ERROR
+            span.status_message = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            cls._finish(span)
+
+    @classmethod
+    def record_span(
+        cls, name: str, start_time: int, attributes: dict[str, Any] | None = None, end_time: int | None = None
+    ) -> None:
+        """Records a span that started at `start_time` (in nanoseconds) and ends at `end_time`, e.g. a queue wait.
+
+        The span ends now when `end_time` is None.
+        """
+        if not cls._enabled:
+            return
+        span = cls._new_span(name, SpanKind.INTERNAL, attributes)
+        span.start_time = start_time
+        cls._finish(span, end_time)
+
+    @classmethod
+    def spans(cls) -> list[Span]:
+        with cls._lock:
+            return list(cls._spans)
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._spans = []
+
+    @classmethod
+    def to_otlp(cls, spans: list[Span] | None = None) -> dict[str, Any]:
+        """Builds an OTLP `ExportTraceServiceRequest` with the given spans, or every finished span."""
+        spans = cls.spans() if spans is None else spans
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                    "scopeSpans": [
+                        {"scope": {"name": INSTRUMENTATION_SCOPE}, "spans": [span.to_otlp() for span in spans]}
+                    ],
+                }
+            ]
+        }
+
+    @classmethod
+    def export(cls) -> None:
+        """Appends the finished spans to the trace file as a single JSON line and clears them."""
+        if not cls._enabled:
+            return
+
+        # Taken and cleared in one step, so spans finishing while the file is written are kept for the next export.
+        with cls._lock:
+            spans, cls._spans = cls._spans, []
+        if not spans:
+            return
+
+        with Path(cls._path).open("a", encoding="utf-8") as file:
+            file.write(json.dumps(cls.to_otlp(spans)) + "\n")
+
+        logging.info("%s spans written to `%s`.", len(spans), cls._path)
+
+
+def run_after_queue_wait[R](submitted_at: int, func: Callable[..., R], *args: Any) -> R:  # noqa: ANN401
+    """Records the time a call waited for an executor worker as a span, then runs it.
+
+    Submit it to a thread pool as `executor.submit(run_after_queue_wait, time.time_ns(), func, *args)`. Spans
+    recorded in a worker process are lost, so process pools run the call with `run_timed` instead.
+    """
+    Tracer.record_span("executor.queue_wait", submitted_at)
+    return func(*args)
+
+
+def run_timed[R](func: Callable[..., R], *args: Any) -> tuple[int, R]:  # noqa: ANN401
+    """Runs the call and returns the time (in nanoseconds) it started at, along with its result.
+
+    The caller records the queue wait of a worker process with `Tracer.record_span(..., end_time=started_at)`.
+    """
+    return time.time_ns(), func(*args)
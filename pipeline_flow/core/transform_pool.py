@@ -0,0 +1,118 @@
+# Standard Imports
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# Third Party Imports
+# Project Imports
+from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.common.utils.columnar import is_columnar
+from pipeline_flow.core.spill import SpilledData
+
+if TYPE_CHECKING:
+    from pipeline_flow.common.type_def import TransformedData, UnifiedExtractData
+
+
+# Workers are never forked from the orchestrator, which runs threads by then, e.g. the plugin thread pool.
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class TransformProcessPool(metaclass=SingletonMeta):
+    """A process-wide `ProcessPoolExecutor` shared by every pipeline running CPU-bound transformations.
+
+    The pool is created lazily on first use and reused until `shutdown` is called. Its workers are started
+    with `forkserver` where available, as forking a multi-threaded process may deadlock the child.
+    """
+
+    _pool: ClassVar[ProcessPoolExecutor | None] = None
+    _max_workers: ClassVar[int | None] = None
+
+    @classmethod
+    def configure(cls, max_workers: int | None) -> None:
+        """Sets the number of worker processes. Only applies to a pool that has not been created yet."""
+        if cls._pool is not None and max_workers != cls._max_workers:
+            logging.warning("The transform process pool is already running. Ignoring `max_workers=%s`.", max_workers)
+            return
+
+        cls._max_workers = max_workers
+
+    @classmethod
+    def get(cls) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            logging.debug("Starting the transform process pool with max_workers=%s.", cls._max_workers)
+            cls._pool = ProcessPoolExecutor(
+                max_workers=cls._max_workers, mp_context=multiprocessing.get_context(START_METHOD)
+            )
+
+        return cls._pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._pool is None:
+            return
+
+        logging.debug("Shutting down the transform process pool.")
+        cls._pool.shutdown(wait=True, cancel_futures=True)
+        cls._pool = None
+
+
+def is_picklable(obj: Any) -> bool:  # noqa: ANN401
+    """Checks whether an object can be handed off to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+
+    return True
+
+
+def split_data(data: UnifiedExtractData, chunks: int) -> list[UnifiedExtractData] | None:
+    """Splits the data into at most `chunks` contiguous parts.
+
+    Only lists, DataFrame-like objects (anything exposing `iloc`), columnar data and spilled data can be split.
+    Columnar data is sliced without copying the underlying buffers, spilled data into readers of the same file.
+
+    Returns:
+        list[UnifiedExtractData] | None: The parts, or None if the data type cannot be split.
+    """
+    if isinstance(data, SpilledData):
+        return data.split(chunks) if len(data) else None
+
+    columnar = is_columnar(data)
+    if not isinstance(data, list) and not hasattr(data, "iloc") and not columnar:
+        return None
+
+    if len(data) == 0:
+        return None
+
+    chunk_size = max(1, -(-len(data) // chunks))  # Ceiling division
+
+    if isinstance(data, list):
+        return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    if columnar:
+        return [data.slice(i, chunk_size) for i in range(0, len(data), chunk_size)]
+
+    return [data.iloc[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def concat_data(parts: list[TransformedData]) -> TransformedData:
+    """Reassembles the transformed parts produced by `split_data`, preserving their order."""
+    if all(isinstance(part, list) for part in parts):
+        return [row for part in parts for row in part]
+
+    if all(is_columnar(part) for part in parts):
+        import pyarrow as pa  # noqa: PLC0415
+
+        return pa.concat_tables(
+            pa.Table.from_batches([part]) if isinstance(part, pa.RecordBatch) else part for part in parts
+        )
+
+    # Pandas is an optional dependency, only required when transforming DataFrames.
+    import pandas as pd  # noqa: PLC0415
+
+    return pd.concat(parts)
@@ -3,13 +3,17 @@ import logging
 
 # # Project Imports
 from pipeline_flow.common.type_def import StreamType
-from pipeline_flow.common.utils import setup_logger
+from pipeline_flow.common.utils import run_shutdown_hooks, setup_logger
+from pipeline_flow.core.loop_guard import LoopBlockingMonitor, SyncPluginPool
+from pipeline_flow.core.metrics import MetricsRegistry
 from pipeline_flow.core.orchestrator import PipelineOrchestrator
 from pipeline_flow.core.parsers import YamlParser, parse_pipelines
 from pipeline_flow.core.plugin_loader import load_plugins
+from pipeline_flow.core.tracing import Tracer
+from pipeline_flow.core.transform_pool import TransformProcessPool
 
 
-async def start_orchestration(stream: StreamType) -> None:
+async def start_orchestration(stream: StreamType, cache_dir: str | None = None, resume: str | None = None) -> None:
     """Main entry point for orchestrating the pipeline flow.
 
     This function parses the YAML configuration, loads the plugins,
@@ -22,13 +26,16 @@ async def start_orchestration(stream: StreamType) -> None:
 
     Args:
         stream (StreamType): A stream containing the YAML configuration.
+        cache_dir (str | None): Caches the parsed configuration in this directory, see `YamlParser`.
+        resume (str | None): The id of a failed run to resume, which requires the run journal. The pipelines it
+            completed are skipped, and the failed pipelines restart from their last completed phase.
     """
     # Set up the logger configuration
     if not logging.getLogger().hasHandlers() > 0:
         setup_logger()
 
     # Parse YAML
-    yaml_parser = YamlParser(stream)
+    yaml_parser = YamlParser(stream, cache_dir=cache_dir)
 
     # Parse plugins directly within the load_plugins function
     load_plugins(yaml_parser.plugins)
@@ -36,12 +43,35 @@ async def start_orchestration(stream: StreamType) -> None:
     # Parse pipelines and execute them using the orchestrator
     pipelines = parse_pipelines(yaml_parser.pipelines)
 
+    yaml_config = None
+    MetricsRegistry.reset()
+    LoopBlockingMonitor.reset()
+
     try:
         yaml_config = yaml_parser.initialize_yaml_config()
-        orchestrator = PipelineOrchestrator(yaml_config)
-        await orchestrator.execute_pipelines(pipelines)
+        Tracer.configure(yaml_config.tracing_file)
+        LoopBlockingMonitor.configure(yaml_config.loop_blocking_threshold)
+
+        orchestrator = PipelineOrchestrator(yaml_config, resume_run_id=resume)
+        with Tracer.span("run", attributes={"pipeline_flow.pipelines": len(pipelines)}):
+            await orchestrator.execute_pipelines(pipelines)
 
     except Exception as e:
         logging.error("The following error occurred: %s", e)
         logging.error("The original cause is: %s", e.__cause__)
         raise
+
+    finally:
+        if yaml_config:
+            MetricsRegistry.export(yaml_config.metrics_report, yaml_config.metrics_prometheus)
+
+        Tracer.export()
+        Tracer.configure(None)
+
+        LoopBlockingMonitor.report()
+        LoopBlockingMonitor.configure(None)
+
+        # Release process-wide resources such as shared HTTP clients.
+        await run_shutdown_hooks()
+        TransformProcessPool.shutdown()
+        SyncPluginPool.shutdown()
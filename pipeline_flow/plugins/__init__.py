@@ -6,6 +6,7 @@ from .base import (
     IPostProcessPlugin,
     IPreProcessPlugin,
     ISecretManager,
+    IStateStore,
     ITransformLoadPlugin,
     ITransformPlugin,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "IPostProcessPlugin",
     "IPreProcessPlugin",
     "ISecretManager",
+    "IStateStore",
     "ITransformLoadPlugin",
     "ITransformPlugin",
 ]
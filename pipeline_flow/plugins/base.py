@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import inspect
+import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ParamSpec, Self
+from typing import TYPE_CHECKING, Any, ClassVar, ParamSpec, Self
 
 # Third Party Imports
 # Local Imports
+from pipeline_flow.common.type_def import DataFormat
 from pipeline_flow.core.registry import PluginRegistry
 
 if TYPE_CHECKING:
@@ -36,7 +40,20 @@ class AsyncAdapterMixin:
 
 
 class IPlugin:
-    """Abstract base class for all plugins."""
+    """Abstract base class for all plugins.
+
+    Plugins that receive data declare the format they expect with `input_format`. The default `native`
+    passes the data through exactly as the previous phase produced it, `columnar` hands over a `pyarrow.Table`
+    and `rows` a list of dictionaries.
+
+    A plugin definition may reference a shared limit with `resource_pool`, acquired by the executor for every
+    call of the plugin. Plugins making several requests per call set `acquires_resource_pool` and acquire
+    the pool for each request with `ResourcePools.acquire(self.resource_pool)` instead.
+    """
+
+    input_format: ClassVar[DataFormat] = DataFormat.NATIVE
+    acquires_resource_pool: ClassVar[bool] = False
+    resource_pool: str | None = None
 
     def __init_subclass__(
         cls,
@@ -96,11 +113,15 @@ class ILoadPlugin(ABC, IPlugin, interface=True):
 
 
 class ITransformLoadPlugin(ABC, IPlugin, interface=True):
-    """Abstract base class for transform-load plugins."""
+    """Abstract base class for transform-load plugins.
+
+    `__call__` can be a coroutine function, which runs on the event loop. Synchronous plugins run in a thread,
+    so that a long statement in the warehouse never blocks the event loop.
+    """
 
     @abstractmethod
     def __call__(self: Self) -> None:
-        """Sychronously transform data at the destination."""
+        """Transform data at the destination, synchronously or asynchronously."""
         raise NotImplementedError("Transform-load plugins must implement __call__()")
 
 
@@ -125,11 +146,50 @@ class IPostProcessPlugin(ABC, IPlugin, interface=True):
 class ISecretManager(ABC, IPlugin, interface=True):
     """A base class for providing authentication secrets."""
 
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:  # noqa: ANN401
+        instance = super().__new__(cls)
+        # The constructor arguments identify the remote secret, unlike the plugin id.
+        instance._init_args = (args, kwargs)
+        return instance
+
     @property
     def resource_id(self) -> str:
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @property
+    def cache_key(self) -> str:
+        """Identifies the secret in the secret cache, by the plugin class and a hash of its constructor arguments.
+
+        The plugin id is left out, as it is only unique within a configuration while the on-disk cache is shared
+        by every configuration. Plugins may override it to identify the remote secret more precisely.
+        """
+        args, kwargs = self._init_args
+        arguments = inspect.signature(type(self).__init__).bind(self, *args, **kwargs).arguments
+        # Drops `self`, whatever its name.
+        arguments.pop(next(iter(arguments)))
+        arguments.pop("plugin_id", None)
+
+        digest = hashlib.sha256(json.dumps(arguments, sort_keys=True, default=repr).encode()).hexdigest()
+        return f"{type(self).__module__}.{type(self).__qualname__}:{digest}"
+
     @abstractmethod
     def __call__(self, secret_name: str) -> str:
         """A Plugin must implement this method to fetch the secret value by name."""
         raise NotImplementedError("Subclasses must implement this method.")
+
+
+class IStateStore(ABC, IPlugin, interface=True):
+    """A base class for persisting the state of plugins between runs, e.g. extraction watermarks.
+
+    The state is a set of JSON serializable values per namespace, which is the name of the pipeline.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Any:  # noqa: ANN401
+        """Returns the value stored under `key`, or None if there is none."""
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def set_many(self, namespace: str, values: dict[str, Any]) -> None:
+        """Stores every value at once, so that a run never persists only part of its state."""
+        raise NotImplementedError("Subclasses must implement this method.")
@@ -1,3 +1,19 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .rest_api_async import RestApiAsyncExtractor
 
-__all__ = ["RestApiAsyncExtractor"]
+if TYPE_CHECKING:
+    from .sqlalchemy_query_async import AsyncSQLAlchemyQueryExtractor
+
+# Imported on first access, so that using the REST extractor does not import SQLAlchemy.
+_LAZY_EXPORTS = {"AsyncSQLAlchemyQueryExtractor": ".sqlalchemy_query_async"}
+
+__all__ = ["AsyncSQLAlchemyQueryExtractor", "RestApiAsyncExtractor"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -11,7 +11,16 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ra
 # Local Imports
 from pipeline_flow.common.type_def import PluginPayload
 from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.resource_pools import ResourcePools
+from pipeline_flow.core.tracing import SpanKind, Tracer
 from pipeline_flow.plugins import IExtractPlugin
+from pipeline_flow.plugins.utility.http_client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncHttpClientPool,
+)
+from pipeline_flow.plugins.utility.watermark import Watermark
 
 if TYPE_CHECKING:
     from pipeline_flow.plugins.utility.pagination import IPaginationHandler
@@ -34,21 +43,49 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
         headers (dict[str, str]): A dictionary that contains headers e.g. auth token.
         pagination (PluginPayload, optional): A dict that contains plugins and args for paginations.
                                               Defaults to "page_based_pagination" plugin.
+        max_connections (int, optional): Maximum number of connections to the host. Defaults to 100.
+        max_keepalive_connections (int, optional): Maximum number of idle connections kept alive. Defaults to 20.
+        keepalive_expiry (float, optional): Seconds an idle connection is kept alive. Defaults to 5.0.
+        http2 (bool, optional): Enables HTTP/2, requires `httpx[http2]`. Defaults to False.
+        max_concurrent_requests (int, optional): Maximum number of pages fetched concurrently when the
+                                                 pagination handler returns several next pages. Defaults to 5.
+        watermark (dict, optional): Extracts incrementally. The `field` of the records holding the watermark,
+                                    the query `param` it is sent in and its `initial` value. Defaults to None.
+
+    The HTTP client is shared with every other extractor that targets the same host, so the connection
+    settings of the first extractor for a host apply to all of them. The `resource_pool` of the extractor,
+    if any, is acquired for every page.
     """
 
-    def __init__(
+    acquires_resource_pool = True
+
+    def __init__(  # noqa: PLR0913
         self: Self,
         plugin_id: str,
         base_url: str,
         endpoint: str,
         headers: dict[str, str],
         pagination: PluginPayload | None = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        max_concurrent_requests: int = 5,
+        watermark: dict[str, Any] | None = None,
     ) -> None:
         super().__init__(plugin_id)
         self.base_url = base_url
         self.endpoint = endpoint
         self.headers = headers
 
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.max_concurrent_requests = max_concurrent_requests
+        self.watermark = Watermark(plugin_id, **watermark) if watermark else None
+
         # Fetches the pagination plugin from the registry
         # if no pagination plugin is provided, the default is "page_based".
         pagination_payload = pagination or {
@@ -61,6 +98,13 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
         if not headers:
             raise ValueError("Headers must be provided for the API request.")
 
+    def _endpoint_url(self: Self, watermark: Any = None) -> str:  # noqa: ANN401
+        """Returns the URL of the endpoint, with the watermark of the last run as a query parameter."""
+        url = f"{self.base_url}/{self.endpoint}"
+        if watermark is None:
+            return url
+        return str(httpx.URL(url).copy_set_param(self.watermark.param, watermark))
+
     @staticmethod
     def _extract_data(response_data: dict | list) -> list[JSON_DATA]:
         """Extracts data from the response JSON.
@@ -84,6 +128,48 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
             return response_data
         return []
 
+    @staticmethod
+    async def _fetch_page(
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        semaphore: asyncio.Semaphore,
+        resource_pool: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Fetches a single page and returns its JSON body."""
+        async with semaphore, ResourcePools.acquire(resource_pool):
+            attributes = {"http.request.method": "GET", "url.full": url}
+            with Tracer.span("GET", kind=SpanKind.CLIENT, attributes=attributes) as span:
+                response = await client.get(url=url, headers=headers)
+                if span:
+                    span.attributes["http.response.status_code"] = response.status_code
+
+        if response.status_code != HTTPStatus.OK:
+            logging.error("Failed to retrieve data. Status code: %s", response.status_code)
+            response.raise_for_status()
+
+        return response.json()
+
+    async def _fetch_pages(
+        self: Self, client: httpx.AsyncClient, urls: list[str], headers: dict[str, str], semaphore: asyncio.Semaphore
+    ) -> list[Any]:
+        """Fetches the pages concurrently and returns their JSON bodies in the order of `urls`."""
+        if len(urls) == 1:
+            return [await self._fetch_page(client, urls[0], headers, semaphore, self.resource_pool)]
+
+        logging.debug("Fetching %s pages concurrently.", len(urls))
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(self._fetch_page(client, url, headers, semaphore, self.resource_pool))
+                    for url in urls
+                ]
+        except ExceptionGroup as eg:
+            # Surface the original error, so that the retry policy can act upon it.
+            raise eg.exceptions[0] from eg
+
+        return [task.result() for task in tasks]
+
     @retry(
         sleep=async_sleep,
         stop=stop_after_attempt(3),
@@ -99,7 +185,10 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
         """
         # TODO: Add supports for multiple endpoints with paginations async.
         results = []
-        next_page_url = f"{self.base_url}/{self.endpoint}"
+        # The state store is read off the event loop, as it may be a local database or file.
+        watermark = await asyncio.to_thread(self.watermark.current) if self.watermark else None
+        page_urls = [self.pagination_handler.first_page_url(self._endpoint_url(watermark))]
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
         # Include API key in request headers
         default_headers = {
@@ -109,18 +198,28 @@ class RestApiAsyncExtractor(IExtractPlugin, plugin_name="rest_api_extractor"):
 
         default_headers.update(self.headers)
 
-        async with httpx.AsyncClient() as client:
-            while next_page_url:
-                response = await client.get(url=next_page_url, headers=default_headers)
+        client = AsyncHttpClientPool.get_client(
+            self.base_url,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+            http2=self.http2,
+        )
 
-                if response.status_code != HTTPStatus.OK:
-                    logging.error("Failed to retrieve data. Status code: %s", response.status_code)
-                    response.raise_for_status()
+        while page_urls:
+            responses = await self._fetch_pages(client, page_urls, default_headers, semaphore)
 
-                response_json = response.json()
+            next_page_urls = []
+            for page_url, response_json in zip(page_urls, responses, strict=True):
                 results.extend(self._extract_data(response_json))
 
                 # Handle Pagination
-                next_page_url = self.pagination_handler(response_json) if isinstance(response_json, dict) else None
+                if isinstance(response_json, dict):
+                    next_page_urls.extend(self.pagination_handler.next_page_urls(response_json, page_url))
+
+            page_urls = next_page_urls
+
+        if self.watermark:
+            self.watermark.advance(results)
 
-            return results
+        return results
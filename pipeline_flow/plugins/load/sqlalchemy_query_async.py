@@ -2,20 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator, Generator
+from enum import StrEnum, unique
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator
 
 if TYPE_CHECKING:
     from typing import Self
 
     from pandas import DataFrame
 
+    from pipeline_flow.common.type_def import ColumnarData
+
 # Third Party Imports
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import column, insert, table, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 # Project Imports
+from pipeline_flow.common.utils.columnar import is_columnar
+from pipeline_flow.core.resource_pools import ResourcePools
+from pipeline_flow.core.tracing import SpanKind, Tracer
 from pipeline_flow.plugins import ILoadPlugin
+from pipeline_flow.plugins.utility.sqlalchemy_engine import AsyncEngineRegistry
+
+# Keeps a multi-row INSERT below the bind parameter limits of the supported databases.
+MAX_BIND_PARAMETERS = 30000
+
+
+@unique
+class LoadMode(StrEnum):
+    QUERY = "query"
+    BULK = "bulk"
 
 
 class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_loader"):
@@ -27,14 +44,32 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         db_host (str): The host for the database.
         db_port (str): PORT number for the database.
         db_name (str): The name of the database.
-        query (str): The query to execute uses SQLAlchemy text syntax.
+        query (str, optional): The query to execute uses SQLAlchemy text syntax. Required in `query` mode.
         concurrency_limit (int, optional): A sephomore limit on asyncio task concurrency. Defaults to 5.
         batch_size (int, optional): The batch size. Defaults to 100000.
         driver (str, optional): The database driver. Ensure that you are using asychronous driver.
                                 Defaults to "mysql+asyncmy".
+        mode (str, optional): `query` executes the query with the rows of each batch as its parameters,
+                              `bulk` inserts the rows into `table` with multi-row INSERT statements, or `COPY`
+                              for PostgreSQL with asyncpg. Defaults to "query".
+        table (str, optional): The target table, optionally schema qualified. Required in `bulk` mode.
+        pool_size (int, optional): Number of connections kept open in the pool. Defaults to the SQLAlchemy default.
+        max_overflow (int, optional): Number of connections opened beyond `pool_size` under load.
+                                      Defaults to the SQLAlchemy default.
+        pool_pre_ping (bool, optional): Tests connections for liveness before using them.
+                                        Defaults to the SQLAlchemy default.
+
+    Besides pandas DataFrames, the loader accepts columnar data (a `pyarrow.Table` or `pyarrow.RecordBatch`),
+    which is sliced into batches without copying.
+
+    The engine and its connection pool are shared with every other loader that uses the same connection string,
+    so the pool settings of the first loader for a database apply to all of them. The `resource_pool` of the
+    loader, if any, is acquired for every batch.
     """
 
-    def __init__(  # noqa: PLR0913
+    acquires_resource_pool = True
+
+    def __init__(  # noqa: PLR0913, PLR0917 - The connection settings are positional, the options keyword-only.
         self: Self,
         plugin_id: str,
         db_user: str,
@@ -42,10 +77,16 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         db_host: str,
         db_port: str,
         db_name: str,
-        query: str,
+        query: str | None = None,
         concurrency_limit: int = 5,
         batch_size: int = 100000,
         driver: str = "mysql+asyncmy",
+        *,
+        mode: str = LoadMode.QUERY,
+        table: str | None = None,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_pre_ping: bool | None = None,
     ) -> None:
         super().__init__(plugin_id)
         self.db_user = db_user
@@ -58,10 +99,21 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         self._query = query
         self._batch_size = batch_size
         self._driver = driver
+        self._mode = LoadMode(mode)
+        self._table = table
 
-        self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_pre_ping = pool_pre_ping
+
+        if self._mode == LoadMode.QUERY and not query:
+            raise ValueError("The `query` argument is required in `query` mode.")
 
-        self._session_maker = self._build_async_sessionmaker()
+        if self._mode == LoadMode.BULK and not table:
+            raise ValueError("The `table` argument is required in `bulk` mode.")
+
+        self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._session_maker: async_sessionmaker[AsyncSession] | None = None
 
     def _build_connection_string(self: Self) -> str:
         """A helper method that builds the connection string for the database.
@@ -72,7 +124,9 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         return f"{self._driver}://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
     def _build_async_sessionmaker(self: Self) -> async_sessionmaker[AsyncSession]:
-        """A helper method that builds an async session maker.
+        """A helper method that builds an async session maker on top of the shared engine of the database.
+
+        The engine is shared per event loop, so the session maker is built again when the loader runs on a new loop.
 
         In this link you can find more information about async context managers:
             https://docs.sqlalchemy.org/en/20/orm/session_basics.html#when-do-i-make-a-sessionmaker
@@ -81,8 +135,15 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
             async_sessionmaker[AsyncSession]: An async session maker.
         """
         database_url = self._build_connection_string()
-        engine = create_async_engine(database_url)
-        return async_sessionmaker(engine)
+        engine = AsyncEngineRegistry.get_engine(
+            database_url,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_pre_ping=self._pool_pre_ping,
+        )
+        if self._session_maker is None or self._session_maker.kw["bind"] is not engine:
+            self._session_maker = async_sessionmaker(engine)
+        return self._session_maker
 
     @asynccontextmanager
     async def get_async_session(self: Self) -> AsyncGenerator[AsyncSession]:
@@ -91,7 +152,7 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         Yields:
             Iterator[AsyncGenerator[AsyncSession, None]]: An async session.
         """
-        async with self._session_maker() as session:
+        async with self._build_async_sessionmaker()() as session:
             try:
                 yield session
             except Exception:
@@ -100,19 +161,93 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
             else:
                 await session.commit()
 
-    def chunk_dataframe(self: Self, df: DataFrame) -> Generator[list[dict]]:
+    def chunk_dataframe(self: Self, df: DataFrame | ColumnarData) -> Generator[list[dict]]:
         """A generator that chunks a pandas DataFrame into smaller dataframes.
 
         The chunk size is defined by the `_batch_size` attribute of the class.
 
         Args:
-            df (pd.DataFrame): Extracted or transformed data.
+            df (pd.DataFrame | ColumnarData): Extracted or transformed data.
 
         Yields:
             Generator[list[dict]]: A list of dictionaries containing the data.
         """
+        for batch in self.slice_dataframe(df):
+            yield batch.to_pylist() if is_columnar(batch) else batch.to_dict("records")
+
+    def slice_dataframe(self: Self, df: DataFrame | ColumnarData) -> Generator[DataFrame | ColumnarData]:
+        """A generator that slices a pandas DataFrame into batches of `_batch_size` rows, without copying.
+
+        Args:
+            df (pd.DataFrame | ColumnarData): Extracted or transformed data.
+
+        Yields:
+            Generator[DataFrame | ColumnarData]: A slice of the DataFrame.
+        """
+        columnar = is_columnar(df)
         for i in range(0, len(df), self._batch_size):
-            yield df.iloc[i : i + self._batch_size].to_dict("records")
+            yield df.slice(i, self._batch_size) if columnar else df.iloc[i : i + self._batch_size]
+
+    @staticmethod
+    def _to_rows(df: DataFrame | ColumnarData) -> list[tuple[Any, ...]]:
+        """Converts a DataFrame column by column into row tuples of native Python values."""
+        if is_columnar(df):
+            return list(zip(*(col.to_pylist() for col in df.columns), strict=True))
+
+        return list(zip(*(df[col].tolist() for col in df.columns), strict=True))
+
+    @staticmethod
+    def _column_names(df: DataFrame | ColumnarData) -> list[str]:
+        return list(df.column_names) if is_columnar(df) else [str(col) for col in df.columns]
+
+    def _span_kwargs(self: Self, rows: int) -> dict[str, Any]:
+        attributes = {
+            "db.system": self._driver.split("+")[0],
+            "db.namespace": self.db_name,
+            "db.collection.name": self._table,
+            "db.operation.batch.size": rows,
+        }
+        return {"kind": SpanKind.CLIENT, "attributes": attributes}
+
+    def _uses_copy(self: Self) -> bool:
+        return self._driver.startswith("postgresql+asyncpg")
+
+    async def _copy_records(self: Self, session: AsyncSession, columns: list[str], rows: list[tuple]) -> None:
+        """Loads the rows with the PostgreSQL `COPY` protocol of the asyncpg driver."""
+        schema_name, _, table_name = self._table.rpartition(".")
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_name, records=rows, columns=columns, schema_name=schema_name or None
+        )
+
+    async def _insert_multi_values(self: Self, session: AsyncSession, columns: list[str], rows: list[tuple]) -> None:
+        """Loads the rows with multi-row `INSERT ... VALUES` statements."""
+        schema_name, _, table_name = self._table.rpartition(".")
+        target = table(table_name, *(column(col) for col in columns), schema=schema_name or None)
+
+        rows_per_statement = max(1, MAX_BIND_PARAMETERS // max(1, len(columns)))
+        for i in range(0, len(rows), rows_per_statement):
+            await session.execute(insert(target).values(rows[i : i + rows_per_statement]))
+
+    async def execute_bulk_insert(self: Self, batch: DataFrame | ColumnarData) -> None:
+        """Inserts a batch into the target table without building a dictionary per row.
+
+        Args:
+            batch (pd.DataFrame | ColumnarData): A batch of data from the DataFrame.
+        """
+        async with self._semaphore, ResourcePools.acquire(self.resource_pool):
+            # Converted once the batch is let in, so only the batches in flight are held as rows.
+            columns = self._column_names(batch)
+            rows = self._to_rows(batch)
+            async with self.get_async_session() as session:
+                if self._uses_copy():
+                    with Tracer.span("COPY", **self._span_kwargs(len(rows))):
+                        await self._copy_records(session, columns, rows)
+                else:
+                    with Tracer.span("INSERT", **self._span_kwargs(len(rows))):
+                        await self._insert_multi_values(session, columns, rows)
 
     async def execute_batch_query(self: Self, batch: list[dict]) -> None:
         """Executes a batch query. As per the SQLAlchemy documentation, new AsyncSession
@@ -124,17 +259,25 @@ class AsyncSQLAlchemyQueryLoader(ILoadPlugin, plugin_name="sqlalchemy_query_load
         Args:
             batch (list[dict]): A batch of data from the DataFrame.
         """
-        async with self._semaphore:  # noqa: SIM117 - asyncio is exempt from this rule.
+        async with self._semaphore, ResourcePools.acquire(self.resource_pool):  # noqa: SIM117 - asyncio is exempt.
             async with self.get_async_session() as session:
-                await session.execute(text(self._query), batch)
+                with Tracer.span("query", **self._span_kwargs(len(batch))):
+                    await session.execute(text(self._query), batch)
 
-    async def __call__(self, data: DataFrame) -> None:
+    async def __call__(self, data: DataFrame | ColumnarData) -> None:
         """A method that loads data into a database using SQLAlchemy using query.
 
         Args:
-            data (pd.DataFrame): Extracted or transformed data from the pipeline.
+            data (pd.DataFrame | ColumnarData): Extracted or transformed data from the pipeline.
         """
 
+        if self._mode == LoadMode.BULK:
+            logging.debug("Bulk loading %s rows into `%s`.", len(data), self._table)
+            async with asyncio.TaskGroup() as tg:
+                for batch in self.slice_dataframe(data):
+                    tg.create_task(self.execute_bulk_insert(batch))
+            return
+
         async with asyncio.TaskGroup() as tg:
             for batch in self.chunk_dataframe(data):
                 tg.create_task(self.execute_batch_query(batch))
@@ -27,8 +27,13 @@ class AWSSecretManager(ISecretManager, plugin_name="aws_secret_manager"):
     def __init__(self, plugin_id: str, region: str, secret_name: str) -> None:
         super().__init__(plugin_id)
         self.client = boto3.client("secretsmanager", region_name=region)
+        self.region = region
         self.secret_name = secret_name
 
+    @property
+    def cache_key(self) -> str:
+        return f"aws_secret_manager:{self.region}:{self.secret_name}"
+
     @property
     def resource_id(self) -> str:
         """Get the ARN of the secret from AWS Secrets Manager."""
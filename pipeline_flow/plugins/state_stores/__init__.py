@@ -0,0 +1,4 @@
+from .json_state_store import JsonFileStateStore
+from .sqlite_state_store import SQLiteStateStore
+
+__all__ = ["JsonFileStateStore", "SQLiteStateStore"]
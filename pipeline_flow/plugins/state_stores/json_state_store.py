@@ -0,0 +1,46 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# Third Party Imports
+# Local Imports
+from pipeline_flow.plugins import IStateStore
+
+
+class JsonFileStateStore(IStateStore, plugin_name="json_file_state_store"):
+    """Stores the state of the pipelines in a local JSON file, keyed by namespace.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        path (str, optional): The JSON file, created on first write. Defaults to ".pipeline_flow/state.json".
+    """
+
+    def __init__(self, plugin_id: str, path: str = ".pipeline_flow/state.json") -> None:
+        super().__init__(plugin_id)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def get(self, namespace: str, key: str) -> Any:  # noqa: ANN401
+        with self._lock:
+            return self._read().get(namespace, {}).get(key)
+
+    def set_many(self, namespace: str, values: dict[str, Any]) -> None:
+        with self._lock:
+            state = self._read()
+            state.setdefault(namespace, {}).update(values)
+
+            # Written to a temporary file first, so a crash never leaves a truncated state behind.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temporary_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+            temporary_path.replace(self.path)
@@ -0,0 +1,63 @@
+# Standard Imports
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+# Third Party Imports
+# Local Imports
+from pipeline_flow.plugins import IStateStore
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS pipeline_state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+_UPSERT = """
+INSERT INTO pipeline_state (namespace, key, value, updated_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+"""
+
+
+class SQLiteStateStore(IStateStore, plugin_name="sqlite_state_store"):
+    """Stores the state of the pipelines in a local SQLite database.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        path (str, optional): The database file, created on first use. Defaults to ".pipeline_flow/state.db".
+    """
+
+    def __init__(self, plugin_id: str, path: str = ".pipeline_flow/state.db") -> None:
+        super().__init__(plugin_id)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(_CREATE_TABLE)
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation, as the store is used from the event loop and executor threads.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, namespace: str, key: str) -> Any:  # noqa: ANN401
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT value FROM pipeline_state WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_many(self, namespace: str, values: dict[str, Any]) -> None:
+        updated_at = time.time()
+        rows = [(namespace, key, json.dumps(value), updated_at) for key, value in values.items()]
+        # The connection context manager commits the whole batch in a single transaction.
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(_UPSERT, rows)
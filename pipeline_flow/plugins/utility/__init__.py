@@ -1,3 +1,29 @@
-from .pagination import HATEOASPagination, PageBasedPagination
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["HATEOASPagination", "PageBasedPagination"]
+from .http_client import AsyncHttpClientPool
+from .pagination import HATEOASPagination, OffsetLimitPagination, PageBasedPagination, PageNumberPagination
+from .watermark import Watermark
+
+if TYPE_CHECKING:
+    from .sqlalchemy_engine import AsyncEngineRegistry
+
+# Imported on first access, so that the HTTP plugins do not import SQLAlchemy.
+_LAZY_EXPORTS = {"AsyncEngineRegistry": ".sqlalchemy_engine"}
+
+__all__ = [
+    "AsyncEngineRegistry",
+    "AsyncHttpClientPool",
+    "HATEOASPagination",
+    "OffsetLimitPagination",
+    "PageBasedPagination",
+    "PageNumberPagination",
+    "Watermark",
+]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,74 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import ClassVar
+from weakref import WeakKeyDictionary
+
+# Third Party Imports
+import httpx
+
+# Local Imports
+from pipeline_flow.common.utils import SingletonMeta, register_shutdown_hook
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+class AsyncHttpClientPool(metaclass=SingletonMeta):
+    """A process-wide pool of `httpx.AsyncClient` instances, one per origin (scheme, host and port).
+
+    Extract steps that target the same API share a client and therefore its warm keep-alive connections.
+    Clients are bound to the event loop that created them, so a new loop gets its own set of clients.
+    """
+
+    _clients: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]] = WeakKeyDictionary()
+
+    @staticmethod
+    def _origin(base_url: str) -> str:
+        url = httpx.URL(base_url)
+        return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+    @classmethod
+    def get_client(
+        cls,
+        base_url: str,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+    ) -> httpx.AsyncClient:
+        """Returns the shared client for the origin of `base_url`, creating it on first use.
+
+        The limits and HTTP/2 setting of the first caller for an origin are used for the lifetime of the client.
+        HTTP/2 requires the optional `h2` package (`pip install httpx[http2]`).
+        """
+        loop_clients = cls._clients.setdefault(asyncio.get_running_loop(), {})
+        origin = cls._origin(base_url)
+
+        client = loop_clients.get(origin)
+        if client is None or client.is_closed:
+            logging.debug("Creating a shared HTTP client for `%s`.", origin)
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            client = httpx.AsyncClient(limits=limits, http2=http2)
+            loop_clients[origin] = client
+
+            register_shutdown_hook(cls.aclose_all)
+
+        return client
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Closes every client created on the running event loop."""
+        loop_clients = cls._clients.pop(asyncio.get_running_loop(), {})
+
+        for origin, client in loop_clients.items():
+            logging.debug("Closing the shared HTTP client for `%s`.", origin)
+            await client.aclose()
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Self
+from typing import Any, Self
 
 # Third Party Imports
+import httpx
+
 # Local Imports
 from pipeline_flow.plugins import IPlugin
 
@@ -17,6 +19,29 @@ class IPaginationHandler(ABC, IPlugin, interface=True):
         """Asynchronously fetch data from the API endpoint and handle pagination."""
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def first_page_url(self: Self, url: str) -> str:
+        """Returns the URL of the first page. Handlers can override it to add their query parameters."""
+        return url
+
+    def next_page_urls(self: Self, response: dict, url: str) -> list[str]:  # noqa: ARG002
+        """Returns the URLs of the pages to fetch after the page at `url`.
+
+        The extract plugin fetches every returned URL concurrently, so handlers that know the total number of
+        pages can return all the remaining pages at once. By default, it returns the single next page.
+        """
+        next_page_url = self(response)
+        return [next_page_url] if next_page_url else []
+
+
+def _get_nested_value(response: dict, key_path: str) -> Any:  # noqa: ANN401
+    """Returns the value of a dotted key path, e.g. `meta.total`, or None if it does not exist."""
+    value = response
+    for key in key_path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
 
 class PageBasedPagination(IPaginationHandler, plugin_name="page_based_pagination"):
     def __call__(self: Self, response: dict) -> str | None:
@@ -32,3 +57,105 @@ class HATEOASPagination(IPaginationHandler, plugin_name="hateoas_pagination"):
     def __call__(self: Self, response: dict) -> str | None:
         links = response.get("_links", response.get("links", {}))
         return links.get("next", None)
+
+
+class OffsetLimitPagination(IPaginationHandler, plugin_name="offset_limit_pagination"):
+    """Pagination strategy for APIs using `offset` and `limit` query parameters that report the total record count.
+
+    All the remaining pages are derived from the first response, so they can be fetched concurrently.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        limit (int): The number of records per page.
+        total_key (str, optional): Dotted path of the total record count in the response. Defaults to "total".
+        offset_param (str, optional): The name of the offset query parameter. Defaults to "offset".
+        limit_param (str, optional): The name of the limit query parameter. Defaults to "limit".
+    """
+
+    def __init__(
+        self: Self,
+        plugin_id: str,
+        limit: int,
+        total_key: str = "total",
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+    ) -> None:
+        super().__init__(plugin_id)
+        if limit < 1:
+            raise ValueError("The `limit` must be a positive integer.")
+
+        self.limit = limit
+        self.total_key = total_key
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+
+    def __call__(self: Self, response: dict) -> str | None:  # noqa: ARG002
+        """Pages are scheduled as a batch by `next_page_urls`, so there is never a single next page."""
+        return None
+
+    def first_page_url(self: Self, url: str) -> str:
+        return str(httpx.URL(url).copy_merge_params({self.offset_param: 0, self.limit_param: self.limit}))
+
+    def next_page_urls(self: Self, response: dict, url: str) -> list[str]:
+        page_url = httpx.URL(url)
+
+        # Only the first page schedules the remaining pages.
+        if int(page_url.params.get(self.offset_param, 0)) != 0:
+            return []
+
+        total = _get_nested_value(response, self.total_key)
+        if total is None:
+            return []
+
+        return [
+            str(page_url.copy_set_param(self.offset_param, offset))
+            for offset in range(self.limit, int(total), self.limit)
+        ]
+
+
+class PageNumberPagination(IPaginationHandler, plugin_name="page_number_pagination"):
+    """Pagination strategy for APIs using a page number query parameter that report the total page count.
+
+    All the remaining pages are derived from the first response, so they can be fetched concurrently.
+
+    Args:
+        plugin_id (str): The unique identifier of the plugin callable.
+        total_pages_key (str, optional): Dotted path of the total page count in the response. Defaults to "total_pages".
+        page_param (str, optional): The name of the page number query parameter. Defaults to "page".
+        first_page (int, optional): The number of the first page. Defaults to 1.
+    """
+
+    def __init__(
+        self: Self,
+        plugin_id: str,
+        total_pages_key: str = "total_pages",
+        page_param: str = "page",
+        first_page: int = 1,
+    ) -> None:
+        super().__init__(plugin_id)
+        self.total_pages_key = total_pages_key
+        self.page_param = page_param
+        self.first_page = first_page
+
+    def __call__(self: Self, response: dict) -> str | None:  # noqa: ARG002
+        """Pages are scheduled as a batch by `next_page_urls`, so there is never a single next page."""
+        return None
+
+    def first_page_url(self: Self, url: str) -> str:
+        return str(httpx.URL(url).copy_set_param(self.page_param, self.first_page))
+
+    def next_page_urls(self: Self, response: dict, url: str) -> list[str]:
+        page_url = httpx.URL(url)
+
+        # Only the first page schedules the remaining pages.
+        if int(page_url.params.get(self.page_param, self.first_page)) != self.first_page:
+            return []
+
+        total_pages = _get_nested_value(response, self.total_pages_key)
+        if total_pages is None:
+            return []
+
+        last_page = self.first_page + int(total_pages) - 1
+        return [
+            str(page_url.copy_set_param(self.page_param, page)) for page in range(self.first_page + 1, last_page + 1)
+        ]
@@ -0,0 +1,67 @@
+# Standard Imports
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+# Third Party Imports
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+# Local Imports
+from pipeline_flow.common.utils import SingletonMeta, register_shutdown_hook
+
+
+class AsyncEngineRegistry(metaclass=SingletonMeta):
+    """A process-wide registry of SQLAlchemy async engines, one per connection string.
+
+    Load steps that target the same database share an engine and therefore its connection pool.
+    Pooled connections are bound to the event loop that opened them, so a new loop gets its own set of engines.
+    Every engine is disposed when the orchestration ends.
+    """
+
+    _engines: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncEngine]]] = WeakKeyDictionary()
+
+    @classmethod
+    def get_engine(
+        cls,
+        database_url: str,
+        *,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_pre_ping: bool | None = None,
+    ) -> AsyncEngine:
+        """Returns the shared engine for the connection string, creating it on first use.
+
+        The pool settings of the first caller for a connection string are used for the lifetime of the engine.
+        Settings left as None fall back to the SQLAlchemy defaults of the dialect.
+        """
+        loop_engines = cls._engines.setdefault(asyncio.get_running_loop(), {})
+        engine = loop_engines.get(database_url)
+        if engine is not None:
+            return engine
+
+        pool_options: dict[str, Any] = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        pool_options = {key: value for key, value in pool_options.items() if value is not None}
+
+        engine = create_async_engine(database_url, **pool_options)
+        logging.debug("Created a shared async engine for `%s`.", engine.url)
+
+        loop_engines[database_url] = engine
+        register_shutdown_hook(cls.dispose_all)
+
+        return engine
+
+    @classmethod
+    async def dispose_all(cls) -> None:
+        """Closes the connection pools of every engine created on the running event loop."""
+        loop_engines = cls._engines.pop(asyncio.get_running_loop(), {})
+
+        for engine in loop_engines.values():
+            logging.debug("Disposing the shared async engine for `%s`.", engine.url)
+            await engine.dispose()
@@ -0,0 +1,57 @@
+# Standard Imports
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from typing import TYPE_CHECKING, Any, Self
+
+# Local Imports
+from pipeline_flow.core.context import current_context
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+WATERMARK_STATE_KEY = "watermark"
+
+
+def _to_state_value(value: Any) -> Any:  # noqa: ANN401
+    """Converts dates and datetimes to ISO strings, so they can be persisted as JSON."""
+    if isinstance(value, dt.date | dt.datetime):
+        return value.isoformat()
+    return value
+
+
+class Watermark:
+    """Tracks the highest value of a field across runs, so that an incremental extract only fetches new rows.
+
+    The watermark is read from the state of the plugin when the extract starts, and the highest value of the
+    extracted rows is persisted once the pipeline succeeds.
+
+    Args:
+        plugin_id (str): The extract plugin that owns the watermark.
+        field (str): The field of the extracted rows holding the watermark, e.g. `updated_at`.
+        param (str, optional): The query parameter, or bind parameter, that receives the watermark.
+                               Defaults to "watermark".
+        initial (Any, optional): The watermark of the first run. Defaults to None, which extracts everything.
+    """
+
+    def __init__(self: Self, plugin_id: str, field: str, param: str = "watermark", initial: Any = None) -> None:  # noqa: ANN401
+        self.plugin_id = plugin_id
+        self.field = field
+        self.param = param
+        self.initial = _to_state_value(initial)
+
+    def current(self: Self) -> Any:  # noqa: ANN401
+        """Returns the watermark of the last successful run, or the initial watermark."""
+        return current_context().state(self.plugin_id).get(WATERMARK_STATE_KEY, self.initial)
+
+    def advance(self: Self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Stages the highest value of the field in the extracted rows as the next watermark."""
+        values = [_to_state_value(row[self.field]) for row in rows if row.get(self.field) is not None]
+        if not values:
+            logging.debug("No new rows for the watermark of `%s`.", self.plugin_id)
+            return
+
+        watermark = max(values)
+        logging.debug("Advancing the watermark of `%s` to `%s`.", self.plugin_id, watermark)
+        current_context().state(self.plugin_id).set(WATERMARK_STATE_KEY, watermark)
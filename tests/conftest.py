@@ -16,6 +16,7 @@ from pipeline_flow.core.models.phases import (
 )
 from pipeline_flow.core.models.pipeline import Pipeline
 from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.secret_cache import SecretCache
 from tests.resources.plugins import (
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
@@ -30,6 +31,12 @@ def setup_logging_level() -> None:
     setup_logger()
 
 
+@pytest.fixture(autouse=True)
+def reset_secret_cache() -> None:
+    # Secrets cached by one test must not be served to the next one.
+    SecretCache.reset()
+
+
 @pytest.fixture
 def restart_plugin_registry() -> Generator[None, None, None]:
     # When running multiple tests, the PluginRegistry singleton will retain state between tests.
@@ -68,6 +75,7 @@ def _pipeline_factory(default_config: dict[str, Any]) -> Callable[..., Pipeline]
             description=config.get("description", ""),
             type=config["type"],  # type: ignore[reportArgumentType]
             needs=config["needs"],
+            streaming=config.get("streaming", False),
             phases=phases,  # type: ignore[reportArgumentType]
         )
 
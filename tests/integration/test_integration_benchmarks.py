@@ -0,0 +1,51 @@
+# Standard Imports
+import json
+from pathlib import Path
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from benchmarks.runner import main, run_scenario
+from benchmarks.scenarios import SCENARIOS, generate_yaml
+from pipeline_flow.core.parsers import YamlParser
+from pipeline_flow.core.registry import PluginRegistry
+
+# The benchmark and built-in plugins are registered on import, before any test resets the registry.
+REGISTERED_PLUGINS = dict(PluginRegistry._registry)
+
+
+@pytest.fixture(autouse=True)
+def register_benchmark_plugins() -> None:
+    PluginRegistry._registry.update(REGISTERED_PLUGINS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_benchmark_scenario_runs(name: str) -> None:
+    scenario = SCENARIOS[name]
+    if missing := scenario.missing_requirements():
+        pytest.skip(f"Missing {missing}")
+
+    result = await run_scenario(scenario, size=4, repeat=2, warmup=0)
+
+    assert result.operations > 0
+    assert len(result.wall_times) == 2
+    assert result.summary()["throughput"] > 0
+
+
+def test_generate_yaml_plugin_count() -> None:
+    pipelines = YamlParser(generate_yaml(plugins=250, plugins_per_pipeline=100)).pipelines
+
+    assert len(pipelines) == 3
+    assert sum(len(pipeline["phases"]["transform"]["steps"]) for pipeline in pipelines.values()) == 250
+
+
+def test_benchmark_report(tmp_path: Path) -> None:
+    output = tmp_path / "report.json"
+
+    assert main(["--scenario", "tiny_pipelines", "--scale", "0.01", "--repeat", "1", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert report["environment"]["schema_version"] == 1
+    assert [result["scenario"] for result in report["results"]] == ["tiny_pipelines"]
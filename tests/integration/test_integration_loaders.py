@@ -1,12 +1,25 @@
 # Standard Imports
+import json
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 # Project Imports
-from pipeline_flow.core.plugin_loader import load_custom_plugins
+from pipeline_flow.core import plugin_index
+from pipeline_flow.core.plugin_index import PLUGIN_INDEX_ENV
+from pipeline_flow.core.plugin_loader import load_custom_plugins, load_plugins
 from pipeline_flow.core.registry import PluginRegistry
 
+PLUGIN_TEMPLATE = """
+from pipeline_flow.plugins import IExtractPlugin
+
+
+class {class_name}(IExtractPlugin, plugin_name="{plugin_name}"):
+    async def __call__(self) -> str:
+        return "DATA"
+"""
+
 
 @pytest.mark.usefixtures("restart_plugin_registry")
 def test_load_custom_multiple_plugins() -> None:
@@ -39,3 +52,42 @@ def test_load_plugins_invalid_path() -> None:
     plugins = {"/invalid/path/plugin.py"}
     with pytest.raises(FileNotFoundError):
         load_custom_plugins(plugins)
+
+
+@pytest.mark.usefixtures("restart_plugin_registry")
+def test_load_plugins_imports_only_used_plugin_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    monkeypatch.setattr(PluginRegistry, "_lazy_registry", {})
+    index_path = tmp_path / "index.json"
+    monkeypatch.setenv(PLUGIN_INDEX_ENV, str(index_path))
+    used_file, unused_file = tmp_path / "used.py", tmp_path / "unused.py"
+    used_file.write_text(PLUGIN_TEMPLATE.format(class_name="UsedPlugin", plugin_name="used_plugin"))
+    unused_file.write_text(PLUGIN_TEMPLATE.format(class_name="UnusedPlugin", plugin_name="unused_plugin"))
+    scan_spy = mocker.spy(plugin_index, "scan_plugin_file")
+
+    load_plugins({"custom": {"dirs": [str(tmp_path)]}})
+
+    # Nothing is executed until a plugin is retrieved.
+    assert PluginRegistry._registry == {}
+    assert PluginRegistry.get("used_plugin").__name__ == "UsedPlugin"
+    assert "unused_plugin" not in PluginRegistry._registry
+
+    # The index is cached on disk, so unchanged files are not parsed again.
+    load_plugins({"custom": {"dirs": [str(tmp_path)]}})
+
+    assert scan_spy.call_count == 2
+    assert json.loads(index_path.read_text())["files"][str(used_file)]["plugins"] == {"used_plugin": "UsedPlugin"}
+
+
+@pytest.mark.usefixtures("restart_plugin_registry")
+def test_load_plugins_executes_files_with_dynamic_plugin_names(tmp_path: Path) -> None:
+    plugin_file = tmp_path / "dynamic.py"
+    # The plugin name is not a string literal, so it is only known once the file is executed.
+    plugin_file.write_text(
+        PLUGIN_TEMPLATE.replace('"{plugin_name}"', '"_".join(("dynamic", "plugin"))').format(class_name="DynamicPlugin")
+    )
+
+    load_plugins({"custom": {"files": [str(plugin_file)]}})
+
+    assert PluginRegistry._registry["dynamic_plugin"].__name__ == "DynamicPlugin"
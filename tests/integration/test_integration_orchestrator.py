@@ -28,10 +28,10 @@ async def test_execute_single_pipeline(
     etl_pipeline_factory: Callable[..., Pipeline], orchestrator: PipelineOrchestrator
 ) -> None:
     job1 = etl_pipeline_factory(name="Job1")
-    await orchestrator.pipeline_queue_producer([job1])
 
-    await orchestrator._execute_pipeline()
+    executed = await orchestrator.execute_pipelines(pipelines=[job1])
 
+    assert executed == {"Job1"}
     assert orchestrator.pipeline_queue.qsize() == 0
     assert job1.is_executed is True
 
@@ -1,19 +1,23 @@
 # Standad Imports
+import asyncio
+from pathlib import Path
 from typing import Generator
 
 # Third Party Imports
 import pytest
-from httpx import HTTPStatusError
+from httpx import HTTPStatusError, Request, Response
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
-from pipeline_flow.core.parsers import YamlParser
-
 # Local Imports
+from pipeline_flow.core.context import PipelineContext
+from pipeline_flow.core.parsers import YamlParser
 from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.tracing import SpanKind, Tracer
 from pipeline_flow.plugins import IPlugin
 from pipeline_flow.plugins.extract import RestApiAsyncExtractor
-from pipeline_flow.plugins.utility import pagination
+from pipeline_flow.plugins.state_stores import JsonFileStateStore
+from pipeline_flow.plugins.utility import AsyncHttpClientPool, pagination
 
 
 @pytest.fixture
@@ -48,6 +52,8 @@ def register_plugins_in_registry(restart_plugin_registry) -> Generator[None, Non
     PluginRegistry.register("rest_api_extractor", RestApiAsyncExtractor)
     PluginRegistry.register("hateoas_pagination", pagination.HATEOASPagination)
     PluginRegistry.register("page_based_pagination", pagination.PageBasedPagination)
+    PluginRegistry.register("offset_limit_pagination", pagination.OffsetLimitPagination)
+    PluginRegistry.register("page_number_pagination", pagination.PageNumberPagination)
 
 
 @pytest.mark.asyncio
@@ -103,6 +109,111 @@ async def test_pagination_multiple_pages(api_client: IPlugin, httpx_mock: HTTPXM
     ]
 
 
+@pytest.mark.asyncio
+async def test_offset_limit_pagination_fetches_pages_concurrently(
+    base_url: str, test_endpoint: str, test_api_key: str, httpx_mock: HTTPXMock
+) -> None:
+    api_client = RestApiAsyncExtractor(
+        plugin_id="test_api_extractor",
+        base_url=base_url,
+        endpoint=test_endpoint,
+        headers={"Authorization": test_api_key},
+        pagination={"plugin": "offset_limit_pagination", "args": {"limit": 2, "total_key": "meta.total"}},
+    )
+    url = f"{base_url}/{test_endpoint}"
+
+    httpx_mock.add_response(url=f"{url}?offset=0&limit=2", json={"data": [{"id": 1}, {"id": 2}], "meta": {"total": 5}})
+    httpx_mock.add_response(url=f"{url}?offset=2&limit=2", json={"data": [{"id": 3}, {"id": 4}]})
+    httpx_mock.add_response(url=f"{url}?offset=4&limit=2", json={"data": [{"id": 5}]})
+
+    result = await api_client()
+
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_page_number_pagination_preserves_page_order(
+    base_url: str, test_endpoint: str, test_api_key: str, httpx_mock: HTTPXMock
+) -> None:
+    api_client = RestApiAsyncExtractor(
+        plugin_id="test_api_extractor",
+        base_url=base_url,
+        endpoint=test_endpoint,
+        headers={"Authorization": test_api_key},
+        pagination={"plugin": "page_number_pagination"},
+        max_concurrent_requests=2,
+    )
+    url = f"{base_url}/{test_endpoint}"
+    max_in_flight = 0
+    in_flight = 0
+
+    async def page_response(request: Request) -> Response:
+        nonlocal in_flight, max_in_flight
+        page = int(request.url.params["page"])
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later pages respond first to verify that the results are reassembled in page order.
+        await asyncio.sleep(0.01 * (5 - page))
+        in_flight -= 1
+
+        return Response(status_code=200, json={"data": [{"page": page}], "total_pages": 4})
+
+    httpx_mock.add_callback(page_response, is_reusable=True)
+
+    result = await api_client()
+
+    assert result == [{"page": 1}, {"page": 2}, {"page": 3}, {"page": 4}]
+    assert str(httpx_mock.get_requests()[0].url) == f"{url}?page=1"
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pagination_failure(
+    base_url: str, test_endpoint: str, test_api_key: str, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    mocker.patch("asyncio.sleep")
+    api_client = RestApiAsyncExtractor(
+        plugin_id="test_api_extractor",
+        base_url=base_url,
+        endpoint=test_endpoint,
+        headers={"Authorization": test_api_key},
+        pagination={"plugin": "page_number_pagination"},
+    )
+    url = f"{base_url}/{test_endpoint}"
+
+    httpx_mock.add_response(url=f"{url}?page=1", json={"data": [], "total_pages": 3}, is_reusable=True)
+    httpx_mock.add_response(url=f"{url}?page=2", json={"data": []}, is_reusable=True)
+    httpx_mock.add_response(url=f"{url}?page=3", status_code=500, is_reusable=True)
+
+    with pytest.raises(HTTPStatusError):
+        await api_client()
+
+
+def test_offset_limit_pagination_next_page_urls() -> None:
+    handler = pagination.OffsetLimitPagination(plugin_id="offset", limit=10)
+
+    first_url = handler.first_page_url("https://api.example.com/users?active=true")
+
+    assert first_url == "https://api.example.com/users?active=true&offset=0&limit=10"
+    assert handler.next_page_urls({"total": 25}, first_url) == [
+        "https://api.example.com/users?active=true&offset=10&limit=10",
+        "https://api.example.com/users?active=true&offset=20&limit=10",
+    ]
+    assert handler.next_page_urls({"total": 25}, "https://api.example.com/users?offset=10&limit=10") == []
+    assert handler.next_page_urls({}, first_url) == []
+
+
+def test_default_next_page_urls() -> None:
+    handler = pagination.HATEOASPagination(plugin_id="hateoas")
+
+    assert handler.next_page_urls({"links": {"next": "https://api.example.com/users?page=2"}}, "ignored") == [
+        "https://api.example.com/users?page=2"
+    ]
+    assert handler.next_page_urls({"links": {}}, "ignored") == []
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("status_code", [(403), (404), (429), (500), (502), (503), (504)])
 async def test_api_failure(status_code: int, api_client: IPlugin, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
@@ -115,6 +226,55 @@ async def test_api_failure(status_code: int, api_client: IPlugin, httpx_mock: HT
     assert asyncio_sleep.call_count == 2, "The setting is set till 3 retries, so it should be 2"
 
 
+@pytest.mark.asyncio
+async def test_extractors_share_client_for_same_host(
+    api_client: RestApiAsyncExtractor, base_url: str, test_api_key: str, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    httpx_mock.add_response(status_code=200, json=[], is_reusable=True)
+    get_client_spy = mocker.spy(AsyncHttpClientPool, "get_client")
+
+    other_client = RestApiAsyncExtractor(
+        plugin_id="other_api_extractor", base_url=base_url, endpoint="/orders", headers={"Authorization": test_api_key}
+    )
+
+    await api_client()
+    await other_client()
+
+    assert get_client_spy.spy_return_list[0] is get_client_spy.spy_return_list[1]
+
+    await AsyncHttpClientPool.aclose_all()
+
+
+@pytest.mark.asyncio
+async def test_client_pool_one_client_per_host() -> None:
+    client = AsyncHttpClientPool.get_client("https://api.example.com/v1")
+
+    assert AsyncHttpClientPool.get_client("https://api.example.com/v2") is client
+    assert AsyncHttpClientPool.get_client("https://other.example.com/v1") is not client
+    assert AsyncHttpClientPool.get_client("http://api.example.com/v1") is not client
+
+    await AsyncHttpClientPool.aclose_all()
+
+    assert client.is_closed
+    assert AsyncHttpClientPool.get_client("https://api.example.com/v1") is not client
+
+    await AsyncHttpClientPool.aclose_all()
+
+
+@pytest.mark.asyncio
+async def test_client_pool_limits() -> None:
+    client = AsyncHttpClientPool.get_client(
+        "https://limits.example.com", max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0
+    )
+
+    pool = client._transport._pool
+    assert pool._max_connections == 8
+    assert pool._max_keepalive_connections == 4
+    assert pool._keepalive_expiry == 30.0
+
+    await AsyncHttpClientPool.aclose_all()
+
+
 def test_parse_rest_api_extractor_with_different_pagination_handler(
     base_url: str, test_endpoint: str, test_api_key: str
 ) -> None:
@@ -168,3 +328,49 @@ def test_parse_rest_api_extractor_yaml(base_url: str, test_endpoint: str, test_a
 
     # Verify that the instantiated object is of the correct type
     assert isinstance(extractor, RestApiAsyncExtractor), "Extractor instance is not of type RestApiAsyncExtractor"
+
+
+@pytest.mark.asyncio
+async def test_request_span_when_tracing(api_client: IPlugin, httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    httpx_mock.add_response(status_code=200, json=[{"id": 1}])
+    Tracer.configure(str(tmp_path / "traces.jsonl"))
+
+    try:
+        with Tracer.span("plugin test_api_extractor") as parent:
+            await api_client()
+        spans = Tracer.spans()
+    finally:
+        Tracer.configure(None)
+        Tracer.reset()
+
+    request_span = spans[0]
+    assert (request_span.name, request_span.kind) == ("GET", SpanKind.CLIENT)
+    assert request_span.parent_span_id == parent.span_id
+    assert request_span.attributes["http.response.status_code"] == 200
+
+
+@pytest.mark.asyncio
+async def test_watermark_is_sent_and_advanced(
+    base_url: str, test_endpoint: str, test_api_key: str, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    api_client = RestApiAsyncExtractor(
+        plugin_id="test_api_extractor",
+        base_url=base_url,
+        endpoint=test_endpoint,
+        headers={"Authorization": test_api_key},
+        watermark={"field": "updated_at", "param": "updated_since", "initial": "2025-01-01"},
+    )
+    state_store = JsonFileStateStore(plugin_id="state", path=str(tmp_path / "state.json"))
+    httpx_mock.add_response(
+        url=f"{base_url}/{test_endpoint}?updated_since=2025-01-01",
+        json=[{"id": 1, "updated_at": "2025-01-03"}, {"id": 2, "updated_at": "2025-01-02"}],
+    )
+    httpx_mock.add_response(url=f"{base_url}/{test_endpoint}?updated_since=2025-01-03", json=[])
+
+    for _ in range(2):
+        context = PipelineContext("pipeline", state_store)
+        with context.activate():
+            await api_client()
+        context.commit()
+
+    assert state_store.get("pipeline", "test_api_extractor.watermark") == "2025-01-03"
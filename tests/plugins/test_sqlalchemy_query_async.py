@@ -1,17 +1,29 @@
 # Standard Imports
 from __future__ import annotations
 
+import asyncio
 import random
+import re
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncGenerator
+from unittest.mock import AsyncMock
+from weakref import WeakKeyDictionary
 
 # Third Party Imports
 import pandas as pd
 import pytest
 from sqlalchemy import Column, MetaData, String, Table, text
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # Project Imports
 from pipeline_flow.core.parsers import YamlParser
 from pipeline_flow.plugins.load import AsyncSQLAlchemyQueryLoader
+from pipeline_flow.plugins.load.sqlalchemy_query_async import MAX_BIND_PARAMETERS
+from pipeline_flow.plugins.utility import AsyncEngineRegistry
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 
 def generate_pandas_data(total: int) -> pd.DataFrame:
@@ -20,6 +32,12 @@ def generate_pandas_data(total: int) -> pd.DataFrame:
     return pd.DataFrame(data, columns=["name"])
 
 
+@pytest.fixture(autouse=True)
+def restart_engine_registry() -> None:
+    # The engines are shared by connection string, so each test starts with an empty registry.
+    AsyncEngineRegistry._engines = WeakKeyDictionary()
+
+
 @pytest.fixture
 def db_config() -> dict[str, str]:
     return {
@@ -86,6 +104,154 @@ async def test_async_sqlalchemy_loader(
         assert row_count == 100000
 
 
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_async_sqlalchemy_loader_bulk_mode(
+    setup_table, async_session_factory: async_sessionmaker[AsyncSession], db_config: dict[str, str]
+) -> None:
+    await setup_table
+
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, mode="bulk", table="t1")
+
+    await load(data=generate_pandas_data(total=100000))
+
+    async with async_session_factory() as session:
+        result = await session.execute(text("SELECT COUNT(*) FROM t1"))
+        assert result.scalar() == 100000
+
+
+@pytest.fixture
+def mock_session(mocker: MockerFixture) -> AsyncMock:
+    session = AsyncMock(spec=AsyncSession)
+
+    @asynccontextmanager
+    async def get_async_session(self: AsyncSQLAlchemyQueryLoader) -> AsyncGenerator[AsyncSession]:  # noqa: ARG001
+        yield session
+
+    mocker.patch.object(AsyncSQLAlchemyQueryLoader, "get_async_session", get_async_session)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_builds_multi_row_insert(mock_session: AsyncMock, db_config: dict[str, str]) -> None:
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, mode="bulk", table="analytics.t1")
+
+    await load(data=pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}))
+
+    statement = mock_session.execute.call_args.args[0]
+    compiled = statement.compile(dialect=mysql.dialect())
+
+    mock_session.execute.assert_awaited_once()
+    assert str(compiled).startswith("INSERT INTO analytics.t1 (id, name) VALUES")
+    assert list(compiled.params.values()) == [1, "a", 2, "b", 3, "c"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_accepts_columnar_data(mock_session: AsyncMock, db_config: dict[str, str]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, mode="bulk", table="t1", batch_size=2)
+
+    await load(data=pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]}))
+
+    params = [
+        list(call.args[0].compile(dialect=mysql.dialect()).params.values())
+        for call in mock_session.execute.call_args_list
+    ]
+    assert sorted(params) == [[1, "a", 2, "b"], [3, "c"]]
+
+
+@pytest.mark.asyncio
+async def test_query_mode_accepts_columnar_data(mock_session: AsyncMock, db_config: dict[str, str]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, query="INSERT INTO t1 VALUES (:id)")
+
+    await load(data=pa.RecordBatch.from_pydict({"id": [1, 2]}))
+
+    assert mock_session.execute.call_args.args[1] == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_splits_statements_by_bind_parameters(
+    mock_session: AsyncMock, db_config: dict[str, str]
+) -> None:
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, mode="bulk", table="t1", batch_size=40000)
+    rows = MAX_BIND_PARAMETERS // 2 + 1
+
+    await load(data=pd.DataFrame({"id": range(rows), "name": ["name"] * rows}))
+
+    assert mock_session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_uses_copy_for_asyncpg(
+    mock_session: AsyncMock, db_config: dict[str, str], mocker: MockerFixture
+) -> None:
+    mocker.patch("pipeline_flow.plugins.utility.sqlalchemy_engine.create_async_engine")
+    raw_connection = mocker.MagicMock()
+    raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+    mock_session.connection.return_value.get_raw_connection = AsyncMock(return_value=raw_connection)
+
+    load = AsyncSQLAlchemyQueryLoader(
+        plugin_id="test_plugin", **db_config, mode="bulk", table="public.t1", driver="postgresql+asyncpg"
+    )
+
+    await load(data=pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}))
+
+    mock_session.execute.assert_not_called()
+    raw_connection.driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "t1", records=[(1, "a"), (2, "b")], columns=["id", "name"], schema_name="public"
+    )
+
+
+@pytest.mark.asyncio
+async def test_loaders_share_engine_per_connection_string(db_config: dict[str, str]) -> None:
+    load1 = AsyncSQLAlchemyQueryLoader(plugin_id="load1", **db_config, query="SELECT 1", pool_size=3)
+    load2 = AsyncSQLAlchemyQueryLoader(plugin_id="load2", **db_config, query="SELECT 2")
+    load3 = AsyncSQLAlchemyQueryLoader(plugin_id="load3", **{**db_config, "db_name": "other"}, query="SELECT 1")
+
+    engine = load1._build_async_sessionmaker().kw["bind"]
+
+    assert load2._build_async_sessionmaker().kw["bind"] is engine
+    assert load3._build_async_sessionmaker().kw["bind"] is not engine
+    assert engine.pool.size() == 3
+
+    await AsyncEngineRegistry.dispose_all()
+
+    assert asyncio.get_running_loop() not in AsyncEngineRegistry._engines
+
+
+def test_engines_are_not_shared_across_event_loops(db_config: dict[str, str]) -> None:
+    load = AsyncSQLAlchemyQueryLoader(plugin_id="load", **db_config, query="SELECT 1")
+
+    async def session_engine() -> object:
+        engine = load._build_async_sessionmaker().kw["bind"]
+        await AsyncEngineRegistry.dispose_all()
+        return engine
+
+    # Pooled connections are bound to the loop that opened them, so each `asyncio.run` gets its own engine.
+    assert asyncio.run(session_engine()) is not asyncio.run(session_engine())
+
+
+@pytest.mark.asyncio
+async def test_engine_registry_pool_options(mocker: MockerFixture) -> None:
+    create_engine_mock = mocker.patch("pipeline_flow.plugins.utility.sqlalchemy_engine.create_async_engine")
+    create_engine_mock.return_value.dispose = AsyncMock()
+
+    engine = AsyncEngineRegistry.get_engine("mysql+asyncmy://u:p@host/db", max_overflow=0, pool_pre_ping=True)
+    await AsyncEngineRegistry.dispose_all()
+
+    create_engine_mock.assert_called_once_with("mysql+asyncmy://u:p@host/db", max_overflow=0, pool_pre_ping=True)
+    engine.dispose.assert_awaited_once()
+
+
+def test_mode_requires_arguments(db_config: dict[str, str]) -> None:
+    with pytest.raises(ValueError, match=re.escape("The `query` argument is required in `query` mode.")):
+        AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config)
+
+    with pytest.raises(ValueError, match=re.escape("The `table` argument is required in `bulk` mode.")):
+        AsyncSQLAlchemyQueryLoader(plugin_id="test_plugin", **db_config, mode="bulk")
+
+
 def test_parse_sqlalchemy_query_loader_yaml() -> None:
     yaml_config = """
     load:
@@ -0,0 +1,108 @@
+# Standard Imports
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+# Third Party Imports
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Project Imports
+from pipeline_flow.core.context import PipelineContext
+from pipeline_flow.plugins.extract import AsyncSQLAlchemyQueryExtractor
+from pipeline_flow.plugins.state_stores import SQLiteStateStore
+from pipeline_flow.plugins.utility import AsyncEngineRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def dispose_engines() -> AsyncGenerator[None]:
+    # The engines are shared by connection string, so they are disposed after each test.
+    yield
+    await AsyncEngineRegistry.dispose_all()
+
+
+@pytest_asyncio.fixture
+async def database_url(tmp_path: Path) -> str:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'source.db'}"
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.exec_driver_sql("CREATE TABLE orders (id INTEGER PRIMARY KEY, updated_at TEXT)")
+        await connection.exec_driver_sql(
+            "INSERT INTO orders VALUES (1, '2025-01-01'), (2, '2025-01-02'), (3, '2025-01-03')"
+        )
+    await engine.dispose()
+    return url
+
+
+def build_extractor(mocker: MockerFixture, database_url: str, **kwargs: object) -> AsyncSQLAlchemyQueryExtractor:
+    extractor = AsyncSQLAlchemyQueryExtractor(
+        plugin_id="orders_extractor",
+        db_user="user",
+        db_password="password",
+        db_host="localhost",
+        db_port="0",
+        db_name="source",
+        driver="sqlite+aiosqlite",
+        **kwargs,
+    )
+    mocker.patch.object(extractor, "_build_connection_string", return_value=database_url)
+    return extractor
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_extractor(mocker: MockerFixture, database_url: str) -> None:
+    extractor = build_extractor(mocker, database_url, query="SELECT id FROM orders ORDER BY id")
+
+    assert await extractor() == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_extractor_with_watermark(mocker: MockerFixture, database_url: str, tmp_path: Path) -> None:
+    extractor = build_extractor(
+        mocker,
+        database_url,
+        query="SELECT id, updated_at FROM orders WHERE updated_at > :watermark ORDER BY id",
+        watermark={"field": "updated_at", "initial": "2025-01-01"},
+    )
+    state_store = SQLiteStateStore(plugin_id="state", path=str(tmp_path / "state.db"))
+
+    extracted_ids = []
+    for _ in range(2):
+        context = PipelineContext("orders_pipeline", state_store)
+        with context.activate():
+            extracted_ids.append([row["id"] for row in await extractor()])
+        context.commit()
+
+    assert extracted_ids == [[2, 3], []]
+    assert state_store.get("orders_pipeline", "orders_extractor.watermark") == "2025-01-03"
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_extractor_with_watermark_without_initial(
+    mocker: MockerFixture, database_url: str, tmp_path: Path
+) -> None:
+    extractor = build_extractor(
+        mocker,
+        database_url,
+        query="SELECT id, updated_at FROM orders WHERE :watermark IS NULL OR updated_at > :watermark ORDER BY id",
+        watermark={"field": "updated_at"},
+    )
+    state_store = SQLiteStateStore(plugin_id="state", path=str(tmp_path / "state.db"))
+
+    extracted_ids = []
+    for _ in range(2):
+        context = PipelineContext("orders_pipeline", state_store)
+        with context.activate():
+            extracted_ids.append([row["id"] for row in await extractor()])
+        context.commit()
+
+    # The first run extracts everything, and the next one starts from the watermark it advanced to.
+    assert extracted_ids == [[1, 2, 3], []]
+    assert state_store.get("orders_pipeline", "orders_extractor.watermark") == "2025-01-03"
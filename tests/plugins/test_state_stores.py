@@ -0,0 +1,44 @@
+# Standard Imports
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Project Imports
+from pipeline_flow.plugins import IStateStore
+from pipeline_flow.plugins.state_stores import JsonFileStateStore, SQLiteStateStore
+
+
+@pytest.fixture(params=[SQLiteStateStore, JsonFileStateStore])
+def store_factory(request: pytest.FixtureRequest, tmp_path: Path) -> type[IStateStore]:
+    store_cls = request.param
+    path = tmp_path / "state" / "store"
+
+    def factory() -> IStateStore:
+        return store_cls(plugin_id="state", path=str(path))
+
+    return factory
+
+
+def test_missing_value_is_none(store_factory: type[IStateStore]) -> None:
+    assert store_factory().get("pipeline", "missing") is None
+
+
+def test_values_are_persisted(store_factory: type[IStateStore]) -> None:
+    store_factory().set_many("pipeline", {"extract.watermark": "2025-01-01T00:00:00", "extract.cursor": 10})
+
+    store = store_factory()
+
+    assert store.get("pipeline", "extract.watermark") == "2025-01-01T00:00:00"
+    assert store.get("pipeline", "extract.cursor") == 10
+
+
+def test_values_are_overwritten_per_namespace(store_factory: type[IStateStore]) -> None:
+    store = store_factory()
+    store.set_many("pipeline", {"extract.cursor": 10})
+    store.set_many("other_pipeline", {"extract.cursor": 20})
+
+    store.set_many("pipeline", {"extract.cursor": {"page": 11}})
+
+    assert store.get("pipeline", "extract.cursor") == {"page": 11}
+    assert store.get("other_pipeline", "extract.cursor") == 20
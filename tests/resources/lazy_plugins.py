@@ -0,0 +1,12 @@
+# Standard Imports
+from typing import Self
+
+# Project Imports
+from pipeline_flow.plugins import IPlugin
+
+# This module is only imported by the lazy plugin registry tests, to observe when it is imported.
+
+
+class LazyPlugin(IPlugin, plugin_name="lazy_plugin"):
+    def __call__(self: Self) -> str:
+        return "lazy_plugin"
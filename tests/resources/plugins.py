@@ -1,10 +1,12 @@
 # Standard Imports
 import asyncio
 import time
+from collections.abc import AsyncIterator
 from typing import Self
 
 # Third-party Imports
 # Project Imports
+from pipeline_flow.common.type_def import DataFormat
 from pipeline_flow.core.registry import PluginRegistry
 from pipeline_flow.plugins import (
     IExtractPlugin,
@@ -34,6 +36,18 @@ class SimpleExtractorPlugin(IExtractPlugin, plugin_name="simple_extractor_plugin
         return "extracted_data"
 
 
+class SimpleStreamingExtractorPlugin(IExtractPlugin, plugin_name="simple_streaming_extractor_plugin"):
+    def __init__(self: Self, plugin_id: str, chunks: int = 3, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.chunks = chunks
+        self.delay = delay
+
+    async def __call__(self) -> AsyncIterator[str]:
+        for index in range(self.chunks):
+            await asyncio.sleep(self.delay)
+            yield f"chunk_{index}"
+
+
 class SimpleMergePlugin(IMergeExtractPlugin, plugin_name="simple_merge_plugin"):
     def __call__(self: Self, extracted_data: dict) -> str:  # noqa: ARG002
         return "merged_data"
@@ -49,6 +63,13 @@ class SimpleTransformPlugin(ITransformPlugin, plugin_name="simple_transform_plug
         return f"transformed_{data}"
 
 
+class SimpleRowsTransformPlugin(ITransformPlugin, plugin_name="simple_rows_transform_plugin"):
+    input_format = DataFormat.ROWS
+
+    def __call__(self: Self, data: list[dict]) -> list[dict]:
+        return [{**row, "transformed": True} for row in data]
+
+
 class SimpleLoaderPlugin(ILoadPlugin, plugin_name="simple_loader_plugin"):
     def __init__(self: Self, plugin_id: str, delay: float = 0) -> None:
         super().__init__(plugin_id)
@@ -58,6 +79,20 @@ class SimpleLoaderPlugin(ILoadPlugin, plugin_name="simple_loader_plugin"):
         await asyncio.sleep(self.delay)  # Simulating a slow loader
 
 
+class SimpleRowsLoaderPlugin(ILoadPlugin, plugin_name="simple_rows_loader_plugin"):
+    input_format = DataFormat.ROWS
+
+    async def __call__(self: Self, data: list[dict]) -> None:
+        pass
+
+
+class SimpleColumnarLoaderPlugin(ILoadPlugin, plugin_name="simple_columnar_loader_plugin"):
+    input_format = DataFormat.COLUMNAR
+
+    async def __call__(self: Self, data: object) -> None:
+        pass
+
+
 class SimpleTransformLoadPlugin(ITransformLoadPlugin, plugin_name="simple_transform_load_plugin"):
     def __init__(self: Self, plugin_id: str, query: str, delay: float = 0) -> None:
         super().__init__(plugin_id)
@@ -68,6 +103,28 @@ class SimpleTransformLoadPlugin(ITransformLoadPlugin, plugin_name="simple_transf
         time.sleep(self.delay)  # Stimulating a transformation at load phase where data is transformed on
 
 
+class SimpleAsyncTransformLoadPlugin(ITransformLoadPlugin, plugin_name="simple_async_transform_load_plugin"):
+    def __init__(self: Self, plugin_id: str, query: str, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.delay = delay
+        self.query = query
+
+    async def __call__(self: Self) -> None:
+        await asyncio.sleep(self.delay)
+
+
+class BlockingAsyncPrePlugin(IPreProcessPlugin, plugin_name="blocking_async_pre_plugin"):
+    def __init__(self: Self, plugin_id: str, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.delay = delay
+
+    async def __call__(self: Self) -> str:
+        await asyncio.sleep(0)
+        time.sleep(self.delay)  # noqa: ASYNC251 - Blocks the event loop, as a hidden synchronous call would.
+        await asyncio.sleep(0)
+        return "Blocking result"
+
+
 class SimpleAsyncPrePlugin(IPreProcessPlugin, plugin_name="simple_async_pre_plugin"):
     def __init__(self: Self, plugin_id: str, delay: float = 0) -> None:
         super().__init__(plugin_id)
@@ -108,6 +165,17 @@ class SimpleSecretPlugin(ISecretManager, plugin_name="simple_secret_plugin"):
         return "super_secret_value"
 
 
+class DelayedSecretPlugin(ISecretManager, plugin_name="delayed_secret_plugin"):
+    def __init__(self: Self, plugin_id: str, secret_name: str, delay: float = 0) -> None:
+        super().__init__(plugin_id)
+        self.secret_name = secret_name
+        self.delay = delay
+
+    def __call__(self: Self) -> str:
+        time.sleep(self.delay)
+        return f"{self.secret_name}_value"
+
+
 class NestedSecretPlugin(ISecretManager, plugin_name="nested_secret_plugin"):
     def __init__(self: Self, plugin_id: str, secret_name: str) -> None:
         super().__init__(plugin_id)
@@ -0,0 +1,144 @@
+# Standard Imports
+import asyncio
+from collections.abc import Callable
+
+# Third-party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.core.admission import AdmissionController, Footprint
+from pipeline_flow.core.executor import ETLStrategy
+from pipeline_flow.core.models.pipeline import Pipeline, PipelineResources
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.run_history import PipelineProfile, RunHistory
+
+
+def test_footprint_is_declared_then_learned_then_default(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    admission = AdmissionController(memory=1000, cpu=4, default_footprint=Footprint(100, 1.0))
+    pipeline = etl_pipeline_factory(name="pipeline")
+
+    assert admission.footprint(pipeline) == Footprint(100, 1.0)
+    assert admission.footprint(pipeline, PipelineProfile(300, 0.5, 1.0)) == Footprint(300, 0.5)
+    assert admission.footprint(pipeline, PipelineProfile(0, 0.5, 1.0)) == Footprint(100, 0.5)
+
+    pipeline.resources = PipelineResources(memory="500B")
+    assert admission.footprint(pipeline, PipelineProfile(300, 0.5, 1.0)) == Footprint(500, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_admission_waits_for_the_budget_in_order() -> None:
+    admission = AdmissionController(memory=100, cpu=None)
+    order = []
+
+    async def run(name: str, memory: int) -> None:
+        async with admission.admit(name, Footprint(memory, 1.0)):
+            order.append((name, admission.used.memory))
+            await asyncio.sleep(0.05)
+
+    # `large` does not fit next to `first`, and `small` is not admitted before it even though it would fit.
+    await asyncio.gather(run("first", 60), run("large", 50), run("small", 10))
+
+    assert order == [("first", 60), ("large", 50), ("small", 60)]
+    assert (admission.used, admission.running) == (Footprint(0, 0.0), 0)
+
+
+@pytest.mark.asyncio
+async def test_admission_admits_the_best_rank_first() -> None:
+    admission = AdmissionController(memory=100, cpu=None)
+    order = []
+
+    async def run(name: str, memory: int, rank: tuple) -> None:
+        async with admission.admit(name, Footprint(memory, 1.0), rank):
+            order.append(name)
+            await asyncio.sleep(0.05)
+
+    # `urgent` asked last, but is ranked before `routine` once `first` releases the budget.
+    await asyncio.gather(run("first", 100, (0,)), run("routine", 100, (1,)), run("urgent", 100, (-1,)))
+
+    assert order == ["first", "urgent", "routine"]
+
+
+@pytest.mark.asyncio
+async def test_footprint_over_the_budget_runs_alone() -> None:
+    admission = AdmissionController(memory=100, cpu=2)
+
+    async with admission.admit("huge", Footprint(1000, 8.0)):
+        assert admission.running == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_admits_pipelines_by_memory(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    orchestrator = PipelineOrchestrator(YamlConfig())
+    orchestrator.concurrency = 3
+    orchestrator.semaphore = asyncio.Semaphore(3)
+    orchestrator.admission = AdmissionController(memory=2 * 2**30, cpu=None)
+    orchestrator.history = RunHistory()
+
+    pipelines = [etl_pipeline_factory(name=f"Job{index}") for index in range(3)]
+    for pipeline in pipelines:
+        pipeline.resources = PipelineResources(memory="1GiB")
+
+    running, max_running = 0, 0
+
+    async def execute(pipeline: Pipeline) -> bool:  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute)
+
+    assert await orchestrator.execute_pipelines(pipelines) == {"Job0", "Job1", "Job2"}
+    assert max_running == 2
+    assert orchestrator.history.get("Job0") is not None
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_admits_before_taking_a_concurrency_slot(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    orchestrator = PipelineOrchestrator(YamlConfig())
+    orchestrator.admission = AdmissionController(memory=100, cpu=None)
+    pipeline = etl_pipeline_factory(name="waiting")
+    pipeline.resources = PipelineResources(memory="100B")
+    mocker.patch.object(ETLStrategy, "execute", return_value=True)
+
+    async with orchestrator.admission.admit("running", Footprint(100, 0.0)):
+        task = asyncio.create_task(orchestrator._execute_pipeline(pipeline))
+        await asyncio.sleep(0.05)
+
+        # The pipeline waits for the memory budget without holding one of the concurrency slots.
+        assert not task.done()
+        assert orchestrator.semaphore._value == orchestrator.concurrency
+
+    await task
+    assert pipeline.is_executed
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_learns_footprints_from_runs_alone(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    orchestrator = PipelineOrchestrator(YamlConfig())
+    orchestrator.history = RunHistory()
+
+    async def execute(pipeline: Pipeline) -> bool:  # noqa: ARG001
+        await asyncio.sleep(0.05)
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute)
+
+    await orchestrator.execute_pipelines([etl_pipeline_factory(name="Job0"), etl_pipeline_factory(name="Job1")])
+    await orchestrator.execute_pipelines([etl_pipeline_factory(name="Job2")])
+
+    # Concurrent pipelines only learn their duration, their memory and CPU cannot be told apart.
+    concurrent = orchestrator.history.get("Job0")
+    alone = orchestrator.history.get("Job2")
+    assert (concurrent.memory, concurrent.cpu) == (None, None)
+    assert (alone.memory, alone.cpu) != (None, None)
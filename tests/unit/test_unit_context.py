@@ -0,0 +1,50 @@
+# Standard Imports
+import asyncio
+from pathlib import Path
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from pipeline_flow.core.context import PipelineContext, current_context
+from pipeline_flow.plugins.state_stores import JsonFileStateStore
+
+
+@pytest.fixture
+def state_store(tmp_path: Path) -> JsonFileStateStore:
+    return JsonFileStateStore(plugin_id="state", path=str(tmp_path / "state.json"))
+
+
+def test_context_without_state_store() -> None:
+    state = current_context().state("extractor_id")
+
+    state.set("watermark", 10)
+
+    assert current_context().pipeline is None
+    assert current_context().state("extractor_id").get("watermark", 0) == 0
+
+
+def test_state_is_only_persisted_on_commit(state_store: JsonFileStateStore) -> None:
+    context = PipelineContext("pipeline", state_store)
+    context.state("extractor_id").set("watermark", 10)
+
+    assert context.state("extractor_id").get("watermark") == 10
+    assert context.state("other_extractor_id").get("watermark") is None
+    assert state_store.get("pipeline", "extractor_id.watermark") is None
+
+    context.commit()
+
+    assert state_store.get("pipeline", "extractor_id.watermark") == 10
+    assert PipelineContext("pipeline", state_store).state("extractor_id").get("watermark") == 10
+    assert PipelineContext("other_pipeline", state_store).state("extractor_id").get("watermark") is None
+
+
+@pytest.mark.asyncio
+async def test_active_context_is_inherited_by_tasks_and_threads(state_store: JsonFileStateStore) -> None:
+    context = PipelineContext("pipeline", state_store)
+
+    with context.activate():
+        task_context = await asyncio.create_task(asyncio.to_thread(current_context))
+
+    assert task_context is context
+    assert current_context() is not context
@@ -1,26 +1,34 @@
 # Standard Imports
+import asyncio
 from collections.abc import Callable
 from unittest.mock import AsyncMock, Mock
 
 # Third-party Imports
+import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
 
 # Project Imports
-from pipeline_flow.common.exceptions import ExtractError
+from pipeline_flow.common.exceptions import ExtractError, TransformError
 from pipeline_flow.core import executor
 from pipeline_flow.core.models import Pipeline
 from pipeline_flow.core.models.phases import (
     ExtractPhase,
     LoadPhase,
+    PostProcessMode,
+    TransformExecutorType,
     TransformLoadPhase,
     TransformPhase,
 )
+from pipeline_flow.core.transform_pool import TransformProcessPool
 from tests.resources.plugins import (
+    SimpleColumnarLoaderPlugin,
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
     SimpleMergePlugin,
     SimplePostPlugin,
+    SimpleRowsLoaderPlugin,
+    SimpleStreamingExtractorPlugin,
     SimpleTransformLoadPlugin,
     SimpleTransformPlugin,
 )
@@ -76,8 +84,29 @@ async def test_run_extractor_with_multiple_post_processing() -> None:
         ],
     )
 
-    with pytest.raises(ExtractError, match="Multiple post-processing steps are not supported yet."):
-        await executor.run_extractor(extract)
+    result = await executor.run_extractor(extract)
+
+    # Chained steps feed their output to the next step.
+    assert result == "Async result: Async result: extracted_data"
+
+
+@pytest.mark.asyncio
+async def test_run_extractor_with_fanned_out_post_processing(mocker: MockerFixture) -> None:
+    extract = ExtractPhase.model_construct(
+        steps=[SimpleExtractorPlugin(plugin_id="extractor_id")],
+        post=[
+            SimplePostPlugin(plugin_id="post_id"),
+            SimplePostPlugin(plugin_id="post_id_2"),
+        ],
+        post_mode=PostProcessMode.FAN_OUT,
+    )
+    post_spy = mocker.spy(SimplePostPlugin, "__call__")
+
+    result = await executor.run_extractor(extract)
+
+    # Fanned out steps are sinks, every step receives the extracted data which is passed on unchanged.
+    assert result == "extracted_data"
+    assert [call.kwargs["data"] for call in post_spy.call_args_list] == ["extracted_data", "extracted_data"]
 
 
 def test_run_transformer_with_zero_transformation() -> None:
@@ -109,6 +138,60 @@ def test_run_multiple_transformer() -> None:
     assert result == "TRANSFORMED_DATA"
 
 
+@pytest.mark.asyncio
+async def test_run_transformer_in_executor_inline(mocker: MockerFixture) -> None:
+    transformations = TransformPhase.model_construct(
+        steps=[SimpleTransformPlugin(plugin_id="transformer_id")], executor=TransformExecutorType.INLINE
+    )
+    run_in_executor_spy = mocker.spy(asyncio.get_running_loop(), "run_in_executor")
+
+    result = await executor.run_transformer_in_executor("data", transformations)
+
+    assert result == "transformed_data"
+    run_in_executor_spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_in_executor_process_pool() -> None:
+    transformations = TransformPhase.model_construct(steps=[SimpleTransformPlugin(plugin_id="transformer_id")])
+
+    try:
+        result = await executor.run_transformer_in_executor(
+            "data", transformations, default_executor=TransformExecutorType.PROCESS
+        )
+    finally:
+        TransformProcessPool.shutdown()
+
+    assert result == "transformed_data"
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_in_executor_unpicklable_falls_back_to_thread(mocker: MockerFixture) -> None:
+    transformations = TransformPhase.model_construct(
+        steps=[Mock(id="transformer_id", spec=SimpleTransformPlugin, side_effect=lambda data: f"transformed_{data}")],
+        executor=TransformExecutorType.PROCESS,
+    )
+    pool_spy = mocker.spy(TransformProcessPool, "get")
+
+    result = await executor.run_transformer_in_executor("data", transformations)
+
+    assert result == "transformed_data"
+    pool_spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_in_executor_with_chunks() -> None:
+    transformations = TransformPhase.model_construct(
+        steps=[Mock(id="transformer_id", spec=SimpleTransformPlugin, side_effect=lambda rows: [r * 10 for r in rows])],
+        chunks=3,
+    )
+
+    result = await executor.run_transformer_in_executor([1, 2, 3, 4, 5, 6, 7], transformations)
+
+    assert result == [10, 20, 30, 40, 50, 60, 70]
+    assert transformations.steps[0].call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_run_loader_without_delay(mocker: MockerFixture) -> None:
     loader_plugin = SimpleLoaderPlugin(plugin_id="loader_id")
@@ -157,7 +240,40 @@ async def test_run_loader_multiple_without_delay(mocker: MockerFixture) -> None:
     assert spy.call_count == 2, "Both loaders should be called"
 
 
-def test_run_transformer_after_load(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_run_loader_converts_data_to_plugin_input_format(mocker: MockerFixture) -> None:
+    pa = pytest.importorskip("pyarrow")
+    native_plugin = SimpleLoaderPlugin(plugin_id="native_id")
+    rows_plugin = SimpleRowsLoaderPlugin(plugin_id="rows_id")
+    columnar_plugin = SimpleColumnarLoaderPlugin(plugin_id="columnar_id")
+    destinations = LoadPhase.model_construct(steps=[native_plugin, rows_plugin, columnar_plugin])
+
+    native_spy = mocker.spy(SimpleLoaderPlugin, "__call__")
+    rows_spy = mocker.spy(SimpleRowsLoaderPlugin, "__call__")
+    columnar_spy = mocker.spy(SimpleColumnarLoaderPlugin, "__call__")
+    data = pd.DataFrame({"id": [1, 2]})
+
+    await executor.run_loader(data, destinations)
+
+    assert native_spy.call_args.kwargs["data"] is data
+    assert rows_spy.call_args.kwargs["data"] == [{"id": 1}, {"id": 2}]
+    assert columnar_spy.call_args.kwargs["data"].equals(pa.table({"id": [1, 2]}))
+
+
+@pytest.mark.asyncio
+async def test_run_loader_passes_columnar_data_through(mocker: MockerFixture) -> None:
+    pa = pytest.importorskip("pyarrow")
+    destinations = LoadPhase.model_construct(steps=[SimpleColumnarLoaderPlugin(plugin_id="columnar_id")])
+    spy = mocker.spy(SimpleColumnarLoaderPlugin, "__call__")
+    data = pa.table({"id": [1, 2]})
+
+    await executor.run_loader(data, destinations)
+
+    assert spy.call_args.kwargs["data"] is data
+
+
+@pytest.mark.asyncio
+async def test_run_transformer_after_load(mocker: MockerFixture) -> None:
     tf_load_plugin = SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1")
 
     spy = mocker.spy(SimpleTransformLoadPlugin, "__call__")
@@ -167,13 +283,14 @@ def test_run_transformer_after_load(mocker: MockerFixture) -> None:
             tf_load_plugin,
         ]
     )
-    executor.run_transformer_after_load(transformations)
+    await executor.run_transformer_after_load(transformations)
 
     # tf_load_plugin operates as "self" in the call
     spy.assert_called_once_with(tf_load_plugin)
 
 
-def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
     tf_load_plugin1 = SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1")
     tf_load_plugin2 = SimpleTransformLoadPlugin(plugin_id="transform_loader_id_2", query="SELECT 1")
 
@@ -185,7 +302,7 @@ def test_run_transformer_after_load_multiple(mocker: MockerFixture) -> None:
             tf_load_plugin2,
         ]
     )
-    executor.run_transformer_after_load(transformations)
+    await executor.run_transformer_after_load(transformations)
 
     assert spy.call_count == 2
 
@@ -211,7 +328,7 @@ async def test_execution_etl_pipeline(mocker: MockerFixture, etl_pipeline_factor
 async def test_execution_elt_pipeline(mocker: MockerFixture, elt_pipeline_factory: Callable[..., Pipeline]) -> None:
     extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock, return_value="extracted_data")
     load_mock = mocker.patch.object(executor, "run_loader", new_callable=AsyncMock)
-    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=Mock)
+    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=AsyncMock)
 
     elt_pipeline = elt_pipeline_factory(name="Job1")
 
@@ -229,7 +346,7 @@ async def test_execution_etlt_strategy(mocker: MockerFixture, etlt_pipeline_fact
     extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock, return_value="extracted_data")
     tf_mock = mocker.patch.object(executor, "run_transformer", new_callable=Mock, return_value="transformed_data")
     load_mock = mocker.patch.object(executor, "run_loader", new_callable=AsyncMock)
-    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=Mock)
+    tf_load_mock = mocker.patch.object(executor, "run_transformer_after_load", new_callable=AsyncMock)
 
     etlt_pipeline = etlt_pipeline_factory(name="Job1")
     result = await executor.ETLTStrategy().execute(etlt_pipeline)
@@ -240,3 +357,109 @@ async def test_execution_etlt_strategy(mocker: MockerFixture, etlt_pipeline_fact
     tf_load_mock.assert_called_once_with(etlt_pipeline.load_transform)
 
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_phases(mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    loader_plugin = SimpleLoaderPlugin(plugin_id="loader_id")
+    pipeline = etl_pipeline_factory(
+        name="Job1",
+        streaming=True,
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id", chunks=3)],
+        load=[loader_plugin],
+    )
+
+    spy = mocker.spy(SimpleLoaderPlugin, "__call__")
+
+    await executor.run_streaming_phases(pipeline)
+
+    assert spy.call_args_list == [
+        mocker.call(loader_plugin, data="transformed_chunk_0"),
+        mocker.call(loader_plugin, data="transformed_chunk_1"),
+        mocker.call(loader_plugin, data="transformed_chunk_2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_phases_checks_picklability_once(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    pipeline = etl_pipeline_factory(
+        name="Job1",
+        streaming=True,
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id", chunks=3)],
+        load=[SimpleLoaderPlugin(plugin_id="loader_id")],
+    )
+    pipeline.transform.executor = TransformExecutorType.PROCESS
+    is_picklable_spy = mocker.spy(executor, "is_picklable")
+
+    try:
+        await executor.run_streaming_phases(pipeline)
+    finally:
+        TransformProcessPool.shutdown()
+
+    is_picklable_spy.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_phases_without_transform(
+    mocker: MockerFixture, elt_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    loader_plugin = SimpleLoaderPlugin(plugin_id="loader_id")
+    pipeline = elt_pipeline_factory(
+        name="Job1",
+        streaming=True,
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id", chunks=2)],
+        load=[loader_plugin],
+    )
+
+    spy = mocker.spy(SimpleLoaderPlugin, "__call__")
+
+    await executor.run_streaming_phases(pipeline)
+
+    assert spy.call_args_list == [
+        mocker.call(loader_plugin, data="chunk_0"),
+        mocker.call(loader_plugin, data="chunk_1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_phases_requires_async_generator(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Job1", streaming=True)
+
+    with pytest.raises(ExtractError, match="Extraction Phase Error"):
+        await executor.run_streaming_phases(pipeline)
+
+
+@pytest.mark.asyncio
+async def test_run_streaming_phases_transform_error(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    failing_transform = Mock(id="transformer_id", spec=SimpleTransformPlugin, side_effect=ValueError("Bad chunk"))
+    pipeline = etl_pipeline_factory(
+        name="Job1",
+        streaming=True,
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id", chunks=100)],
+        transform=[failing_transform],
+    )
+
+    with pytest.raises(TransformError, match="Transformation Phase Error"):
+        await executor.run_streaming_phases(pipeline)
+
+    failing_transform.assert_called_once_with("chunk_0")
+
+
+@pytest.mark.asyncio
+async def test_execution_streaming_etl_pipeline(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    streaming_mock = mocker.patch.object(executor, "run_streaming_phases", new_callable=AsyncMock)
+    extract_mock = mocker.patch.object(executor, "run_extractor", new_callable=AsyncMock)
+
+    etl_pipeline = etl_pipeline_factory(
+        name="Job1", streaming=True, extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id")]
+    )
+
+    result = await executor.ETLStrategy().execute(etl_pipeline)
+
+    streaming_mock.assert_awaited_once_with(etl_pipeline, TransformExecutorType.THREAD)
+    extract_mock.assert_not_called()
+    assert result is True
@@ -1,6 +1,8 @@
 # Standard Imports
 import asyncio
+import threading
 import time
+from collections.abc import Callable
 from unittest.mock import call
 
 # Third-party Imports
@@ -11,10 +13,12 @@ from pytest_mock import MockerFixture
 from pipeline_flow.core.executor import (
     run_extractor,
     run_loader,
+    run_streaming_phases,
     run_transformer,
     run_transformer_after_load,
     task_group_executor,
 )
+from pipeline_flow.core.models import Pipeline
 from pipeline_flow.core.models.phases import (
     ExtractPhase,
     LoadPhase,
@@ -23,9 +27,11 @@ from pipeline_flow.core.models.phases import (
 )
 from tests.resources.plugins import (
     SimpleAsyncPrePlugin,
+    SimpleAsyncTransformLoadPlugin,
     SimpleExtractorPlugin,
     SimpleLoaderPlugin,
     SimpleMergePlugin,
+    SimpleStreamingExtractorPlugin,
     SimpleTransformLoadPlugin,
     SimpleTransformPlugin,
 )
@@ -203,22 +209,89 @@ def test_concurrency_with_multiple_transformations(mocker: MockerFixture) -> Non
     assert 0.4 > total >= 0.3, "Delay Should be 0.3 seconds for sychronous transformations."
 
 
-def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) -> None:
+@pytest.mark.asyncio
+async def test_concurrency_with_multiple_load_transformtions(mocker: MockerFixture) -> None:
     tf = TransformLoadPhase.model_construct(
         steps=[
-            SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1", delay=0.1),
-            SimpleTransformLoadPlugin(plugin_id="transform_loader_id_2", query="SELECT 2", delay=0.2),
+            SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1"),
+            SimpleTransformLoadPlugin(plugin_id="transform_loader_id_2", query="SELECT 2"),
         ]
     )
+    events = []
+    second_started = threading.Event()
 
-    spy = mocker.spy(SimpleTransformLoadPlugin, "__call__")
+    def transform_load(plugin: SimpleTransformLoadPlugin) -> None:
+        events.append(("start", plugin.id))
+        if plugin.id == "transform_loader_id_2":
+            second_started.set()
+        else:
+            # Gives a concurrent second step the chance to start before the first one ends.
+            second_started.wait(timeout=0.1)
+        events.append(("end", plugin.id))
 
-    start = time.time()
-    run_transformer_after_load(tf)
-    total = time.time() - start
+    spy = mocker.patch.object(SimpleTransformLoadPlugin, "__call__", autospec=True, side_effect=transform_load)
+
+    await run_transformer_after_load(tf)
 
     # Behaviour validation
     assert spy.call_count == 2
 
-    # Concurrency Validation
-    assert 0.4 > total >= 0.3, "Delay Should be 0.3 seconds for sychronous transformations."
+    # Without `needs`, each step only starts once the previous one has finished.
+    assert events == [
+        ("start", "transform_loader_id"),
+        ("end", "transform_loader_id"),
+        ("start", "transform_loader_id_2"),
+        ("end", "transform_loader_id_2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_transformations_run_after_their_needs() -> None:
+    # `marts` needs both staging steps, which are independent and run concurrently.
+    tf = TransformLoadPhase.model_construct(
+        steps=[
+            SimpleTransformLoadPlugin(plugin_id="staging_orders", query="SELECT 1", delay=0.2),
+            SimpleAsyncTransformLoadPlugin(plugin_id="staging_users", query="SELECT 2", delay=0.2),
+            SimpleAsyncTransformLoadPlugin(plugin_id="marts", query="SELECT 3", delay=0.1),
+        ],
+        dependencies={"marts": ["staging_orders", "staging_users"]},
+    )
+
+    start = time.time()
+    await run_transformer_after_load(tf)
+    total = time.time() - start
+
+    # Sequentially it would take 0.5 seconds, without waiting for its needs `marts` would finish within 0.2.
+    assert 0.4 > total >= 0.3, "The staging steps should overlap, followed by the marts step."
+
+
+@pytest.mark.asyncio
+async def test_sync_load_transformations_do_not_block_the_event_loop() -> None:
+    tf = TransformLoadPhase.model_construct(
+        steps=[SimpleTransformLoadPlugin(plugin_id="transform_loader_id", query="SELECT 1", delay=0.2)],
+        dependencies={},
+    )
+
+    start = time.time()
+    await asyncio.gather(run_transformer_after_load(tf), asyncio.sleep(0.2))
+    total = time.time() - start
+
+    assert total < 0.3, "The event loop should keep running while the synchronous step runs in a thread."
+
+
+@pytest.mark.asyncio
+async def test_concurrency_with_streaming_phases(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(
+        name="Streaming Pipeline",
+        streaming=True,
+        extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id", chunks=3, delay=0.1)],
+        transform=[SimpleTransformPlugin(plugin_id="transformer_id", delay=0.1)],
+        load=[SimpleLoaderPlugin(plugin_id="loader_id", delay=0.1)],
+    )
+
+    start = asyncio.get_running_loop().time()
+    await run_streaming_phases(pipeline)
+    total = asyncio.get_running_loop().time() - start
+
+    # Concurrency validation
+    assert 0.6 > total >= 0.5, "Delay Should be 0.3 (3 chunks extracted) + 0.1 Transform + 0.1 Load of the last chunk"
@@ -0,0 +1,158 @@
+# Standard Imports
+import asyncio
+import threading
+from collections.abc import Generator
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from pipeline_flow.core.executor import plugin_sync_executor, run_extractor, run_plugin, task_group_executor
+from pipeline_flow.core.loop_guard import LoopBlockingMonitor, SyncPluginPool
+from pipeline_flow.core.models.phases import ExtractPhase
+from tests.resources.plugins import (
+    BlockingAsyncPrePlugin,
+    SimpleAsyncPrePlugin,
+    SimpleExtractorPlugin,
+    SimpleMergePlugin,
+    SimplePostPlugin,
+    SimplePrePlugin,
+    SimpleTransformPlugin,
+)
+
+
+@pytest.fixture(autouse=True)
+def shutdown_plugin_pool() -> Generator[None, None, None]:
+    # The pool may already have been started by an earlier test.
+    SyncPluginPool.shutdown()
+    yield
+    SyncPluginPool.shutdown()
+    SyncPluginPool.configure(None)
+
+
+@pytest.fixture
+def loop_monitor() -> Generator[None, None, None]:
+    LoopBlockingMonitor.configure(0.05)
+    yield
+    LoopBlockingMonitor.configure(None)
+    LoopBlockingMonitor.reset()
+
+
+def test_plugin_pool_is_shared() -> None:
+    SyncPluginPool.configure(2)
+
+    pool = SyncPluginPool.get()
+
+    assert SyncPluginPool.get() is pool
+    assert pool._max_workers == 2
+
+
+@pytest.mark.asyncio
+async def test_run_plugin_runs_sync_plugins_on_the_plugin_pool() -> None:
+    class ThreadRecordingMergePlugin(SimpleMergePlugin, plugin_name="thread_recording_merge_plugin"):
+        def __call__(self, extracted_data: dict) -> str:
+            self.thread_name = threading.current_thread().name
+            return super().__call__(extracted_data)
+
+    plugin = ThreadRecordingMergePlugin(plugin_id="merge_id")
+
+    assert await run_plugin(plugin, extracted_data={}) == "merged_data"
+    assert plugin.thread_name.startswith("pipeline_flow_plugin")
+
+
+@pytest.mark.asyncio
+async def test_sync_pre_and_post_plugins_run_on_the_plugin_pool() -> None:
+    class ThreadRecordingPrePlugin(SimplePrePlugin, plugin_name="thread_recording_pre_plugin"):
+        def __call__(self) -> str:  # type: ignore[override]
+            self.thread_name = threading.current_thread().name
+            return "pre"
+
+    class ThreadRecordingPostPlugin(SimplePostPlugin, plugin_name="thread_recording_post_plugin"):
+        def __call__(self, data: str) -> str:  # type: ignore[override]
+            self.thread_name = threading.current_thread().name
+            return f"post_{data}"
+
+    extract = ExtractPhase.model_construct(
+        steps=[SimpleExtractorPlugin(plugin_id="extractor_id")],
+        pre=[ThreadRecordingPrePlugin(plugin_id="pre_id")],
+        post=[ThreadRecordingPostPlugin(plugin_id="post_id")],
+    )
+
+    assert await run_extractor(extract) == "post_extracted_data"
+    assert extract.pre[0].thread_name.startswith("pipeline_flow_plugin")
+    assert extract.post[0].thread_name.startswith("pipeline_flow_plugin")
+
+
+@pytest.mark.asyncio
+async def test_merge_does_not_block_the_event_loop() -> None:
+    class SlowMergePlugin(SimpleMergePlugin, plugin_name="slow_merge_plugin"):
+        def __call__(self, extracted_data: dict) -> str:
+            threading.Event().wait(0.2)
+            return super().__call__(extracted_data)
+
+    extract = ExtractPhase.model_construct(
+        steps=[SimpleExtractorPlugin(plugin_id="extractor_id"), SimpleExtractorPlugin(plugin_id="extractor_id2")],
+        merge=SlowMergePlugin(plugin_id="merge_id"),
+    )
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    result = await run_extractor(extract)
+    ticker_task.cancel()
+
+    assert result == "merged_data"
+    assert ticks >= 10, "The event loop should keep running while the merge plugin runs."
+
+
+def test_monitor_is_disabled_by_default() -> None:
+    plugin_sync_executor(SimpleTransformPlugin(plugin_id="transformer_id"), data="data")
+
+    assert not LoopBlockingMonitor.is_enabled()
+    assert LoopBlockingMonitor.offenders() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("loop_monitor")
+async def test_monitor_reports_blocking_async_plugins(caplog: pytest.LogCaptureFixture) -> None:
+    result = await task_group_executor(
+        [BlockingAsyncPrePlugin(plugin_id="blocking_id", delay=0.1), SimpleAsyncPrePlugin(plugin_id="pre_id")]
+    )
+
+    assert result == {"blocking_id": "Blocking result", "pre_id": "Async result"}
+
+    (offender,) = LoopBlockingMonitor.offenders()
+    assert offender.plugin_id == "blocking_id"
+    assert offender.calls == 1
+    assert 0.2 > offender.blocking_max >= 0.1
+
+    LoopBlockingMonitor.report()
+    assert "Plugin `blocking_id` blocked the event loop for up to" in caplog.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("loop_monitor")
+async def test_monitor_measures_sync_plugins_only_on_the_event_loop() -> None:
+    inline_plugin = SimpleTransformPlugin(plugin_id="inline_id", delay=0.1)
+    pooled_plugin = SimpleTransformPlugin(plugin_id="pooled_id", delay=0.1)
+
+    plugin_sync_executor(inline_plugin, data="data")
+    await run_plugin(pooled_plugin, data="data")
+
+    assert [offender.plugin_id for offender in LoopBlockingMonitor.offenders()] == ["inline_id"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("loop_monitor")
+async def test_monitored_plugins_can_be_cancelled() -> None:
+    task = asyncio.create_task(run_plugin(SimpleAsyncPrePlugin(plugin_id="pre_id", delay=1)))
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -0,0 +1,120 @@
+# Standard Imports
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Third-party Imports
+import pandas as pd
+import pytest
+
+# Project Imports
+from pipeline_flow.core.metrics import (
+    Measurement,
+    MetricScope,
+    MetricsRegistry,
+    RssSampler,
+    count_bytes,
+    count_rows,
+    track_plugin,
+)
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from tests.resources.plugins import SimpleTransformPlugin
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics_registry() -> None:
+    MetricsRegistry.reset()
+
+
+def test_count_rows_and_bytes() -> None:
+    df = pd.DataFrame({"id": [1, 2, 3]})
+
+    assert count_rows([{"id": 1}, {"id": 2}]) == 2
+    assert count_rows(df) == 3
+    assert count_rows("DATA") is None
+    assert count_bytes(b"12345") == 5
+    assert count_bytes(df) == int(df.memory_usage(index=True).sum())
+    assert count_bytes({"id": 1}) is None
+
+
+def test_measurement_nesting() -> None:
+    with Measurement(MetricScope.PIPELINE, "pipeline1"):  # noqa: SIM117 - Nesting is what is being tested.
+        with Measurement(MetricScope.PHASE, "transform", data_in=[1, 2, 3]) as phase:
+            phase.data_out = [1]
+
+    phase_record, pipeline_record = MetricsRegistry.records()
+
+    assert (phase_record.scope, phase_record.pipeline, phase_record.phase) == ("phase", "pipeline1", "transform")
+    assert (phase_record.rows_in, phase_record.rows_out) == (3, 1)
+    assert (pipeline_record.scope, pipeline_record.pipeline, pipeline_record.phase) == ("pipeline", "pipeline1", None)
+    assert pipeline_record.wall_time >= phase_record.wall_time
+
+
+def test_track_plugin_records_failures() -> None:
+    @track_plugin
+    def failing_executor(plugin: SimpleTransformPlugin, data: str) -> str:  # noqa: ARG001
+        raise ValueError("Failure")
+
+    with pytest.raises(ValueError, match="Failure"):
+        failing_executor(SimpleTransformPlugin(plugin_id="transform_id"), "DATA")
+
+    (record,) = MetricsRegistry.records(MetricScope.PLUGIN)
+    assert record.name == "transform_id"
+    assert record.success is False
+
+
+@pytest.mark.asyncio
+async def test_pipeline_metrics_keep_nesting(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="pipeline1")
+
+    await PipelineOrchestrator(YamlConfig()).execute_pipelines([pipeline])
+
+    plugins = {record.name: record for record in MetricsRegistry.records(MetricScope.PLUGIN)}
+    phases = [record.name for record in MetricsRegistry.records(MetricScope.PHASE)]
+    (pipeline_record,) = MetricsRegistry.records(MetricScope.PIPELINE)
+
+    assert phases == ["extract", "transform", "load"]
+    assert pipeline_record.name == "pipeline1"
+    # The transform plugin runs on an executor thread, but keeps its pipeline and phase.
+    assert (plugins["mock_transformer"].pipeline, plugins["mock_transformer"].phase) == ("pipeline1", "transform")
+    assert (plugins["mock_loader"].pipeline, plugins["mock_loader"].phase) == ("pipeline1", "load")
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="The RSS cannot be sampled on this platform.")
+def test_pipeline_memory_is_measured_after_a_heavier_run() -> None:
+    size = 64 * 2**20
+
+    def run_pipeline(name: str, allocated: int) -> int:
+        with Measurement(MetricScope.PIPELINE, name) as measurement:
+            data = b"\x01" * allocated
+            time.sleep(3 * RssSampler.INTERVAL)
+            del data
+        return measurement.record.peak_rss_delta
+
+    run_pipeline("heavier", 2 * size)
+
+    # The peak RSS of the process does not grow again, the RSS sampled during the run does.
+    assert run_pipeline("lighter", size) >= size * 0.9
+
+
+def test_summarize_and_export(tmp_path: Path) -> None:
+    for rows in ([1, 2], [3]):
+        with Measurement(MetricScope.PLUGIN, 'load "a"', data_in=rows):
+            pass
+
+    (summary,) = MetricsRegistry.summarize()
+    assert (summary.calls, summary.rows_in_total) == (2, 3)
+
+    report_path, prometheus_path = tmp_path / "report.json", tmp_path / "metrics.prom"
+    MetricsRegistry.export(str(report_path), str(prometheus_path))
+
+    report = json.loads(report_path.read_text())
+    assert report["summary"]["plugin"][0]["calls"] == 2
+    assert len(report["records"]) == 2
+
+    prometheus = prometheus_path.read_text()
+    assert "# TYPE pipeline_flow_calls_total counter" in prometheus
+    assert 'pipeline_flow_rows_in_total{scope="plugin",name="load \\"a\\"",pipeline="",phase=""} 3' in prometheus
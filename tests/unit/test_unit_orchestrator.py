@@ -1,6 +1,7 @@
 # Standard Imports
 import asyncio
 from collections.abc import Callable
+from pathlib import Path
 
 # Third Party Imports
 import pytest
@@ -8,10 +9,14 @@ from pytest_mock import MockerFixture
 
 # Project Imports
 from pipeline_flow.common.exceptions import ExtractError
+from pipeline_flow.core.context import current_context
 from pipeline_flow.core.executor import ETLStrategy
-from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.metrics import MetricRecord, MetricScope
+from pipeline_flow.core.models.pipeline import Pipeline, SchedulingMode
 from pipeline_flow.core.orchestrator import PipelineOrchestrator
 from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.run_history import RunHistory
+from pipeline_flow.plugins.state_stores import JsonFileStateStore
 
 
 @pytest.fixture
@@ -20,65 +25,64 @@ def orchestrator() -> PipelineOrchestrator:
     return PipelineOrchestrator(config=config)
 
 
-def test_can_execute_no_depedency(
+def test_get_dependencies_no_dependency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
     job1 = etl_pipeline_factory(name="Job1")
-    executed_jobs = set()
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job1) == set()
 
 
-def test_can_execute_one_depedency(
+def test_get_dependencies_one_dependency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job2", needs="Job1")
-    executed_jobs = {"Job1"}
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job2) == {"Job1"}
 
 
-def test_can_execute_multiple_depedencies(
+def test_get_dependencies_multiple_dependencies(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
-    executed_jobs = {"Job1", "Job2"}
+    job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is True
+    assert orchestrator._get_dependencies(job3) == {"Job1", "Job2"}
+
+
+def test_build_dependency_graph(
+    orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2")
+    job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
+    job4 = etl_pipeline_factory(name="Job4", needs="Job3")
 
+    roots = orchestrator._build_dependency_graph([job1, job2, job3, job4])
 
-def test_can_execute_one_job_dependency_failure(
+    assert roots == [job1, job2]
+    assert orchestrator._in_degree == {"Job1": 0, "Job2": 0, "Job3": 2, "Job4": 1}
+    assert orchestrator._dependents["Job1"] == [job3]
+    assert orchestrator._dependents["Job3"] == [job4]
+
+
+def test_build_dependency_graph_unknown_dependency(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
     job1 = etl_pipeline_factory(name="Job1", needs=["Job2"])
-    executed_jobs = {}
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1,
-        executed_jobs,  # type: ignore[reportArgumentType]
-    )
-    assert result is False
+    with pytest.raises(ValueError, match="Pipeline `Job1` depends on unknown pipelines"):
+        orchestrator._build_dependency_graph([job1])
 
 
-def test_can_execute_multiple_job_dependencies_failure(
+def test_build_dependency_graph_partial_cycle(
     orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
 ) -> None:
-    job1 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
-    executed_jobs = {"Job1"}
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2", needs=["Job1", "Job3"])
+    job3 = etl_pipeline_factory(name="Job3", needs="Job2")
 
-    result = orchestrator._can_execute(  # pylint: disable=protected-access
-        job1, executed_jobs
-    )
-    assert result is False
+    with pytest.raises(ValueError, match="Circular dependency detected!"):
+        orchestrator._build_dependency_graph([job1, job2, job3])
 
 
 @pytest.mark.asyncio
@@ -111,14 +115,12 @@ async def test_execute_pipeline_exception(
 
     etl_pipeline = etl_pipeline_factory(name="Job1")
 
-    await orchestrator.pipeline_queue_producer([etl_pipeline])
-
     # When
     with pytest.raises(ExtractError):
-        await orchestrator._execute_pipeline()
+        await orchestrator._execute_pipeline(etl_pipeline)
 
     # Then
-    assert orchestrator.pipeline_queue.qsize() == 0
+    assert etl_pipeline.is_executed is False
     execute_mock.assert_awaited_once_with(etl_pipeline)
 
 
@@ -131,13 +133,10 @@ async def test_etl_pipeline_execution(
 
     etl_pipeline = etl_pipeline_factory(name="Job1")
 
-    await orchestrator.pipeline_queue_producer([etl_pipeline])
-
     # When
-    await orchestrator._execute_pipeline()
+    await orchestrator._execute_pipeline(etl_pipeline)
 
     # THen
-    assert orchestrator.pipeline_queue.qsize() == 0
     assert execute_mock.await_count == 1
     assert etl_pipeline.is_executed is True
 
@@ -153,12 +152,9 @@ async def test_execute_pipelines_success(
     job3 = etl_pipeline_factory(name="Job3", needs=["Job1", "Job2"])
     jobs = [job1, job2, job3]
 
-    async def execute_pipeline_mock() -> None:
-        if jobs:
-            current_job = jobs.pop(0)  # Get the first job
-            await asyncio.sleep(0.1)  # Simulate asynchronous work
-            current_job.is_executed = True  # Modify the job
-            return
+    async def execute_pipeline_mock(pipeline: Pipeline) -> None:
+        await asyncio.sleep(0.1)  # Simulate asynchronous work
+        pipeline.is_executed = True  # Modify the job
 
     mocker.patch.object(PipelineOrchestrator, "_execute_pipeline", side_effect=execute_pipeline_mock)
 
@@ -182,6 +178,33 @@ async def test_execute_pipelines_circular_dependency(
         await orchestrator.execute_pipelines(pipelines=jobs)
 
 
+@pytest.mark.asyncio
+async def test_execute_pipelines_starts_dependent_without_waiting_for_wave(
+    mocker: MockerFixture, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    # Job2 only needs the fast Job1, so it must not wait for the slow, unrelated Job3.
+    job1 = etl_pipeline_factory(name="Job1")
+    job2 = etl_pipeline_factory(name="Job2", needs="Job1")
+    job3 = etl_pipeline_factory(name="Job3")
+
+    delays = {"Job1": 0.1, "Job2": 0.1, "Job3": 0.3}
+    orchestrator = PipelineOrchestrator(YamlConfig(concurrency=3))
+
+    async def execute_mock(pipeline: Pipeline) -> bool:
+        await asyncio.sleep(delays[pipeline.name])
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute_mock)
+
+    start = asyncio.get_running_loop().time()
+    executed = await orchestrator.execute_pipelines(pipelines=[job1, job2, job3])
+    total = asyncio.get_running_loop().time() - start
+
+    assert executed == {"Job1", "Job2", "Job3"}
+    # A wave-based scheduler would take 0.3 (Job1 + Job3) + 0.1 (Job2) seconds.
+    assert 0.4 > total >= 0.3
+
+
 @pytest.mark.asyncio
 async def test_execute_pipelines_no_pipelines(orchestrator: PipelineOrchestrator) -> None:
     with pytest.raises(ValueError, match="The Pipeline list is empty. There is nothing to execute."):
@@ -213,3 +236,78 @@ async def test_execute_pipelines_semaphore_lock(
     expected_execution_time = (len(jobs) / concurrency) * execution_time
 
     assert expected_execution_time + 0.1 > total_execution_time >= expected_execution_time
+
+
+@pytest.mark.asyncio
+async def test_state_is_persisted_when_the_pipeline_succeeds(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    orchestrator: PipelineOrchestrator,
+    etl_pipeline_factory: Callable[..., Pipeline],
+) -> None:
+    orchestrator.state_store = JsonFileStateStore(plugin_id="state", path=str(tmp_path / "state.json"))
+
+    async def execute(pipeline: Pipeline) -> bool:
+        current_context().state("extractor_id").set("watermark", pipeline.name)
+        if pipeline.name == "Failed":
+            raise ExtractError("Error during extraction")
+        return True
+
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute)
+
+    await orchestrator._execute_pipeline(etl_pipeline_factory(name="Succeeded"))
+    with pytest.raises(ExtractError):
+        await orchestrator._execute_pipeline(etl_pipeline_factory(name="Failed"))
+
+    assert orchestrator.state_store.get("Succeeded", "extractor_id.watermark") == "Succeeded"
+    assert orchestrator.state_store.get("Failed", "extractor_id.watermark") is None
+
+
+async def _execution_order(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, jobs: list[Pipeline]
+) -> list[str]:
+    order = []
+
+    async def execute(pipeline: Pipeline) -> bool:
+        order.append(pipeline.name)
+        await asyncio.sleep(0)
+        return True
+
+    orchestrator.concurrency = 1
+    orchestrator.semaphore = asyncio.Semaphore(1)
+    mocker.patch.object(ETLStrategy, "execute", side_effect=execute)
+    await orchestrator.execute_pipelines(jobs)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_ready_pipelines_start_by_priority(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    jobs = [etl_pipeline_factory(name=name) for name in ("Low", "High", "Dependency", "Urgent", "Default")]
+    for job, priority in zip(jobs, (1, 5, 0, 10, 0), strict=True):
+        job.priority = priority
+    jobs[3].needs = "Dependency"
+
+    # `Dependency` inherits the priority of `Urgent`, which needs it.
+    assert await _execution_order(mocker, orchestrator, jobs) == ["Dependency", "Urgent", "High", "Low", "Default"]
+
+
+@pytest.mark.asyncio
+async def test_ready_pipelines_start_by_critical_path(
+    mocker: MockerFixture, orchestrator: PipelineOrchestrator, etl_pipeline_factory: Callable[..., Pipeline]
+) -> None:
+    jobs = [
+        etl_pipeline_factory(name="Short"),
+        etl_pipeline_factory(name="Medium"),
+        etl_pipeline_factory(name="Head"),
+        etl_pipeline_factory(name="Tail", needs="Head"),
+    ]
+    orchestrator.scheduling = SchedulingMode.CRITICAL_PATH
+    orchestrator.history = RunHistory()
+    for name, duration in {"Short": 10.0, "Medium": 30.0, "Head": 5.0, "Tail": 60.0}.items():
+        record = MetricRecord(MetricScope.PIPELINE, name, name, None, started_at=0, wall_time=duration)
+        orchestrator.history.record(name, record)
+
+    # `Head` is the shortest pipeline, but it starts the longest chain.
+    assert await _execution_order(mocker, orchestrator, jobs) == ["Head", "Tail", "Medium", "Short"]
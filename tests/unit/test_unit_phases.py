@@ -265,3 +265,40 @@ def test_create_phase_transform_at_load(mocker: MockerFixture) -> None:
     assert isinstance(tf_load, TransformLoadPhase)
     assert isinstance(tf_load.steps[0], SimpleTransformLoadPlugin)
     assert tf_load.steps[0].id == "mock_transform_loader_id"
+
+
+def test_create_phase_transform_at_load_with_needs(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+
+    tf_load = TransformLoadPhase(
+        steps=[  # type: ignore[reportArgumentType] - The dicts are parsed into Plugin objects
+            {"id": "staging", "plugin": "mock_transformer_loader", "args": {"query": "SELECT 1"}},
+            {"plugin": "mock_transformer_loader", "args": {"query": "SELECT 2"}, "needs": "staging"},
+        ]
+    )
+
+    # A step without an id gets one generated, so that it can be tracked in the dependency graph.
+    assert tf_load.dependencies == {tf_load.steps[1].id: ["staging"]}
+    assert tf_load.steps[1].id.startswith("mock_transformer_loader_")
+
+
+@pytest.mark.parametrize(
+    ("needs", "error"),
+    [
+        ({"first": ["unknown"]}, "depend on unknown steps: \\['unknown'\\]"),
+        ({"first": ["second"], "second": ["first"]}, "Circular dependency between transform at load steps"),
+    ],
+)
+def test_create_phase_transform_at_load_with_invalid_needs(
+    mocker: MockerFixture, needs: dict[str, list[str]], error: str
+) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleTransformLoadPlugin)
+    steps = [
+        {"id": step_id, "plugin": "mock_transformer_loader", "args": {"query": "SELECT 1"}, "needs": step_needs}
+        for step_id, step_needs in needs.items()
+    ]
+    if "second" not in needs:
+        steps.append({"id": "second", "plugin": "mock_transformer_loader", "args": {"query": "SELECT 2"}})
+
+    with pytest.raises(ValidationError, match=error):
+        TransformLoadPhase(steps=steps)  # type: ignore[reportArgumentType]
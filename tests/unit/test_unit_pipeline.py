@@ -2,9 +2,12 @@
 from collections.abc import Callable
 
 # Third-party Imports
+import pytest
+
 # Project Imports
 from pipeline_flow.core.models.pipeline import Pipeline, PipelineType
 from pipeline_flow.plugins import IExtractPlugin, ILoadPlugin, ITransformLoadPlugin, ITransformPlugin
+from tests.resources.plugins import SimpleMergePlugin, SimplePostPlugin, SimpleStreamingExtractorPlugin
 
 
 def test_etl_pipeline_init_success(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
@@ -61,3 +64,47 @@ def test_etlt_pipeline_init_success(etlt_pipeline_factory: Callable[..., Pipelin
     assert isinstance(pipeline.load_transform.steps[0], ITransformLoadPlugin)
 
     assert not pipeline.is_executed
+
+
+def test_streaming_pipeline_init_success(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(
+        name="Streaming Pipeline", streaming=True, extract=[SimpleStreamingExtractorPlugin(plugin_id="stream_id")]
+    )
+
+    assert pipeline.streaming is True
+    assert pipeline.stream_queue_size == 8
+
+
+def test_streaming_pipeline_multiple_extract_steps(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Streaming Pipeline")
+    pipeline.extract.steps = [
+        SimpleStreamingExtractorPlugin(plugin_id="stream_id"),
+        SimpleStreamingExtractorPlugin(plugin_id="stream_id_2"),
+    ]
+    pipeline.extract.merge = SimpleMergePlugin(plugin_id="merge_id")
+
+    with pytest.raises(ValueError, match=r"Streaming mode requires exactly one extract step\."):
+        Pipeline(name=pipeline.name, type=pipeline.type, phases=pipeline.phases, streaming=True)
+
+
+def test_streaming_pipeline_with_extract_post_processing(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Streaming Pipeline")
+    pipeline.extract.post = [SimplePostPlugin(plugin_id="post_id")]
+
+    with pytest.raises(ValueError, match=r"Extract post-processing is not supported in streaming mode\."):
+        Pipeline(name=pipeline.name, type=pipeline.type, phases=pipeline.phases, streaming=True)
+
+
+def test_streaming_pipeline_with_load_post_processing(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Streaming Pipeline")
+    pipeline.load.post = [SimplePostPlugin(plugin_id="post_id")]
+
+    with pytest.raises(ValueError, match=r"Load post-processing is not supported in streaming mode\."):
+        Pipeline(name=pipeline.name, type=pipeline.type, phases=pipeline.phases, streaming=True)
+
+
+def test_pipeline_memory_budget_with_unit(etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="Pipeline")
+    pipeline = Pipeline(name=pipeline.name, type=pipeline.type, phases=pipeline.phases, memory_budget="512MB")
+
+    assert pipeline.memory_budget == 512 * 10**6
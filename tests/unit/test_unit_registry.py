@@ -1,4 +1,8 @@
 # Standard Imports
+import importlib
+import subprocess
+import sys
+from importlib import metadata
 from unittest.mock import MagicMock
 
 # Third Party Imports
@@ -6,7 +10,7 @@ import pytest
 from pytest_mock import MockerFixture, MockType
 
 # Project
-from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.registry import BUILTIN_PLUGINS, PLUGIN_ENTRY_POINT_GROUP, PluginRegistry
 from pipeline_flow.plugins import IPlugin
 from tests.resources import plugins
 
@@ -89,3 +93,53 @@ def test_instantiate_plugin(
 
     assert isinstance(resolved_plugin, IPlugin)
     assert resolved_plugin.id == plugin_id
+
+
+@pytest.mark.usefixtures("restart_plugin_registry")
+def test_get_lazy_plugin_imports_module_on_first_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "tests.resources.lazy_plugins", raising=False)
+    monkeypatch.setattr(PluginRegistry, "_lazy_registry", {})
+    PluginRegistry.register_lazy("lazy_plugin", "tests.resources.lazy_plugins:LazyPlugin")
+
+    assert "tests.resources.lazy_plugins" not in sys.modules
+
+    plugin_class = PluginRegistry.get("lazy_plugin")
+
+    assert plugin_class.__name__ == "LazyPlugin"
+    assert "tests.resources.lazy_plugins" in sys.modules
+
+
+def test_rest_api_extractor_does_not_import_sqlalchemy() -> None:
+    # Run in a fresh interpreter, as other tests already imported SQLAlchemy in this one.
+    code = (
+        "import sys; from pipeline_flow.core.registry import PluginRegistry; "
+        "PluginRegistry.get('rest_api_extractor'); print('sqlalchemy' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.usefixtures("restart_plugin_registry")
+def test_get_plugin_from_entry_point(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(PluginRegistry, "_lazy_registry", {})
+    monkeypatch.setattr(PluginRegistry, "_entry_points_discovered", False)
+    entry_point = metadata.EntryPoint(
+        name="entry_point_plugin", value="tests.resources.plugins:SimpleDummyPlugin", group=PLUGIN_ENTRY_POINT_GROUP
+    )
+    entry_points = mocker.patch.object(metadata, "entry_points", return_value=[entry_point])
+
+    assert PluginRegistry.get("entry_point_plugin") is plugins.SimpleDummyPlugin
+
+    # The entry points are discovered once.
+    with pytest.raises(ValueError, match="Plugin class was not found"):
+        PluginRegistry.get("nonexistent_plugin")
+    entry_points.assert_called_once_with(group=PLUGIN_ENTRY_POINT_GROUP)
+
+
+@pytest.mark.parametrize(("plugin_name", "target"), BUILTIN_PLUGINS.items())
+def test_builtin_plugins_manifest(plugin_name: str, target: str) -> None:
+    module_name, _, attribute = target.partition(":")
+    plugin_class = getattr(importlib.import_module(module_name), attribute)
+
+    assert PluginRegistry.get(plugin_name) is plugin_class
@@ -0,0 +1,131 @@
+# Standard Imports
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+
+# Third-party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.utils.validation import parse_rate
+from pipeline_flow.core import executor
+from pipeline_flow.core.models.phases import ExtractPhase
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.registry import PluginRegistry
+from pipeline_flow.core.resource_pools import ResourcePools, TokenBucket
+from tests.resources.plugins import SimpleExtractorPlugin, SimpleMergePlugin, SimpleTransformPlugin
+
+
+@pytest.fixture(autouse=True)
+def reset_resource_pools() -> Iterator[None]:
+    yield
+    ResourcePools.configure(None)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (5, 5), ("50", 50.0), ("50/s", 50.0), ("600/min", 10.0), ("7200 / h", 2.0)],
+)
+def test_parse_rate(value: float | str | None, expected: float | None) -> None:
+    assert parse_rate(value) == expected
+
+
+@pytest.mark.parametrize("value", ["fast", "10/day", "/s"])
+def test_parse_rate_invalid(value: str) -> None:
+    with pytest.raises(ValueError, match="Invalid rate"):
+        parse_rate(value)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_the_burst() -> None:
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.take()
+
+    # Two tokens are available at once, the next two refill at 20 per second.
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_is_shared_across_plugins() -> None:
+    ResourcePools.configure({"crm_api": {"max_concurrency": 2}})
+    running = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal running, peak
+        async with ResourcePools.acquire("crm_api"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+
+
+def test_undeclared_resource_pool() -> None:
+    with pytest.raises(ValueError, match="Resource pool `missing` is not declared"):
+        ResourcePools.acquire("missing")
+
+
+@pytest.mark.asyncio
+async def test_undeclared_resource_pool_fails_before_any_pipeline_runs(
+    etl_pipeline_factory: Callable[..., Pipeline], mocker: MockerFixture
+) -> None:
+    pipeline = etl_pipeline_factory(name="pipeline")
+    pipeline.load.steps[0].resource_pool = "missing"
+    extract = mocker.spy(SimpleExtractorPlugin, "__call__")
+
+    orchestrator = PipelineOrchestrator(YamlConfig(resource_pools={"warehouse": {"max_concurrency": 1}}))
+    with pytest.raises(ValueError, match="Plugin `mock_loader` of pipeline `pipeline` references the resource pool"):
+        await orchestrator.execute_pipelines([pipeline])
+
+    extract.assert_not_called()
+
+
+def test_registry_assigns_the_resource_pool(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleExtractorPlugin)
+    plugin = PluginRegistry.instantiate_plugin(
+        {"plugin": "simple_extractor_plugin", "id": "extractor", "resource_pool": "crm_api"}
+    )
+    other_plugin = PluginRegistry.instantiate_plugin({"plugin": "simple_extractor_plugin", "id": "other"})
+
+    assert plugin.resource_pool == "crm_api"
+    assert other_plugin.resource_pool is None
+
+
+@pytest.mark.asyncio
+async def test_executor_holds_the_resource_pool_for_every_call() -> None:
+    ResourcePools.configure({"warehouse": {"max_concurrency": 1}})
+    extracts = ExtractPhase.model_construct(
+        steps=[SimpleExtractorPlugin(plugin_id=f"extractor_{index}", delay=0.05) for index in range(3)],
+        merge=SimpleMergePlugin(plugin_id="merge"),
+    )
+    for plugin in extracts.steps:
+        plugin.resource_pool = "warehouse"
+
+    start = time.monotonic()
+    await executor.run_extractor(extracts)
+
+    # The extractors would run concurrently, but the pool only lets one of them in at a time.
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_executor_holds_the_resource_pool_for_sync_plugins() -> None:
+    ResourcePools.configure({"warehouse": {"max_concurrency": 1}})
+    plugins = [SimpleTransformPlugin(plugin_id=f"transform_{index}", delay=0.05) for index in range(2)]
+    for plugin in plugins:
+        plugin.resource_pool = "warehouse"
+
+    start = time.monotonic()
+    await asyncio.gather(*(executor.run_plugin(plugin, data="data") for plugin in plugins))
+
+    assert time.monotonic() - start >= 0.1
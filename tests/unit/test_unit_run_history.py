@@ -0,0 +1,52 @@
+# Standard Imports
+from pathlib import Path
+
+# Project Imports
+from pipeline_flow.core.metrics import MetricRecord, MetricScope
+from pipeline_flow.core.run_history import PipelineProfile, RunHistory
+from pipeline_flow.plugins.state_stores import JsonFileStateStore
+
+
+def _record(wall_time: float, cpu_time: float, peak_rss_delta: int) -> MetricRecord:
+    return MetricRecord(
+        scope=MetricScope.PIPELINE,
+        name="pipeline",
+        pipeline="pipeline",
+        phase=None,
+        started_at=0,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        peak_rss_delta=peak_rss_delta,
+    )
+
+
+def test_profiles_are_learned_from_the_previous_runs(tmp_path: Path) -> None:
+    store = JsonFileStateStore(plugin_id="history", path=str(tmp_path / "history.json"))
+    history = RunHistory(store)
+
+    history.record("pipeline", _record(wall_time=2.0, cpu_time=1.0, peak_rss_delta=400))
+    history.record("pipeline", _record(wall_time=1.0, cpu_time=1.5, peak_rss_delta=200))
+
+    assert history.get("pipeline") == PipelineProfile(memory=300, cpu=1.0, duration=1.5)
+    assert RunHistory(store).get_many(["pipeline", "other"]) == {"pipeline": PipelineProfile(300, 1.0, 1.5)}
+    assert RunHistory().get("pipeline") is None
+
+
+def test_concurrent_runs_only_learn_the_duration() -> None:
+    history = RunHistory()
+
+    history.record("pipeline", _record(wall_time=2.0, cpu_time=1.0, peak_rss_delta=400), ran_alone=False)
+    assert history.get("pipeline") == PipelineProfile(memory=None, cpu=None, duration=2.0)
+
+    history.record("pipeline", _record(wall_time=1.0, cpu_time=1.5, peak_rss_delta=200))
+    history.record("pipeline", _record(wall_time=1.0, cpu_time=4.0, peak_rss_delta=0), ran_alone=False)
+    assert history.get("pipeline") == PipelineProfile(memory=200, cpu=1.5, duration=1.25)
+
+
+def test_history_from_config(tmp_path: Path) -> None:
+    history = RunHistory.from_config(
+        {"store": {"plugin": "sqlite_state_store", "args": {"path": str(tmp_path / "history.db")}}}
+    )
+    history.record("pipeline", _record(wall_time=2.0, cpu_time=1.0, peak_rss_delta=0))
+
+    assert history.store.get(RunHistory.NAMESPACE, "pipeline") == {"memory": 0, "cpu": 0.5, "duration": 2.0}
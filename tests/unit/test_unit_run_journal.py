@@ -0,0 +1,121 @@
+# Standard Imports
+import os
+import stat
+from collections.abc import Callable
+from pathlib import Path
+
+# Third-party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.exceptions import LoadError
+from pipeline_flow.core import executor
+from pipeline_flow.core.models.phases import PipelinePhase
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.run_journal import PipelineStatus, RunJournal, new_run_id
+from pipeline_flow.plugins.state_stores import SQLiteStateStore
+
+
+@pytest.fixture
+def journal_store(tmp_path: Path) -> SQLiteStateStore:
+    return SQLiteStateStore(plugin_id="journal", path=str(tmp_path / "journal.db"))
+
+
+def test_new_run_ids_are_unique() -> None:
+    assert new_run_id() != new_run_id()
+
+
+def test_spilled_phases_are_resumed(journal_store: SQLiteStateStore, tmp_path: Path) -> None:
+    journal = RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill"))
+    pipeline_journal = journal.pipeline("pipeline")
+    pipeline_journal.record_phase(PipelinePhase.EXTRACT_PHASE, ["extracted"], has_output=True)
+    pipeline_journal.record_phase(PipelinePhase.TRANSFORM_PHASE, ["transformed"], has_output=True)
+    pipeline_journal.record_status(PipelineStatus.FAILED)
+
+    resumed_journal = RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill")).pipeline("pipeline")
+
+    assert not resumed_journal.is_completed
+    assert resumed_journal.is_resumed(PipelinePhase.EXTRACT_PHASE)
+    assert resumed_journal.is_resumed(PipelinePhase.TRANSFORM_PHASE)
+    assert not resumed_journal.is_resumed(PipelinePhase.LOAD_PHASE)
+    # Only the output of the last resumed phase is needed by the next phase.
+    assert resumed_journal.restore(PipelinePhase.EXTRACT_PHASE) is None
+    assert resumed_journal.restore(PipelinePhase.TRANSFORM_PHASE) == ["transformed"]
+    assert not RunJournal(journal_store, "run_2").pipeline("pipeline").resumed_phases
+
+
+def test_spilled_outputs_writable_by_others_are_not_resumed(journal_store: SQLiteStateStore, tmp_path: Path) -> None:
+    pipeline_journal = RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill")).pipeline("pipeline")
+    pipeline_journal.record_phase(PipelinePhase.EXTRACT_PHASE, ["extracted"], has_output=True)
+    spill = Path(pipeline_journal.entry["phases"][PipelinePhase.EXTRACT_PHASE]["spill"])
+
+    # Spilled outputs are unpickled, so a file anyone else could have written is extracted again instead.
+    spill.chmod(0o666)
+
+    assert not RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill")).pipeline("pipeline").resumed_phases
+
+
+def test_spilled_outputs_are_private_whatever_the_umask(journal_store: SQLiteStateStore, tmp_path: Path) -> None:
+    umask = os.umask(0o002)
+    try:
+        pipeline_journal = RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill")).pipeline("pipeline")
+        pipeline_journal.record_phase(PipelinePhase.EXTRACT_PHASE, ["extracted"], has_output=True)
+    finally:
+        os.umask(umask)
+
+    spill = Path(pipeline_journal.entry["phases"][PipelinePhase.EXTRACT_PHASE]["spill"])
+    assert stat.S_IMODE(spill.stat().st_mode) == 0o600
+    assert RunJournal(journal_store, "run_1", spill_dir=str(tmp_path / "spill")).pipeline("pipeline").resumed_phases
+
+
+def test_phases_without_spilled_output_are_not_resumed(journal_store: SQLiteStateStore) -> None:
+    pipeline_journal = RunJournal(journal_store, "run_1").pipeline("pipeline")
+    pipeline_journal.record_phase(PipelinePhase.EXTRACT_PHASE, ["extracted"], has_output=True)
+
+    assert not RunJournal(journal_store, "run_1").pipeline("pipeline").resumed_phases
+
+    # Once the data is loaded, the transform-at-load phase does not need the extracted data anymore.
+    pipeline_journal.record_phase(PipelinePhase.LOAD_PHASE, None, has_output=False)
+
+    assert RunJournal(journal_store, "run_1").pipeline("pipeline").resumed_phases == ["extract", "load"]
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_skips_completed_work(
+    mocker: MockerFixture,
+    journal_store: SQLiteStateStore,
+    tmp_path: Path,
+    etl_pipeline_factory: Callable[..., Pipeline],
+) -> None:
+    pipelines = [etl_pipeline_factory(name="Job1"), etl_pipeline_factory(name="Job2", needs="Job1")]
+    extract_spy = mocker.spy(executor, "run_extractor")
+    transform_spy = mocker.spy(executor, "run_transformer_in_executor")
+    load_mock = mocker.patch.object(executor, "run_loader", side_effect=[None, LoadError("Database is down"), None])
+
+    orchestrator = PipelineOrchestrator(YamlConfig())
+    orchestrator.journal = RunJournal(journal_store, orchestrator.run_id, spill_dir=str(tmp_path / "spill"))
+    with pytest.raises(ExceptionGroup):
+        await orchestrator.execute_pipelines(pipelines)
+
+    assert (extract_spy.call_count, transform_spy.call_count, load_mock.call_count) == (2, 2, 2)
+
+    resumed_orchestrator = PipelineOrchestrator(YamlConfig())
+    resumed_orchestrator.journal = RunJournal(journal_store, orchestrator.run_id, spill_dir=str(tmp_path / "spill"))
+    pipelines = [etl_pipeline_factory(name="Job1"), etl_pipeline_factory(name="Job2", needs="Job1")]
+    executed = await resumed_orchestrator.execute_pipelines(pipelines)
+
+    assert executed == {"Job1", "Job2"}
+    # Only the failed load phase of Job2 ran again, with the transformed data restored from the spill directory.
+    assert (extract_spy.call_count, transform_spy.call_count, load_mock.call_count) == (2, 2, 3)
+    assert load_mock.call_args.args[0] == "transformed_extracted_data"
+    assert resumed_orchestrator.journal.pipeline("Job2").is_completed
+    # Completed pipelines are never resumed, so their spilled outputs are removed.
+    assert not (tmp_path / "spill" / orchestrator.run_id).exists()
+
+
+def test_resume_requires_a_journal() -> None:
+    with pytest.raises(ValueError, match="Resuming a run requires the `journal` section"):
+        PipelineOrchestrator(YamlConfig(), resume_run_id="run_1")
@@ -0,0 +1,130 @@
+# Standard Imports
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+from cryptography.fernet import Fernet
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.core.parsers.secret_parser import SecretReference, secret_resolver
+from pipeline_flow.core.secret_cache import SECRET_CACHE_TTL_ENV, SecretCache
+from tests.resources.plugins import SimpleSecretPlugin
+
+
+def test_secret_cache_fetches_once_within_ttl(mocker: MockerFixture) -> None:
+    fetch = mocker.Mock(return_value="value")
+    SecretCache.configure(ttl=60)
+
+    assert SecretCache.get_or_fetch("key", fetch) == "value"
+    assert SecretCache.get_or_fetch("key", fetch) == "value"
+    fetch.assert_called_once()
+
+
+def test_secret_cache_refetches_expired_entries(mocker: MockerFixture) -> None:
+    fetch = mocker.Mock(side_effect=["old", "new"])
+    SecretCache.configure(ttl=0.01)
+
+    assert SecretCache.get_or_fetch("key", fetch) == "old"
+    time.sleep(0.02)
+    assert SecretCache.get_or_fetch("key", fetch) == "new"
+
+
+def test_secret_cache_disabled_by_environment(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(SECRET_CACHE_TTL_ENV, "0")
+    fetch = mocker.Mock(return_value="value")
+
+    SecretCache.get_or_fetch("key", fetch)
+    SecretCache.get_or_fetch("key", fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_secret_cache_single_flight() -> None:
+    calls = 0
+    release = threading.Event()
+
+    def slow_fetch() -> str:
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return "value"
+
+    SecretCache.configure(ttl=60)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(SecretCache.get_or_fetch, "key", slow_fetch) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+
+    assert [future.result() for future in futures] == ["value"] * 8
+    assert calls == 1
+
+
+def test_secret_cache_does_not_cache_failures(mocker: MockerFixture) -> None:
+    fetch = mocker.Mock(side_effect=[ConnectionError("Unavailable"), "value"])
+    SecretCache.configure(ttl=60)
+
+    with pytest.raises(ConnectionError, match="Unavailable"):
+        SecretCache.get_or_fetch("key", fetch)
+
+    assert SecretCache.get_or_fetch("key", fetch) == "value"
+
+
+def test_secret_cache_encrypted_file(tmp_path: Path, mocker: MockerFixture) -> None:
+    path, key = tmp_path / "secrets.cache", Fernet.generate_key()
+    SecretCache.configure(ttl=60, path=str(path), key=key)
+    SecretCache.get_or_fetch("key", lambda: {"password": "secret_password"})
+
+    assert b"secret_password" not in path.read_bytes()
+
+    # A restart reads the secret back from the file, without calling the provider.
+    SecretCache.reset()
+    SecretCache.configure(ttl=60, path=str(path), key=key)
+    fetch = mocker.Mock()
+
+    assert SecretCache.get_or_fetch("key", fetch) == {"password": "secret_password"}
+    fetch.assert_not_called()
+
+    # The file is ignored when it cannot be decrypted.
+    SecretCache.reset()
+    SecretCache.configure(ttl=60, path=str(path), key=Fernet.generate_key())
+
+    assert SecretCache.get_or_fetch("key", lambda: "refetched") == "refetched"
+
+
+def test_secret_cache_ignores_malformed_entries(tmp_path: Path) -> None:
+    path, key = tmp_path / "secrets.cache", Fernet.generate_key()
+    path.write_bytes(Fernet(key).encrypt(b'{"key": {"secret": "value"}}'))
+    SecretCache.configure(ttl=60, path=str(path), key=key)
+
+    assert SecretCache.get_or_fetch("key", lambda: "refetched") == "refetched"
+
+
+def test_secret_manager_cache_key_identifies_the_arguments() -> None:
+    cache_key = SimpleSecretPlugin("db", "secret_name", "region").cache_key
+
+    # Plugin ids are only unique within a configuration, while the on-disk cache is shared across configurations.
+    assert SimpleSecretPlugin("other_id", secret_name="secret_name", region="region").cache_key == cache_key
+    assert SimpleSecretPlugin("db", "other_secret_name", "region").cache_key != cache_key
+
+
+def test_secret_cache_file_requires_key(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="requires a Fernet key"):
+        SecretCache.configure(path=str(tmp_path / "secrets.cache"))
+
+
+def test_secret_resolver_calls_provider_once(mocker: MockerFixture) -> None:
+    plugin = SimpleSecretPlugin("test_123", "secret_name", "region")
+    call_spy = mocker.spy(SimpleSecretPlugin, "__call__")
+    resource_id = mocker.patch.object(
+        SimpleSecretPlugin, "resource_id", new_callable=mocker.PropertyMock, return_value="fake_arn_to_secret"
+    )
+
+    for key_path in (None, None, "resource_id", "resource_id"):
+        secret_resolver(plugin, SecretReference(secret_id="secret_id123", key_path=key_path))
+
+    assert call_spy.call_count == 1
+    resource_id.assert_called_once()
@@ -0,0 +1,111 @@
+# Standard Imports
+from pathlib import Path
+
+# Third-party Imports
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.common.type_def import DataFormat
+from pipeline_flow.common.utils.validation import parse_byte_size
+from pipeline_flow.core import executor
+from pipeline_flow.core.context import PipelineContext
+from pipeline_flow.core.models.phases import LoadPhase, PipelinePhase, TransformExecutorType, TransformPhase
+from pipeline_flow.core.spill import SpilledData, SpillFormat, SpillManager, estimate_size
+from tests.resources.plugins import SimpleColumnarLoaderPlugin, SimpleLoaderPlugin, SimpleRowsTransformPlugin
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), (1024, 1024), ("512", 512), ("1.5KB", 1500), ("2 MiB", 2 * 2**20), ("1gb", 10**9)],
+)
+def test_parse_byte_size(value: int | str | None, expected: int | None) -> None:
+    assert parse_byte_size(value) == expected
+
+
+def test_parse_byte_size_rejects_invalid_sizes() -> None:
+    with pytest.raises(ValueError, match="Invalid size `lots`"):
+        parse_byte_size("lots")
+
+
+def test_estimate_size() -> None:
+    rows = [{"id": index, "name": f"name_{index}"} for index in range(1000)]
+
+    assert estimate_size(rows) > estimate_size(rows[:10]) > 0
+    assert estimate_size(pd.DataFrame(rows)) > 0
+    assert estimate_size(pa.Table.from_pylist(rows)) > 0
+    assert estimate_size("extracted_data") is None
+
+
+def test_data_under_the_memory_budget_is_kept_in_memory(tmp_path: Path) -> None:
+    spill = SpillManager(str(tmp_path), memory_budget=2**20)
+    data = [{"id": 1}]
+
+    assert spill.hand_off(PipelinePhase.EXTRACT_PHASE, data) is data
+    assert spill.hand_off(PipelinePhase.EXTRACT_PHASE, "extracted_data") == "extracted_data"
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("spill_format", list(SpillFormat))
+def test_spilled_data_is_read_back_in_the_plugin_format(tmp_path: Path, spill_format: SpillFormat) -> None:
+    spill = SpillManager(str(tmp_path / "pipeline"), memory_budget=1, spill_format=spill_format)
+    data = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+    spilled = spill.hand_off(PipelinePhase.EXTRACT_PHASE, data)
+
+    assert isinstance(spilled, SpilledData)
+    assert Path(spilled.path) == tmp_path / "pipeline" / f"extract.{spill_format}"
+    pd.testing.assert_frame_equal(spilled.as_format(DataFormat.NATIVE), data)
+    assert spilled.as_format(DataFormat.ROWS) == data.to_dict("records")
+    assert spilled.as_format(DataFormat.COLUMNAR).equals(pa.Table.from_pandas(data, preserve_index=False))
+
+    spill.cleanup()
+    assert not (tmp_path / "pipeline").exists()
+
+
+def test_spilled_data_is_split_into_readers_of_the_same_file(tmp_path: Path) -> None:
+    rows = [{"id": index} for index in range(5)]
+    spilled = SpillManager(str(tmp_path), memory_budget=1).hand_off(PipelinePhase.EXTRACT_PHASE, rows)
+
+    parts = spilled.split(2)
+
+    assert [len(part) for part in parts] == [3, 2]
+    assert {part.path for part in parts} == {spilled.path}
+    assert [row for part in parts for row in part.to_native()] == rows
+    assert [len(part) for part in parts[1].split(2)] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_phase_outputs_over_the_memory_budget_are_handed_off_spilled(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    rows = [{"id": index} for index in range(10)]
+    transformations = TransformPhase.model_construct(
+        steps=[SimpleRowsTransformPlugin(plugin_id="transform_id")], executor=TransformExecutorType.THREAD, chunks=2
+    )
+    destinations = LoadPhase.model_construct(
+        steps=[SimpleLoaderPlugin(plugin_id="native_id"), SimpleColumnarLoaderPlugin(plugin_id="columnar_id")]
+    )
+    native_spy = mocker.spy(SimpleLoaderPlugin, "__call__")
+    columnar_spy = mocker.spy(SimpleColumnarLoaderPlugin, "__call__")
+
+    async def extract() -> list[dict]:
+        return rows
+
+    context = PipelineContext("pipeline", spill=SpillManager(str(tmp_path), memory_budget=1))
+    with context.activate():
+        extracted_data = await executor.run_phase(PipelinePhase.EXTRACT_PHASE, extract)
+        transformed_data = await executor.run_phase(
+            PipelinePhase.TRANSFORM_PHASE,
+            lambda: executor.run_transformer_in_executor(extracted_data, transformations),
+        )
+        await executor.run_loader(transformed_data, destinations)
+
+    assert isinstance(extracted_data, SpilledData)
+    assert isinstance(transformed_data, SpilledData)
+    expected_rows = [{**row, "transformed": True} for row in rows]
+    assert native_spy.call_args.kwargs["data"] == expected_rows
+    assert columnar_spy.call_args.kwargs["data"].to_pylist() == expected_rows
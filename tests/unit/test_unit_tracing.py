@@ -0,0 +1,112 @@
+# Standard Imports
+import json
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+# Third-party Imports
+import pytest
+from pytest_mock import MockerFixture
+
+# Project Imports
+from pipeline_flow.core.models.pipeline import Pipeline
+from pipeline_flow.core.orchestrator import PipelineOrchestrator
+from pipeline_flow.core.parsers.yaml_parser import YamlConfig
+from pipeline_flow.core.tracing import StatusCode, Tracer, run_after_queue_wait, run_timed
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Generator[Path, None, None]:
+    path = tmp_path / "traces.jsonl"
+    Tracer.configure(str(path))
+    yield path
+    Tracer.configure(None)
+    Tracer.reset()
+
+
+def test_span_is_noop_when_disabled() -> None:
+    with Tracer.span("disabled") as span:
+        assert span is None
+
+    Tracer.record_span("disabled", time.time_ns())
+
+    assert Tracer.spans() == []
+
+
+@pytest.mark.usefixtures("trace_file")
+def test_nested_spans() -> None:
+    with Tracer.span("parent") as parent, Tracer.span("child") as child:
+        pass
+
+    with pytest.raises(ValueError, match="Failure"), Tracer.span("failed"):
+        raise ValueError("Failure")
+
+    child_span, parent_span, failed_span = Tracer.spans()
+
+    assert child_span is child
+    assert parent_span is parent
+    assert child.parent_span_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert failed_span.trace_id != parent.trace_id
+    assert (failed_span.status, failed_span.status_message) == (StatusCode.ERROR, "ValueError: Failure")
+
+
+@pytest.mark.usefixtures("trace_file")
+def test_run_after_queue_wait() -> None:
+    assert run_after_queue_wait(time.time_ns(), sum, [1, 2]) == 3
+
+    (span,) = Tracer.spans()
+    assert span.name == "executor.queue_wait"
+    assert span.end_time >= span.start_time
+
+
+@pytest.mark.asyncio
+async def test_pipeline_spans_keep_parents(trace_file: Path, etl_pipeline_factory: Callable[..., Pipeline]) -> None:
+    pipeline = etl_pipeline_factory(name="pipeline1")
+
+    with Tracer.span("run") as run_span:
+        await PipelineOrchestrator(YamlConfig()).execute_pipelines([pipeline])
+
+    spans = {span.name: span for span in Tracer.spans()}
+
+    assert spans["pipeline pipeline1"].parent_span_id == run_span.span_id
+    assert spans["phase transform"].parent_span_id == spans["pipeline pipeline1"].span_id
+    # The transform plugin runs on an executor thread, after waiting in the thread pool queue.
+    assert spans["executor.queue_wait"].parent_span_id == spans["phase transform"].span_id
+    assert spans["plugin mock_transformer"].parent_span_id == spans["phase transform"].span_id
+    assert {span.trace_id for span in spans.values()} == {run_span.trace_id}
+
+    Tracer.export()
+
+    (line,) = trace_file.read_text().splitlines()  # noqa: ASYNC240
+    exported = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(exported) == len(spans)
+    assert Tracer.spans() == []
+
+
+@pytest.mark.usefixtures("trace_file")
+def test_queue_wait_of_a_worker_process_is_recorded_by_the_caller() -> None:
+    submitted_at = time.time_ns()
+    started_at, result = run_timed(sum, [1, 2])
+    Tracer.record_span("executor.queue_wait", submitted_at, end_time=started_at)
+
+    (span,) = Tracer.spans()
+    assert result == 3
+    assert (span.start_time, span.end_time) == (submitted_at, started_at)
+
+
+def test_export_keeps_spans_finished_while_writing(trace_file: Path, mocker: MockerFixture) -> None:
+    with Tracer.span("exported"):
+        pass
+    to_otlp = Tracer.to_otlp
+
+    def finish_a_span(spans: list) -> dict:
+        with Tracer.span("late"):
+            pass
+        return to_otlp(spans)
+
+    mocker.patch.object(Tracer, "to_otlp", side_effect=finish_a_span)
+    Tracer.export()
+
+    assert [span.name for span in Tracer.spans()] == ["late"]
+    assert "exported" in trace_file.read_text()
@@ -0,0 +1,84 @@
+# Standard Imports
+import threading
+from typing import Generator
+
+# Third-party Imports
+import pandas as pd
+import pytest
+
+# Project Imports
+from pipeline_flow.core.transform_pool import TransformProcessPool, concat_data, is_picklable, split_data
+
+
+@pytest.fixture(autouse=True)
+def shutdown_process_pool() -> Generator[None, None, None]:
+    yield
+    TransformProcessPool.shutdown()
+    TransformProcessPool.configure(None)
+
+
+def test_split_list() -> None:
+    assert split_data([1, 2, 3, 4, 5], chunks=2) == [[1, 2, 3], [4, 5]]
+
+
+def test_split_list_more_chunks_than_rows() -> None:
+    assert split_data([1, 2], chunks=4) == [[1], [2]]
+
+
+def test_split_unsupported_type() -> None:
+    assert split_data("DATA", chunks=2) is None
+
+
+def test_split_empty_data() -> None:
+    assert split_data([], chunks=2) is None
+
+
+def test_split_and_concat_dataframe() -> None:
+    df = pd.DataFrame({"id": range(10), "value": range(10, 20)})
+
+    parts = split_data(df, chunks=3)
+
+    assert [len(part) for part in parts] == [4, 4, 2]
+    pd.testing.assert_frame_equal(concat_data(parts), df)
+
+
+def test_concat_lists() -> None:
+    assert concat_data([[1, 2], [3], [4, 5]]) == [1, 2, 3, 4, 5]
+
+
+def test_is_picklable() -> None:
+    assert is_picklable({"key": [1, 2, 3]}) is True
+    assert is_picklable(threading.Lock()) is False
+
+
+def test_process_pool_is_shared() -> None:
+    TransformProcessPool.configure(2)
+
+    pool = TransformProcessPool.get()
+
+    assert TransformProcessPool.get() is pool
+    assert pool._max_workers == 2
+
+
+def test_process_pool_does_not_fork() -> None:
+    # Forking the multi-threaded orchestrator may deadlock the workers.
+    assert TransformProcessPool.get()._mp_context.get_start_method() in {"forkserver", "spawn"}
+
+
+def test_process_pool_shutdown_creates_new_pool() -> None:
+    pool = TransformProcessPool.get()
+
+    TransformProcessPool.shutdown()
+
+    assert TransformProcessPool.get() is not pool
+
+
+def test_split_and_concat_columnar_data() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"id": range(10)})
+
+    parts = split_data(table, chunks=3)
+
+    assert [len(part) for part in parts] == [4, 4, 2]
+    assert concat_data(parts).equals(table)
+    assert concat_data(table.to_batches(max_chunksize=5)).equals(table)
@@ -1,13 +1,17 @@
 # Standard Imports
 from __future__ import annotations
 
+import sys
 import threading
 
 # Third-party imports
+import pandas as pd
 import pytest
 
 # # Project Imports
-from pipeline_flow.common.utils import SingletonMeta
+from pipeline_flow.common.type_def import DataFormat
+from pipeline_flow.common.utils import SingletonMeta, register_shutdown_hook, run_shutdown_hooks
+from pipeline_flow.common.utils.columnar import convert_data, is_columnar, to_columnar, to_rows
 
 
 @pytest.fixture
@@ -39,3 +43,69 @@ def test_thread_safe_singleton_same_instance(skeleton_class: type) -> None:
 
     # Assert that all instances are the same
     assert all(instance is instances[0] for instance in instances), "Instances are not the same!"
+
+
+@pytest.mark.asyncio
+async def test_run_shutdown_hooks_in_reverse_order() -> None:
+    calls = []
+
+    def sync_hook() -> None:
+        calls.append("sync")
+
+    async def async_hook() -> None:
+        calls.append("async")
+
+    register_shutdown_hook(sync_hook)
+    register_shutdown_hook(async_hook)
+    register_shutdown_hook(async_hook)
+
+    await run_shutdown_hooks()
+    await run_shutdown_hooks()
+
+    assert calls == ["async", "sync"]
+
+
+@pytest.mark.asyncio
+async def test_run_shutdown_hooks_continues_after_failure() -> None:
+    calls = []
+
+    def failing_hook() -> None:
+        raise RuntimeError("Cannot release resource")
+
+    register_shutdown_hook(lambda: calls.append("first"))
+    register_shutdown_hook(failing_hook)
+
+    await run_shutdown_hooks()
+
+    assert calls == ["first"]
+
+
+def test_columnar_conversions() -> None:
+    pa = pytest.importorskip("pyarrow")
+    rows = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    table = pa.Table.from_pylist(rows)
+
+    assert is_columnar(table)
+    assert not is_columnar(rows)
+    assert to_columnar(table) is table
+    assert to_columnar(rows).equals(table)
+    assert to_columnar(pd.DataFrame(rows)).equals(table)
+    assert to_rows(table) == rows
+    assert to_rows(pd.DataFrame(rows)) == rows
+    assert to_rows(rows) is rows
+
+
+def test_convert_data_by_format() -> None:
+    assert convert_data("DATA", DataFormat.NATIVE) == "DATA"
+    assert convert_data([{"id": 1}], DataFormat.ROWS) == [{"id": 1}]
+
+    with pytest.raises(TypeError, match=r"Data of type `str` cannot be converted to rows\."):
+        convert_data("DATA", DataFormat.ROWS)
+
+
+def test_to_columnar_without_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A None entry in `sys.modules` makes the import fail, as if pyarrow were not installed.
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match=r"pip install pipeline-flow\[columnar\]"):
+        to_columnar([{"id": 1}])
@@ -1,14 +1,19 @@
 # Standard Imports
+import stat
+import textwrap
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
 # Third Party Imports
 import pytest
 import yaml
+from pytest_mock import MockerFixture
 
 # Project Imports
 from pipeline_flow.core.parsers.yaml_parser import ExtendedCoreLoader, YamlParser
-from tests.resources.plugins import SimpleSecretPlugin
+from pipeline_flow.core.registry import PluginRegistry
+from tests.resources.plugins import DelayedSecretPlugin, SimpleSecretPlugin
 
 
 @pytest.fixture(scope="session")
@@ -197,3 +202,86 @@ def test_parse_yaml_file_success(yaml_pipeline: str, tmpdir) -> None:
     assert serialized_yaml == expected_dict, (
         f"Deserialized YAML does not match the expected dictionary. Got: {serialized_yaml}"
     )
+
+
+def test_parse_secrets_resolved_concurrently(mocker: MockerFixture) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=DelayedSecretPlugin)
+    secrets = {
+        f"secret{i}": {"plugin": "delayed_secret_plugin", "args": {"secret_name": f"name{i}", "delay": 0.2}}
+        for i in range(10)
+    }
+    references = {f"key{i}": f"${{{{ secrets.secret{i} }}}}" for i in range(10)}
+    document = yaml.dump({"secrets": secrets}) + "---\n" + yaml.dump({"pipelines": {"pipeline1": references}})
+
+    start = time.perf_counter()
+    pipeline = YamlParser(document).pipelines["pipeline1"]
+    elapsed = time.perf_counter() - start
+
+    assert pipeline == {f"key{i}": f"name{i}_value" for i in range(10)}
+    assert elapsed < 1  # Sequentially, the ten secrets would take two seconds.
+
+
+def test_parse_yaml_with_cache(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    mocker.patch.object(PluginRegistry, "get", return_value=SimpleSecretPlugin)
+    monkeypatch.setenv("TABLE_NAME", "orders")
+    document = textwrap.dedent("""
+    secrets:
+      api_key:
+        plugin: simple_secret_plugin
+        args:
+          secret_name: my-secret
+          region: aws-region
+    ---
+    pipelines:
+      pipeline1:
+        table: ${{ env.TABLE_NAME }}
+        token: ${{ secrets.api_key }}
+    """)
+    parse_spy = mocker.spy(YamlParser, "parse_yaml_with_context")
+    expected = {"table": "orders", "token": "super_secret_value"}
+
+    assert YamlParser(document, cache_dir=str(tmp_path)).pipelines["pipeline1"] == expected
+    assert YamlParser(document, cache_dir=str(tmp_path)).pipelines["pipeline1"] == expected
+    assert parse_spy.call_count == 1
+
+    # Secrets are resolved on every load and never written to the cache.
+    (cache_file,) = tmp_path.iterdir()
+    assert b"super_secret_value" not in cache_file.read_bytes()
+
+    # Changing a referenced environment variable invalidates the cached entry.
+    monkeypatch.setenv("TABLE_NAME", "customers")
+
+    assert YamlParser(document, cache_dir=str(tmp_path)).pipelines["pipeline1"]["table"] == "customers"
+    assert parse_spy.call_count == 2
+
+
+def test_parse_yaml_ignores_cache_writable_by_others(mocker: MockerFixture, tmp_path: Path) -> None:
+    document = textwrap.dedent("""
+    pipelines:
+      pipeline1:
+        table: orders
+    """)
+    parse_spy = mocker.spy(YamlParser, "parse_yaml_with_context")
+    YamlParser(document, cache_dir=str(tmp_path))
+
+    # Anyone able to write the cache could point the pipelines at any plugin, so it is parsed again.
+    tmp_path.chmod(0o777)
+    YamlParser(document, cache_dir=str(tmp_path))
+
+    assert parse_spy.call_count == 2
+
+
+def test_parse_yaml_cache_is_private(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("DB_PASSWORD", "password")
+    document = textwrap.dedent("""
+    pipelines:
+      pipeline1:
+        password: ${{ env.DB_PASSWORD }}
+    """)
+    tmp_path.chmod(0o755)
+    YamlParser(document, cache_dir=str(tmp_path))
+
+    # The entry holds the value of the environment variable, so only the current user can read it.
+    (entry,) = tmp_path.glob("*.json")
+    assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+    assert stat.S_IMODE(tmp_path.stat().st_mode) == 0o700